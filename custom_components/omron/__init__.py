@@ -13,12 +13,16 @@ from sensor_state_data import SensorDeviceClass as SSDSensorDeviceClass
 from .ble_session import (
     adopt_handoff_session,
     discard_handoff_session,
+    handoff_session_parked,
     omron_poll_ble_telemetry,
     poll_parked_session,
     run_post_pairing_poll,
 )
 from .omron_ble import OmronBluetoothDeviceData, SensorUpdate
 from .omron_ble.const import DEFAULT_DEVICE_MODEL
+from .omron_ble.deadline_budget import DeadlineBudget
+from .omron_ble.device_capabilities import DeviceCapabilities
+from .omron_ble.eeprom_mirror import EepromMirror
 from homeassistant.components.bluetooth import (
     BluetoothScanningMode,
     BluetoothServiceInfoBleak,
@@ -36,6 +40,7 @@ from .const import (
 )
 from .util import aliases_dict_from_entry
 from .coordinator import OmronBluetoothProcessorCoordinator
+from .storage import async_get_capability_store, async_get_mirror_store
 from .types import OmronConfigEntry
 
 PLATFORMS: list[Platform] = [
@@ -57,9 +62,15 @@ SETTLE_DELAY_SECONDS = 0.5
 # and from then on every scheduled poll, Refresh Data press and advertisement
 # trigger bails out on the held lock — the integration goes silent with no error
 # logged until Home Assistant restarts. The deadline gives the lock back.
+# Every GATT primitive now has its own, much shorter deadline (see
+# omron_ble/gatt_io.py); this one is the backstop for anything outside them.
 # Budget: a worst-case connect (~90 s over 4 attempts) plus the memory-session
 # retries. Past that the link is stuck, not slow.
 POLL_TIMEOUT_SECONDS = 180
+# The poll's own phase budget ends this much earlier, so a slow poll winds
+# down through its retry loops and keeps what it read before the hard
+# deadline above cancels it.
+POLL_BUDGET_MARGIN_SECONDS = 15
 
 # When a poll fails mid-flight, keep measurement history but drop stale RSSI/battery
 # unless this poll refreshed those keys (avoids showing outdated diagnostics).
@@ -295,6 +306,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: OmronConfigEntry) -> boo
         device_model=device_model,
         user_aliases=slot_aliases,
     )
+    # Full EEPROM scans only read slots written since the stored mirror.
+    mirror_store = await async_get_mirror_store(hass)
+    data.eeprom_mirror = mirror_store.get(address) or EepromMirror(model=device_model)
+    # Optional GATT features already probed in earlier sessions are not
+    # probed again until the device's GATT layout changes.
+    capability_store = await async_get_capability_store(hass)
+    data.capabilities = capability_store.get(address) or DeviceCapabilities(
+        model=device_model
+    )
     hass.data[DOMAIN][entry.entry_id] = {}
     hass.data[DOMAIN][entry.entry_id]['address'] = address
     hass.data[DOMAIN][entry.entry_id]['data'] = data
@@ -365,6 +385,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: OmronConfigEntry) -> boo
             coordinator = entry.runtime_data
             session_lock: asyncio.Lock = entry_data["session_lock"]
 
+            # Idle cuffs keep advertising the same record counters. Until they
+            # move (or a status flag asks for a session) a connection would
+            # only re-read what we already have, at the cuff's battery cost.
+            # Refresh Data and a parked pairing session always connect.
+            if (
+                not entry_data.get("force_poll")
+                and poll_coordinator.data is not None
+                and not handoff_session_parked(hass, address)
+                and not coordinator.device_data.poll_needed()
+            ):
+                _LOGGER.debug(
+                    "Skipping scheduled poll for %s: advertised record counters unchanged",
+                    address,
+                )
+                return poll_coordinator.data
+
             # Try-acquire only — if another BLE session is in flight (e.g. an
             # advertisement-triggered auto-pairing started moments ago), skip
             # this scheduled poll and serve cached data. The next interval (or
@@ -378,6 +414,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: OmronConfigEntry) -> boo
                 return entry.runtime_data.device_data._finish_update()
 
             async with session_lock:
+                entry_data.pop("force_poll", None)
                 # Adopt a parked pairing/setup session (memory readout still
                 # open) so pairing, time sync, and the first EEPROM read share
                 # one connection. Taken here rather than at the top of the
@@ -388,7 +425,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: OmronConfigEntry) -> boo
                     handed_off = True
                     async with asyncio.timeout(POLL_TIMEOUT_SECONDS):
                         result = await coordinator.device_data.async_poll(
-                            device, preconnected_session=preconnected_session
+                            device,
+                            preconnected_session=preconnected_session,
+                            budget=DeadlineBudget.start(
+                                POLL_TIMEOUT_SECONDS - POLL_BUDGET_MARGIN_SECONDS
+                            ),
                         )
                 prev_data = poll_coordinator.data
                 if prev_data is not None:
@@ -415,6 +456,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: OmronConfigEntry) -> boo
                 return poll_coordinator.data
             return entry.runtime_data.device_data._finish_update()
         finally:
+            # Even a failed poll may have synced some users' record regions.
+            mirror_store.async_schedule_save(
+                address, entry.runtime_data.device_data.eeprom_mirror
+            )
+            capability_store.async_schedule_save(
+                address, entry.runtime_data.device_data.capabilities
+            )
             if not handed_off and preconnected_session is not None:
                 try:
                     # release_for_handoff() cleared the disconnect
@@ -463,6 +511,13 @@ async def update_listener(hass: HomeAssistant, entry: OmronConfigEntry) -> None:
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: OmronConfigEntry) -> None:
+    """Drop the stored EEPROM mirror and GATT capabilities of a removed device."""
+    if entry.unique_id:
+        (await async_get_mirror_store(hass)).async_remove(entry.unique_id)
+        (await async_get_capability_store(hass)).async_remove(entry.unique_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: OmronConfigEntry) -> bool:
     """Unload a config entry."""
     # A pairing session parked for a poll that never came would otherwise keep
@@ -79,6 +79,11 @@ async def poll_parked_session(
     return True
 
 
+def handoff_session_parked(hass: HomeAssistant, address: str) -> bool:
+    """Whether a pairing session is parked for the next poll to adopt."""
+    return address in hass.data.get(DOMAIN, {}).get("_setup_sessions", {})
+
+
 def adopt_handoff_session(
     hass: HomeAssistant, address: str
 ) -> OmronDeviceSession | None:
@@ -81,6 +81,8 @@ class OmronRefreshDataButtonEntity(ButtonEntity):
     async def async_press(self) -> None:
         """Handle button press to poll device and refresh sensor data."""
         poll_coordinator = self._entry.runtime_data.poll_coordinator
+        # Connect even if the advertised record counters look unchanged.
+        self.hass.data[DOMAIN][self._entry_id]["force_poll"] = True
         try:
             await poll_coordinator.async_request_refresh()
         except Exception as err:
@@ -0,0 +1,31 @@
+"""Diagnostics support for Omron."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_BINDKEY, DOMAIN
+from .omron_ble.link_tuning import link_tuning_for
+from .types import OmronConfigEntry
+
+TO_REDACT = {CONF_BINDKEY}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: OmronConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    address = entry_data["address"]
+    return {
+        "entry_data": async_redact_data(dict(entry.data), TO_REDACT),
+        "device_model": entry_data["data"].device_model,
+        # Memory-protocol link state learned at runtime (RTT estimate, block
+        # size, pipelining); reset when Home Assistant restarts.
+        "link_tuning": link_tuning_for(address).as_diagnostics(),
+        # GATT layout and optional features learned from the device; persisted.
+        "capabilities": entry_data["data"].capabilities.as_dict(),
+    }
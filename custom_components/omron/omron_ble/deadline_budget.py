@@ -0,0 +1,54 @@
+"""Time left for one poll, handed down to its phases.
+
+``async_poll`` starts a budget a little inside the coordinator's hard
+deadline and gives each phase (connect, memory-session open, readout) a
+share of what is left. Retry loops stop once their share is spent and
+optional phases (BLS RACP probe, device information reads, background
+scan) are skipped when too little remains, so a poll on a bad link ends
+with the records it managed to read instead of being cancelled with none.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+
+class DeadlineExhausted(ConnectionError):
+    """A retry loop gave up because its share of the poll budget is spent."""
+
+
+@dataclass(frozen=True)
+class DeadlineBudget:
+    """An absolute ``time.monotonic()`` deadline; shares never outlast their parent."""
+
+    deadline: float
+
+    @classmethod
+    def start(cls, seconds: float) -> DeadlineBudget:
+        """Budget ending ``seconds`` from now."""
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        """Seconds left (0.0 once spent)."""
+        return max(0.0, self.deadline - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def share(self, fraction: float) -> DeadlineBudget:
+        """Child budget for one phase: ``fraction`` of the time remaining now."""
+        return DeadlineBudget(time.monotonic() + fraction * self.remaining())
+
+    def allows(self, seconds: float) -> bool:
+        """True if at least ``seconds`` are left."""
+        return self.remaining() >= seconds
+
+    def cap(self, timeout: float) -> float:
+        """``timeout`` shortened so it does not run past the deadline."""
+        return min(timeout, self.remaining())
+
+    def check(self, what: str) -> None:
+        """Raise ``DeadlineExhausted`` if the budget is spent."""
+        if self.expired:
+            raise DeadlineExhausted(f"Poll budget spent before {what}")
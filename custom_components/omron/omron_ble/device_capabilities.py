@@ -0,0 +1,103 @@
+"""What one device's GATT table offers, remembered across sessions and restarts.
+
+Every poll used to rediscover the optional features on the fly: a refused
+0x2A35 read or a missing BLS RACP pair was kept only in memory, so the
+probe (half a second of settling plus a 3 s wait) ran again after each
+restart. The profile here records the service set, the handles of the
+characteristics the integration uses, which reads the device refused and
+which record source last produced the latest record. It is plain data so
+the integration can persist it next to the EEPROM mirror.
+
+The profile stays valid until the GATT layout it was learned under changes:
+a different service set or a moved handle (what a Service Changed
+indication announces) or a characteristic that no longer resolves.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class DeviceCapabilities:
+    """GATT layout and optional-feature flags learned from one device."""
+
+    model: str
+    # Service UUIDs of the layout the flags below were learned under.
+    services: list[str] = field(default_factory=list)
+    # Characteristic UUID -> handle, for the characteristics the session uses.
+    handles: dict[str, int] = field(default_factory=dict)
+    # Characteristic UUIDs the device refused to read ("Read not permitted").
+    unreadable: set[str] = field(default_factory=set)
+    # BLS RACP latest-record path (0x2A35 + 0x2A52): None until tried.
+    bls_racp: bool | None = None
+    # Driver path that last produced the latest record (diagnostics).
+    record_source: str | None = None
+
+    @property
+    def known(self) -> bool:
+        """True once a GATT layout has been recorded."""
+        return bool(self.services)
+
+    def invalidate(self, reason: str) -> None:
+        """Forget the layout and every flag learned under it."""
+        if self.known:
+            _LOGGER.debug("Dropping cached GATT capabilities for %s: %s", self.model, reason)
+        self.services = []
+        self.handles = {}
+        self.unreadable = set()
+        self.bls_racp = None
+        self.record_source = None
+
+    def observe_layout(self, services: list[str], handles: dict[str, int]) -> bool:
+        """Adopt the layout seen on this connection; invalidate if it changed.
+
+        Returns True when the cached flags are still valid for ``services``.
+        """
+        services = sorted(services)
+        if self.known:
+            if services != self.services:
+                self.invalidate("service set changed")
+            elif any(uuid not in handles for uuid in self.handles):
+                self.invalidate("characteristic lookup failed")
+            elif any(handles[uuid] != handle for uuid, handle in self.handles.items()):
+                self.invalidate("characteristic handles moved")
+        kept = self.known
+        self.services = services
+        self.handles = dict(handles)
+        return kept
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable representation."""
+        return {
+            "model": self.model,
+            "services": list(self.services),
+            "handles": dict(self.handles),
+            "unreadable": sorted(self.unreadable),
+            "bls_racp": self.bls_racp,
+            "record_source": self.record_source,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Any) -> DeviceCapabilities | None:
+        """Rebuild a profile from ``as_dict`` output; None if it is unusable."""
+        try:
+            bls_racp = data.get("bls_racp")
+            record_source = data.get("record_source")
+            return cls(
+                model=str(data["model"]),
+                services=[str(uuid) for uuid in data.get("services", [])],
+                handles={
+                    str(uuid): int(handle)
+                    for uuid, handle in data.get("handles", {}).items()
+                },
+                unreadable={str(uuid) for uuid in data.get("unreadable", [])},
+                bls_racp=None if bls_racp is None else bool(bls_racp),
+                record_source=None if record_source is None else str(record_source),
+            )
+        except (KeyError, TypeError, ValueError, AttributeError) as exc:
+            _LOGGER.debug("Discarding unreadable device capabilities: %s", exc)
+            return None
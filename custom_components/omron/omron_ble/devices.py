@@ -143,6 +143,14 @@ class DeviceConfig:
     per_user_records_count: list[int] = field(default_factory=list)
     record_byte_size: int = 0x0E
     transmission_block_size: int = 0x2C
+    # Number of 0x0801 block reads kept in flight by read_memory_range. A
+    # device that fails a pipelined read is demoted to 1 at runtime (see
+    # link_tuning), so this only needs lowering for a profile known to choke.
+    memory_read_window: int = 4
+    # Let read_memory_range tune the block size per device, starting from
+    # transmission_block_size: probe larger blocks (multi-channel profiles
+    # only) and shrink after timeouts or truncated frames.
+    adaptive_block_size: bool = True
 
     # Settings addresses
     settings_read_address: int | None = None
@@ -0,0 +1,99 @@
+"""Local copy of a device's EEPROM record regions, synced by write cursor.
+
+Each user's record ring (``user_start_addresses`` / ``per_user_records_count``
+/ ``record_byte_size``) is mirrored together with the raw write cursor it was
+last synced at. On later polls only the slots written since that cursor are
+read. The mirror is plain data so the integration can persist it in Home
+Assistant storage between restarts.
+
+A region not mirrored yet can also be filled a few slots per poll
+(``RegionScan``), so no single poll has to read it whole.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class RegionScan:
+    """A user's record region being filled across polls."""
+
+    # Raw write cursor the slots in ``slots_read`` are current for.
+    cursor: int
+    region: bytearray
+    # Logical ring slots (0-based) already read into ``region``.
+    slots_read: set[int] = field(default_factory=set)
+
+
+@dataclass
+class EepromMirror:
+    """Mirrored record regions of one device."""
+
+    model: str
+    # Raw write cursor per user (None: user never synced).
+    write_cursors: list[int | None] = field(default_factory=list)
+    # User index (0-based) -> full record region bytes.
+    regions: dict[int, bytearray] = field(default_factory=dict)
+    # User index (0-based) -> region still being filled by the amortized scan.
+    scans: dict[int, RegionScan] = field(default_factory=dict)
+
+    def cursor(self, user_idx: int) -> int | None:
+        """Return the raw write cursor ``user_idx`` was last synced at."""
+        if user_idx < len(self.write_cursors):
+            return self.write_cursors[user_idx]
+        return None
+
+    def store_user(self, user_idx: int, cursor: int, region: bytes | bytearray) -> None:
+        """Record that ``user_idx``'s region is in sync as of ``cursor``."""
+        while len(self.write_cursors) <= user_idx:
+            self.write_cursors.append(None)
+        self.write_cursors[user_idx] = cursor
+        self.regions[user_idx] = bytearray(region)
+        self.scans.pop(user_idx, None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable representation."""
+        return {
+            "model": self.model,
+            "write_cursors": list(self.write_cursors),
+            "regions": {str(idx): bytes(data).hex() for idx, data in self.regions.items()},
+            "scans": {
+                str(idx): {
+                    "cursor": scan.cursor,
+                    "region": bytes(scan.region).hex(),
+                    "slots_read": sorted(scan.slots_read),
+                }
+                for idx, scan in self.scans.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Any) -> EepromMirror | None:
+        """Rebuild a mirror from ``as_dict`` output; None if it is unusable."""
+        try:
+            return cls(
+                model=str(data["model"]),
+                write_cursors=[
+                    None if cursor is None else int(cursor)
+                    for cursor in data.get("write_cursors", [])
+                ],
+                regions={
+                    int(idx): bytearray.fromhex(region)
+                    for idx, region in data.get("regions", {}).items()
+                },
+                scans={
+                    int(idx): RegionScan(
+                        cursor=int(scan["cursor"]),
+                        region=bytearray.fromhex(scan["region"]),
+                        slots_read={int(slot) for slot in scan["slots_read"]},
+                    )
+                    for idx, scan in data.get("scans", {}).items()
+                },
+            )
+        except (KeyError, TypeError, ValueError, AttributeError) as exc:
+            _LOGGER.debug("Discarding unreadable EEPROM mirror: %s", exc)
+            return None
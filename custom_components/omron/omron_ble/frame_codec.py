@@ -0,0 +1,75 @@
+"""Omron memory-protocol frames: packing, constant frames and the XOR check byte.
+
+Commands and replies share one layout::
+
+    [frame length, type (2), address (2, big endian), data length, data..., 0x00, xor]
+
+The last byte makes the XOR of the whole frame zero. Block reads and writes
+are built on every EEPROM access, so they are packed with precompiled
+``struct`` formats; the session open/close frames never change and are kept
+as constants.
+"""
+from __future__ import annotations
+
+import struct
+
+# Session open (ubpm cmd_init; byte[5]=0x10 for all devices) and close.
+OPEN_SESSION_FRAME = bytes.fromhex("0800000000100018")
+CLOSE_SESSION_FRAME = bytes.fromhex("080f000000000007")
+
+# Read: 0x08 0x01 0x00, address, block size, 0x00, xor.
+_READ_FRAME = struct.Struct(">3sHBxB")
+_READ_PREFIX = b"\x08\x01\x00"
+_READ_PREFIX_XOR = 0x08 ^ 0x01
+# Write header: frame length, type 0x01c0, address, data length.
+_WRITE_HEADER = struct.Struct(">BHHB")
+_WRITE_TYPE = 0x01C0
+# Write trailer: 0x00 then the check byte, one constant per check value.
+_WRITE_TRAILERS = tuple(bytes((0, check)) for check in range(256))
+# Reply header: packet type, address, data length (after the length byte).
+FRAME_HEADER = struct.Struct(">x2sHB")
+
+
+def _fold_steps(length: int) -> tuple[tuple[int, int], ...]:
+    """(shift, mask) pairs folding a ``length``-byte integer down to one byte."""
+    width = 1 << max(length - 1, 0).bit_length()
+    steps: list[tuple[int, int]] = []
+    while width > 1:
+        width >>= 1
+        steps.append((width * 8, (1 << (width * 8)) - 1))
+    return tuple(steps)
+
+
+# A frame's length is one byte, so every frame length has its steps ready.
+_FOLD_STEPS = tuple(_fold_steps(length) for length in range(256))
+
+
+def xor_checksum(data: bytes | bytearray | memoryview) -> int:
+    """XOR of every byte of ``data`` (0 for a frame with a valid check byte).
+
+    The bytes are folded as one integer, halving its width each step, so a
+    64-byte frame costs six big-int operations instead of a Python loop over
+    every byte.
+    """
+    length = len(data)
+    value = int.from_bytes(data, "little")
+    steps = _FOLD_STEPS[length] if length < 256 else _fold_steps(length)
+    for shift, mask in steps:
+        value = (value ^ (value >> shift)) & mask
+    return value
+
+
+def encode_read(address: int, block_size: int) -> bytes:
+    """Build the 0x0801 EEPROM block-read command."""
+    check = _READ_PREFIX_XOR ^ (address >> 8) ^ (address & 0xFF) ^ block_size
+    return _READ_FRAME.pack(_READ_PREFIX, address, block_size, check)
+
+
+def encode_write(address: int, data: bytes | bytearray | memoryview) -> bytes:
+    """Build the 0x01c0 EEPROM block-write command for ``data``.
+
+    Header and data are checked with one fold; the trailer (the 0x00 byte
+    does not change the XOR) comes from a table instead of being built.
+    """
+    frame = _WRITE_HEADER.pack(len(data) + 8, _WRITE_TYPE, address, len(data)) + data
+    return frame + _WRITE_TRAILERS[xor_checksum(frame)]
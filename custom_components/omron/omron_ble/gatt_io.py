@@ -0,0 +1,88 @@
+"""GATT reads, writes and notify calls with a deadline per operation.
+
+Bleak's BlueZ backend puts no timeout on its read/write/notify D-Bus calls,
+so one wedged call used to hold the poll (and ``session_lock``) until the
+whole-poll deadline fired minutes later. Every primitive here is bounded on
+its own instead. The deadline is a number of round trips of the device's
+measured memory-protocol RTT, clamped between a per-operation floor and
+ceiling; until the first RTT sample it is the ceiling.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from bleak import BleakClient
+
+from .link_tuning import RttEstimator, link_tuning_for
+
+# operation -> (floor s, round trips, ceiling s)
+GATT_OPERATION_LIMITS: dict[str, tuple[float, float, float]] = {
+    "read": (3.0, 4, 10.0),
+    "write": (3.0, 4, 10.0),
+    # Enabling notifications writes the CCCD and sets up the backend's
+    # notify pipe (BlueZ AcquireNotify / StartNotify).
+    "start_notify": (5.0, 6, 20.0),
+    "stop_notify": (3.0, 4, 10.0),
+    # Discovery is one request per handle range; a large table over a proxy
+    # runs to dozens of round trips.
+    "refresh": (20.0, 40, 45.0),
+}
+
+
+class GattOperationTimeout(ConnectionError):
+    """A GATT operation did not complete within its deadline; the link is unusable."""
+
+    def __init__(self, operation: str, timeout: float) -> None:
+        super().__init__(f"GATT {operation} did not complete within {timeout:.1f}s")
+        self.operation = operation
+        self.timeout = timeout
+
+
+def gatt_timeout(operation: str, rtt: RttEstimator) -> float:
+    """Deadline in seconds for one ``operation`` on a link with RTT estimate ``rtt``."""
+    floor, round_trips, ceiling = GATT_OPERATION_LIMITS[operation]
+    if rtt.srtt is None:
+        return ceiling
+    return min(ceiling, max(floor, round_trips * rtt.timeout(ceiling, 0.0, ceiling)))
+
+
+async def _bounded(client: BleakClient, operation: str, awaitable: Awaitable[Any]) -> Any:
+    timeout = gatt_timeout(operation, link_tuning_for(getattr(client, "address", "")).rtt)
+    try:
+        async with asyncio.timeout(timeout):
+            return await awaitable
+    except TimeoutError:
+        raise GattOperationTimeout(operation, timeout) from None
+
+
+async def gatt_read(client: BleakClient, char: Any) -> bytearray:
+    """``client.read_gatt_char(char)`` bounded by the read deadline."""
+    return await _bounded(client, "read", client.read_gatt_char(char))
+
+
+async def gatt_write(
+    client: BleakClient, char: Any, data: bytes | bytearray, response: bool | None = None
+) -> None:
+    """``client.write_gatt_char`` bounded by the write deadline."""
+    if response is None:
+        await _bounded(client, "write", client.write_gatt_char(char, data))
+    else:
+        await _bounded(client, "write", client.write_gatt_char(char, data, response=response))
+
+
+async def gatt_start_notify(
+    client: BleakClient, char: Any, callback: Callable[[Any, bytearray], None]
+) -> None:
+    """``client.start_notify`` bounded by the start_notify deadline."""
+    await _bounded(client, "start_notify", client.start_notify(char, callback))
+
+
+async def gatt_stop_notify(client: BleakClient, char: Any) -> None:
+    """``client.stop_notify`` bounded by the stop_notify deadline."""
+    await _bounded(client, "stop_notify", client.stop_notify(char))
+
+
+async def gatt_refresh(client: BleakClient, call: Callable[[], Awaitable[Any]]) -> Any:
+    """Run a service discovery / cache call of ``client`` bounded by the refresh deadline."""
+    return await _bounded(client, "refresh", call())
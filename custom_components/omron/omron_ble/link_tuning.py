@@ -0,0 +1,120 @@
+"""Per-device memory-protocol tuning learned at runtime.
+
+A new ``OmronDeviceSession`` is opened for every poll, so anything the
+session learns about a device's link would otherwise be thrown away on
+disconnect. The values here are keyed by BLE address and outlive the
+session; they are reset only when Home Assistant restarts.
+"""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+# Adaptive 0x0801 block size: grow one step after this many clean range
+# reads, halve on a timeout or truncated frame, never below the floor.
+BLOCK_SIZE_STEP = 0x08
+BLOCK_SIZE_FLOOR = 0x10
+CLEAN_READS_BEFORE_GROWING = 3
+
+
+@dataclass
+class RttEstimator:
+    """Smoothed reply round-trip time, TCP style (RFC 6298 SRTT/RTTVAR)."""
+
+    srtt: float | None = None
+    rttvar: float | None = None
+    samples: int = 0
+
+    def observe(self, rtt: float) -> None:
+        """Fold one round-trip sample (seconds) into the estimate."""
+        if self.srtt is None or self.rttvar is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+        self.samples += 1
+
+    def timeout(self, initial: float, minimum: float, maximum: float, attempt: int = 0) -> float:
+        """Retransmit timeout for ``attempt`` (0-based), doubled per retry and clamped.
+
+        ``initial`` is used until the first sample arrives.
+        """
+        if self.srtt is None or self.rttvar is None:
+            base = initial
+        else:
+            base = self.srtt + 4 * self.rttvar
+        return min(maximum, max(minimum, base) * (2 ** attempt))
+
+
+@dataclass
+class LinkTuning:
+    """What has been learned about one device's memory-protocol link."""
+
+    # Set once a pipelined EEPROM read has failed on this device. From then
+    # on every range read runs at depth 1, the way it did before pipelining.
+    pipeline_demoted: bool = False
+    # Learned 0x0801 block size (None until the first adaptive range read).
+    block_size: int | None = None
+    # Largest size still worth probing; lowered below every size that faulted,
+    # but never below the profile's own transmission_block_size.
+    block_size_ceiling: int | None = None
+    clean_reads: int = 0
+    # Memory-protocol reply round trips; drives the retransmit timeout.
+    rtt: RttEstimator = field(default_factory=RttEstimator)
+    # Frames reassembled although a fragment overtook channel 0, per
+    # connection source (adapter / proxy).
+    rx_reordered_frames: dict[str, int] = field(default_factory=dict)
+
+    def record_block_read(
+        self,
+        block_size: int,
+        faulted: bool,
+        max_size: int,
+        configured_size: int = BLOCK_SIZE_FLOOR,
+    ) -> None:
+        """Update the learned block size after one range read at ``block_size``.
+
+        A fault halves the size and lowers the ceiling, but not below
+        ``configured_size``: a stray timeout at the profile's own size must
+        not cost the device that size for the life of the process.
+        """
+        ceiling = max_size
+        if self.block_size_ceiling is not None:
+            ceiling = min(ceiling, self.block_size_ceiling)
+        if faulted:
+            self.clean_reads = 0
+            self.block_size_ceiling = max(
+                BLOCK_SIZE_FLOOR, configured_size, block_size - BLOCK_SIZE_STEP
+            )
+            self.block_size = max(BLOCK_SIZE_FLOOR, block_size // 2)
+            return
+        self.block_size = block_size
+        self.clean_reads += 1
+        if self.clean_reads >= CLEAN_READS_BEFORE_GROWING and block_size < ceiling:
+            self.block_size = min(ceiling, block_size + BLOCK_SIZE_STEP)
+            self.clean_reads = 0
+
+    def as_diagnostics(self) -> dict[str, Any]:
+        """Return a JSON-serialisable snapshot for Home Assistant diagnostics."""
+        return asdict(self)
+
+
+_LINK_TUNING: dict[str, LinkTuning] = {}
+
+
+def link_tuning_for(address: str) -> LinkTuning:
+    """Return the (mutable) tuning record for ``address``, creating it on first use."""
+    key = str(address).upper()
+    tuning = _LINK_TUNING.get(key)
+    if tuning is None:
+        tuning = _LINK_TUNING[key] = LinkTuning()
+    return tuning
+
+
+def reset_link_tuning(address: str | None = None) -> None:
+    """Forget learned tuning for ``address`` (or for every device)."""
+    if address is None:
+        _LINK_TUNING.clear()
+    else:
+        _LINK_TUNING.pop(str(address).upper(), None)
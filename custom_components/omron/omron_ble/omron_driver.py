@@ -1,27 +1,82 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import datetime as dt
+import itertools
 import logging
 import secrets
+import time
 import traceback
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, NamedTuple, Sequence
 
 from bleak import BleakClient
 from bleak.backends.device import BLEDevice
 from bleak.exc import BleakError
 from bleak_retry_connector import establish_connection
 
-from .const import MODEL_NUMBER_UUID
+from .const import (
+    BP_MEASUREMENT_CHAR_UUID,
+    BP_RACP_CHAR_UUID,
+    CTS_CHARACTERISTIC_UUID,
+    LOCAL_TIME_INFO_UUID,
+    MODEL_NUMBER_UUID,
+)
+from .deadline_budget import DeadlineBudget, DeadlineExhausted
 from .devices import DeviceConfig, HostPairingMode, UnlockMode
+from .eeprom_mirror import EepromMirror, RegionScan
+from .frame_codec import (
+    CLOSE_SESSION_FRAME,
+    FRAME_HEADER,
+    OPEN_SESSION_FRAME,
+    encode_read,
+    encode_write,
+    xor_checksum,
+)
+from .gatt_io import (
+    GattOperationTimeout,
+    gatt_read,
+    gatt_refresh,
+    gatt_start_notify,
+    gatt_stop_notify,
+    gatt_write,
+)
+from .link_tuning import link_tuning_for
+from .read_plan import coalesce_ranges
+from .transfer_checkpoint import TransferCheckpoint
 
 _LOGGER = logging.getLogger(__name__)
 
+# Notification frames: up to 4 rx channels of 16 bytes each.
+_RX_CHANNELS = 4
+_RX_CHANNEL_BYTES = 16
+_RX_FRAME_CAPACITY = _RX_CHANNELS * _RX_CHANNEL_BYTES
+_RX_NO_FRAGMENTS = (0,) * _RX_CHANNELS
+_RX_NO_EARLY = (None,) * _RX_CHANNELS
+_RX_NOT_ADOPTED = (False,) * _RX_CHANNELS
+# A fragment that arrives before its frame's channel 0 (some proxies reorder
+# notifications) is kept for this long waiting for it.
+_RX_REORDER_WINDOW_SEC = 0.25
+
+# Serial handed out per BLE link (see OmronDeviceSession.link_epoch).
+_LINK_EPOCHS = itertools.count(1)
+# Index probes remembered when learning how deep the backtrack window must be.
+_BACKTRACK_DEPTH_HISTORY = 8
+# A full record scan is the slowest fallback for the latest record; below
+# this much poll budget it would be cut off half way, so it is not started.
+_FULL_SCAN_MIN_BUDGET_SEC: float = 20.0
+
 # BLE memory-protocol pacing (extra margin for weak RF / busy stacks).
+# The reply timeout is adaptive (SRTT + 4*RTTVAR per device, doubled per
+# retry); _MEMORY_PROTOCOL_REPLY_TIMEOUT_SEC is both its starting value and
+# its ceiling, _MEMORY_PROTOCOL_RTO_MIN_SEC its floor.
 _MEMORY_PROTOCOL_REPLY_TIMEOUT_SEC: float = 5.0
+_MEMORY_PROTOCOL_RTO_MIN_SEC: float = 0.3
 _MEMORY_PROTOCOL_TX_MAX_RETRIES: int = 4
 _MEMORY_PROTOCOL_RETRY_BACKOFF_SEC: float = 0.25
+# Largest 0x8100 payload four 16-byte RX channels can carry (64 - 8 byte frame overhead).
+_MULTI_CHANNEL_MAX_BLOCK_SIZE: int = 0x38
 _NOTIFY_SUBSCRIBE_SETTLE_SEC: float = 0.75
 _NOTIFY_SUBSCRIBE_MAX_RETRIES: int = 3
 
@@ -66,7 +121,9 @@ async def _bleak_refresh_services(client: BleakClient) -> None:
     if not callable(gs):
         return
     try:
-        await gs()
+        await gatt_refresh(client, gs)
+    except GattOperationTimeout:
+        raise
     except Exception as exc:
         _LOGGER.debug("get_services refresh: %s", exc)
 
@@ -80,8 +137,10 @@ async def _bleak_clear_cache(client: BleakClient) -> bool:
     if not callable(cc):
         return False
     try:
-        await cc()
+        await gatt_refresh(client, cc)
         return True
+    except GattOperationTimeout:
+        raise
     except Exception as exc:
         _LOGGER.debug("clear_cache failed (ignored): %s", exc)
         return False
@@ -99,7 +158,11 @@ def _connection_source(ble_device: BLEDevice) -> str:
 
 
 async def _connect_once(
-    ble_device: BLEDevice, name: str, *, pair: bool
+    ble_device: BLEDevice,
+    name: str,
+    *,
+    pair: bool,
+    disconnected_callback: Callable[[BleakClient], None] | None = None,
 ) -> BleakClient:
     """One connect attempt, optionally bonding before service discovery.
 
@@ -116,11 +179,25 @@ async def _connect_once(
     unrelated local devices while buying nothing.
     """
     if not pair:
-        return await establish_connection(BleakClient, ble_device, name)
+        return await establish_connection(
+            BleakClient, ble_device, name, disconnected_callback=disconnected_callback
+        )
     if _bluez_device_path(ble_device) is None:
-        return await establish_connection(BleakClient, ble_device, name, pair=True)
+        return await establish_connection(
+            BleakClient,
+            ble_device,
+            name,
+            disconnected_callback=disconnected_callback,
+            pair=True,
+        )
     async with _bluez_pairing_agent():
-        return await establish_connection(BleakClient, ble_device, name, pair=True)
+        return await establish_connection(
+            BleakClient,
+            ble_device,
+            name,
+            disconnected_callback=disconnected_callback,
+            pair=True,
+        )
 
 
 async def establish_connection_with_bond_settle(
@@ -129,17 +206,23 @@ async def establish_connection_with_bond_settle(
     *,
     pair_on_connect: bool = False,
     model: str = "",
+    disconnected_callback: Callable[[BleakClient], None] | None = None,
+    budget: DeadlineBudget | None = None,
 ) -> BleakClient:
     """Connect, let bonding/encryption settle, then refresh the GATT cache.
 
-    Retries if the device drops during the settle (common on multi-proxy setups).
+    Retries if the device drops during the settle (common on multi-proxy setups)
+    until ``budget`` is spent.
     ``pair_on_connect`` bonds before service discovery — see ``_connect_once``.
+    ``disconnected_callback`` is registered on every client created here.
     """
     last_source = "unknown"
     # Cleared if the backend reports it cannot pair at connect time, so the
     # remaining attempts fall back instead of failing repeatedly.
     pair_this_attempt = pair_on_connect
     for attempt in range(1, _CONNECT_SETTLE_ATTEMPTS + 1):
+        if attempt > 1 and budget is not None:
+            budget.check(f"connect attempt {attempt}")
         source = _connection_source(ble_device)
         last_source = source
         _LOGGER.debug(
@@ -149,7 +232,12 @@ async def establish_connection_with_bond_settle(
             pair_this_attempt,
         )
         try:
-            client = await _connect_once(ble_device, name, pair=pair_this_attempt)
+            client = await _connect_once(
+                ble_device,
+                name,
+                pair=pair_this_attempt,
+                disconnected_callback=disconnected_callback,
+            )
         except NotImplementedError as exc:
             # ESPHome proxy firmware older than the PAIRING feature flag.
             _LOGGER.warning(
@@ -159,7 +247,12 @@ async def establish_connection_with_bond_settle(
                 name, source, exc,
             )
             pair_this_attempt = False
-            client = await _connect_once(ble_device, name, pair=False)
+            client = await _connect_once(
+                ble_device,
+                name,
+                pair=False,
+                disconnected_callback=disconnected_callback,
+            )
         except BleakError as exc:
             if pair_this_attempt:
                 # The device refused to bond (e.g. error 102 when the cuff is
@@ -177,7 +270,12 @@ async def establish_connection_with_bond_settle(
                 )
                 pair_this_attempt = False
                 try:
-                    client = await _connect_once(ble_device, name, pair=False)
+                    client = await _connect_once(
+                        ble_device,
+                        name,
+                        pair=False,
+                        disconnected_callback=disconnected_callback,
+                    )
                 except Exception:
                     raise exc
             else:
@@ -228,7 +326,7 @@ async def establish_connection_with_bond_settle(
     )
 
 
-def _hex(data: bytes | bytearray) -> str:
+def _hex(data: bytes | bytearray | memoryview) -> str:
     """Convert byte array to hex string."""
     return bytes(data).hex()
 
@@ -562,6 +660,52 @@ def _log_pairing_failure_detail(prefix: str, exc: BaseException) -> None:
     _LOGGER.debug("%s (full traceback)\n%s", prefix, "".join(tb_lines))
 
 
+def _slot_runs(slots: Iterable[int]) -> list[tuple[int, int]]:
+    """Group slot indices into ``(first, length)`` runs of consecutive slots.
+
+    Runs keep the order of ``slots``; a descending stretch (newest first)
+    is a run too, reported from its lowest slot.
+    """
+    runs: list[tuple[int, int]] = []
+    last: int | None = None
+    step = 0
+    for slot in slots:
+        if last is not None and slot - last in (1, -1) and step in (0, slot - last):
+            step = slot - last
+            first, length = runs[-1]
+            runs[-1] = (min(first, slot), length + 1)
+        else:
+            runs.append((slot, 1))
+            step = 0
+        last = slot
+    return runs
+
+
+class _MemoryReply(NamedTuple):
+    """One decoded memory-protocol reply frame."""
+
+    packet_type: bytes
+    address: int
+    # Block data for 0x8100, otherwise the one-byte response/error code.
+    payload: bytes
+    # time.monotonic() when the frame was dispatched (RTT sampling).
+    received_at: float = 0.0
+
+
+# (reply packet type, echoed EEPROM address or None for control replies)
+_ReplyKey = tuple[bytes, "int | None"]
+
+
+class _BadRxFrame(ValueError):
+    """A received frame failed its checksum, decryption or length checks."""
+
+    def __init__(self, level: int, message: str, *, fault: bool = False) -> None:
+        super().__init__(message)
+        self.level = level
+        # Counts as a link fault (drives the adaptive block size).
+        self.fault = fault
+
+
 class OmronDeviceSession:
     """A connected BLE session to one Omron device.
 
@@ -581,15 +725,48 @@ class OmronDeviceSession:
     ) -> None:
         self._client = client
         self._owns_connection = owns_connection
+        self._link_epoch = next(_LINK_EPOCHS)
+        # Share of the poll budget the current phase may spend; retry loops
+        # give up once it is spent (None: unbounded, e.g. setup flows).
+        self.budget: DeadlineBudget | None = None
+        # RX notify subscriptions are link-scoped: enabled by the first memory
+        # session on a link, kept across later ones (refcounted holders) and
+        # torn down in aclose(). _notify_epoch is the link they were made on;
+        # _notify_started counts the channels enabled so far (in order).
         self._notify_subscribed = False
-        self._last_reply_packet_type: bytes | None = None
-        self._last_reply_memory_address: bytes | None = None
-        self._last_reply_payload: bytes | None = None
-        self._expected_reply_packet_type: bytes | None = None
-        self._reply_ready = asyncio.Event()
-        self._channel_fragments: list[bytes | None] = [None] * 4
+        self._notify_started = 0
+        self._notify_epoch = 0
+        self._notify_refs = 0
+        # Multi-channel frames are reassembled in place: channel N's fragment
+        # lands at N * 16 and its length is kept per channel (0: not received).
+        self._rx_buffer = bytearray(_RX_FRAME_CAPACITY)
+        self._rx_channel_lengths = [0] * _RX_CHANNELS
+        # Fragments that arrived ahead of their frame's channel 0, and the
+        # time.monotonic() they arrived at (None: nothing waiting).
+        self._rx_early: list[bytes | None] = [None] * _RX_CHANNELS
+        self._rx_early_at = [0.0] * _RX_CHANNELS
+        # Channels of the open frame filled from early fragments; the frame
+        # stays provisional until it passes its checks.
+        self._rx_adopted = [False] * _RX_CHANNELS
+        self._rx_opened_at = 0.0
+        # Outstanding memory-protocol commands, oldest first, keyed by the
+        # reply they wait for (see ``_reply_key``).
+        self._pending_replies: dict[_ReplyKey, asyncio.Future[_MemoryReply]] = {}
+        # One future per ``wait_on_link`` call in progress, resolved by the
+        # disconnected callback so the wait ends as soon as the link drops.
+        self._link_waiters: set[asyncio.Future[None]] = set()
+        # Timeouts and truncated frames seen so far; read_memory_range compares
+        # before/after to tune the block size.
+        self._link_faults = 0
         self._notify_handle_to_channel: dict[int, int] = {}
+        # UUID -> resolved characteristic for every characteristic the
+        # session does I/O on, valid for the service collection in
+        # ``_gatt_services`` (see ``gatt_char``).
+        self._gatt_chars: dict[str, Any] = {}
+        self._gatt_services: Any = None
         self._memory_session_active = False
+        # Ranges prefetched for the current memory session (see ``prefetch``).
+        self._poll_buffer: TransferCheckpoint | None = None
         self._unlocked = False
         self._secure_session = None
         # Swappable handler for the unlock characteristic notifications. The
@@ -642,6 +819,12 @@ class OmronDeviceSession:
     def is_connected(self) -> bool:
         return self._client is not None and self._client.is_connected
 
+    @property
+    def link_epoch(self) -> int:
+        """Serial that changes on every (re)connect; state read under an older
+        epoch may be stale because the device could have been used in between."""
+        return self._link_epoch
+
     async def connect(self) -> "OmronDeviceSession":
         """Open the BLE link and let bonding/encryption settle before first use."""
         if self._client is not None and self._client.is_connected:
@@ -656,7 +839,10 @@ class OmronDeviceSession:
                 self.address,
                 pair_on_connect=self._config.pair_on_connect,
                 model=self._config.model,
+                disconnected_callback=self._on_client_disconnected,
+                budget=self.budget,
             )
+            self._link_epoch = next(_LINK_EPOCHS)
         except BaseException:
             # A half-established bond is worse than none for PER_SESSION
             # profiles: the next connect would offer a key the device does
@@ -687,6 +873,61 @@ class OmronDeviceSession:
             raise
         return self
 
+    def _on_client_disconnected(self, client: BleakClient) -> None:
+        """Fail every pending reply and link wait as soon as the link drops.
+
+        Without this a drop is only noticed when each outstanding wait times
+        out, delaying reconnect/retry by a full reply or handshake timeout.
+        """
+        if self._client is not None and client is not self._client:
+            return  # a client from an earlier (re)connect
+        if not self._pending_replies and not self._link_waiters:
+            return
+        _LOGGER.debug(
+            "BLE link to %s dropped; failing %d pending repl(ies) and %d wait(s)",
+            self.address,
+            len(self._pending_replies),
+            len(self._link_waiters),
+        )
+        for future in self._pending_replies.values():
+            if not future.done():
+                future.set_exception(
+                    ConnectionError(
+                        "BLE disconnected while waiting for a memory-protocol reply"
+                    )
+                )
+                # Replies still queued behind the awaited one are never
+                # awaited themselves; don't log their exception at GC.
+                future.exception()
+        for waiter in self._link_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _check_budget(self, what: str) -> None:
+        """Raise ``DeadlineExhausted`` if the current phase's budget is spent."""
+        if self.budget is not None:
+            self.budget.check(what)
+
+    async def wait_on_link(self, awaitable: Awaitable[Any], timeout: float) -> Any:
+        """``asyncio.wait_for`` that raises ``ConnectionError`` if the link drops first."""
+        lost: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        task = asyncio.ensure_future(awaitable)
+        self._link_waiters.add(lost)
+        try:
+            done, _ = await asyncio.wait(
+                (task, lost), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            self._link_waiters.discard(lost)
+            lost.cancel()
+            if not task.done():
+                task.cancel()
+        if task in done:
+            return task.result()
+        if lost in done:
+            raise ConnectionError(f"BLE link to {self.address} dropped while waiting")
+        raise asyncio.TimeoutError
+
     async def refresh_services(self) -> None:
         """Re-run GATT discovery so characteristics appear after connection."""
         await _bleak_refresh_services(self.client)
@@ -731,6 +972,7 @@ class OmronDeviceSession:
             parent_uuid, self.address,
         )
         for attempt in range(2):
+            self._check_budget("forced service re-discovery")
             if not await _bleak_clear_cache(self.client):
                 _LOGGER.debug(
                     "clear_cache unsupported by backend for %s; "
@@ -758,7 +1000,7 @@ class OmronDeviceSession:
         char = self.client.services.get_characteristic(MODEL_NUMBER_UUID)
         if char is None:
             return None
-        raw = await self.client.read_gatt_char(char)
+        raw = await gatt_read(self.client, char)
         if not raw:
             return None
         return raw.decode("utf-8").strip(" \x00")
@@ -790,6 +1032,8 @@ class OmronDeviceSession:
                     await self.close_memory_session()
                 except Exception:
                     pass
+            if self._rx_notify_held and client.is_connected:
+                await self._unsubscribe_notify_channels()
             # Drop the bond so the next connection bonds from scratch
             # (BondPolicy.PER_SESSION). Prefer the DBus RemoveDevice, which
             # also works once the link is down; unpair() is the fallback and
@@ -850,19 +1094,115 @@ class OmronDeviceSession:
         """Hook for BLE link tracing (disabled)."""
         return
 
+    def gatt_char(self, uuid: str) -> Any:
+        """Resolved characteristic for ``uuid``, or ``uuid`` itself if unresolved.
+
+        Passing the characteristic object spares the backend a UUID lookup
+        over the whole service collection on every write and notify call.
+        The table is rebuilt when the client's service collection is
+        replaced (every discovery refresh and reconnect creates a new one).
+        """
+        try:
+            services = self._client.services
+        except Exception:
+            return uuid
+        if services is not self._gatt_services:
+            self._rebuild_gatt_table(services)
+        return self._gatt_chars.get(uuid, uuid)
+
+    def gatt_layout(self) -> tuple[list[str], dict[str, int]]:
+        """Service UUIDs on this link and the handles of the resolved characteristics."""
+        services = self.client.services
+        if services is not self._gatt_services:
+            self._rebuild_gatt_table(services)
+        return (
+            [service.uuid for service in services],
+            {uuid: char.handle for uuid, char in self._gatt_chars.items()},
+        )
+
+    async def _write_char(
+        self, uuid: str, data: bytes | bytearray, response: bool | None = None
+    ) -> None:
+        """Write ``uuid`` through its resolved characteristic, within the write deadline."""
+        await gatt_write(self._client, self.gatt_char(uuid), data, response)
+
+    async def _start_notify(self, uuid: str, callback: Callable[[Any, bytearray], None]) -> None:
+        """Subscribe to ``uuid`` within the start_notify deadline."""
+        await gatt_start_notify(self._client, self.gatt_char(uuid), callback)
+
+    async def _stop_notify(self, uuid: str) -> None:
+        """Unsubscribe from ``uuid`` within the stop_notify deadline."""
+        await gatt_stop_notify(self._client, self.gatt_char(uuid))
+
+    def _rebuild_gatt_table(self, services: Any) -> None:
+        """Resolve the TX/RX/unlock/BLS/CTS characteristics against ``services``."""
+        uuids = [
+            *self._config.tx_channel_uuids,
+            *self._config.rx_channel_uuids,
+            self._config.unlock_uuid,
+            BP_MEASUREMENT_CHAR_UUID,
+            BP_RACP_CHAR_UUID,
+            CTS_CHARACTERISTIC_UUID,
+            LOCAL_TIME_INFO_UUID,
+        ]
+        self._gatt_chars = {}
+        for uuid in uuids:
+            try:
+                char = services.get_characteristic(uuid)
+            except Exception:
+                # e.g. the UUID is present in more than one service.
+                char = None
+            if char is not None:
+                self._gatt_chars[uuid] = char
+        self._gatt_services = services
+
     def _rebuild_notify_handle_index_map(self) -> None:
         """Build mapping from GATT characteristic handles to notify channel indices."""
+        self._rebuild_gatt_table(self._client.services)
         self._notify_handle_to_channel = {}
         for idx, uuid in enumerate(self._config.rx_channel_uuids):
-            char = self._client.services.get_characteristic(uuid)
+            char = self._gatt_chars.get(uuid)
             if char is not None:
                 self._notify_handle_to_channel[char.handle] = idx
 
-    async def _subscribe_notify_channels(self) -> None:
-        """Enable notifications on all RX channels."""
-        if self._notify_subscribed:
+    @property
+    def _rx_notify_held(self) -> bool:
+        """True while RX channel 0 is subscribed on the current link."""
+        return self._notify_started > 0 and self._notify_epoch == self._link_epoch
+
+    async def _acquire_notify_channels(self) -> None:
+        """Take a reference on the link's RX subscriptions, enabling them once."""
+        await self._subscribe_notify_channels()
+        self._notify_refs += 1
+
+    def _release_notify_channels(self) -> None:
+        """Drop a reference; the CCCDs stay enabled until ``aclose()``."""
+        self._notify_refs = max(0, self._notify_refs - 1)
+        if self._notify_refs == 0 and self._rx_notify_held:
+            _LOGGER.debug(
+                "RX notify kept for the rest of the link model=%s",
+                self._config.model,
+            )
+
+    async def _subscribe_notify_channels(
+        self, count: int | None = None, *, settle: bool = True
+    ) -> None:
+        """Enable notifications on the first ``count`` RX channels (all by
+        default), each once per link.
+
+        Without ``settle`` the caller covers the post-subscribe settle itself.
+        """
+        channels = self._config.rx_channel_uuids
+        count = len(channels) if count is None else min(count, len(channels))
+        if self._notify_epoch != self._link_epoch:
+            # Subscriptions from an earlier link died with it.
+            self._notify_subscribed = False
+            self._notify_started = 0
+            self._notify_refs = 0
+            self._notify_epoch = self._link_epoch
+        if self._notify_started >= count:
             _LOGGER.debug(
-                "RX notify subscribe skipped (already flagged) model=%s",
+                "RX notify subscribe skipped (held on this link) model=%s",
                 self._config.model,
             )
             return
@@ -871,18 +1211,22 @@ class OmronDeviceSession:
         await self._ensure_services_cache()
         self._rebuild_notify_handle_index_map()
 
-        for uuid in self._config.rx_channel_uuids:
+        for uuid in channels[self._notify_started:count]:
             await self._start_notify_with_recovery(uuid)
-        await asyncio.sleep(_NOTIFY_SUBSCRIBE_SETTLE_SEC)
-        self._notify_subscribed = True
+            self._notify_started += 1
+        if settle:
+            await asyncio.sleep(_NOTIFY_SUBSCRIBE_SETTLE_SEC)
+        self._notify_subscribed = self._notify_started == len(channels)
         self._debug_ble_link("after_rx_subscribe")
 
     async def _start_notify_with_recovery(self, uuid: str) -> None:
         """Start notify with recovery for transient BlueZ/stack races."""
         last_exc: BaseException | None = None
         for attempt in range(_NOTIFY_SUBSCRIBE_MAX_RETRIES):
+            if attempt:
+                self._check_budget("notify subscribe retry")
             try:
-                await self._client.start_notify(uuid, self._on_notify_channel_data)
+                await self._start_notify(uuid, self._on_notify_channel_data)
                 return
             except BleakError as exc:
                 last_exc = exc
@@ -905,7 +1249,7 @@ class OmronDeviceSession:
                         exc,
                     )
                     try:
-                        await self._client.stop_notify(uuid)
+                        await self._stop_notify(uuid)
                     except Exception:
                         pass
                     await _bleak_refresh_services(self._client)
@@ -931,10 +1275,12 @@ class OmronDeviceSession:
         """Disable notifications on all RX channels."""
         for uuid in self._config.rx_channel_uuids:
             try:
-                await self._client.stop_notify(uuid)
+                await self._stop_notify(uuid)
             except Exception as exc:
                 _LOGGER.debug("stop_notify for %s ignored: %s", uuid, exc)
         self._notify_subscribed = False
+        self._notify_started = 0
+        self._notify_refs = 0
         self._debug_ble_link("after_rx_unsubscribe")
 
     async def reset_session_state(self) -> None:
@@ -949,11 +1295,197 @@ class OmronDeviceSession:
         self._unlocked = False
         self._secure_session = None
         self._memory_session_active = False
-        self._channel_fragments = [None] * 4
-        self._expected_reply_packet_type = None
-        self._reply_ready.clear()
+        self._poll_buffer = None
+        self._reset_rx_frame()
+        self._cancel_pending_replies()
         self._debug_ble_link("reset_session_state")
 
+    def _reset_rx_frame(self) -> None:
+        """Forget every received fragment (the receive buffer itself is reused)."""
+        self._close_rx_frame()
+        self._rx_early[:] = _RX_NO_EARLY
+
+    def _close_rx_frame(self) -> None:
+        """Drop the open frame; early fragments for later frames are kept."""
+        self._rx_channel_lengths[:] = _RX_NO_FRAGMENTS
+        self._rx_adopted[:] = _RX_NOT_ADOPTED
+
+    def _take_rx_fragment(
+        self, channel_index: int, rx_bytes: bytearray
+    ) -> memoryview | None:
+        """Add one multi-channel fragment; return the frame once complete and valid."""
+        now = time.monotonic()
+        fragment = memoryview(rx_bytes)[:_RX_CHANNEL_BYTES]
+        lengths = self._rx_channel_lengths
+        if channel_index == 0:
+            if not self._open_rx_frame(fragment, now):
+                return None
+        elif (
+            lengths[0]
+            and not lengths[channel_index]
+            and channel_index < self._rx_frame_channels()
+        ):
+            self._place_rx_fragment(channel_index, fragment)
+        else:
+            # No frame open, or the open one already holds this channel or
+            # does not span it: the fragment overtook a later channel 0.
+            self._rx_early[channel_index] = bytes(fragment)
+            self._rx_early_at[channel_index] = now
+            return None
+        return self._complete_rx_frame(channel_index, now)
+
+    def _open_rx_frame(self, fragment: memoryview, now: float) -> bool:
+        """Start a frame at channel 0 and adopt fragments that arrived ahead of it."""
+        # Channel 0 starts a new frame; an incomplete earlier one is abandoned.
+        self._close_rx_frame()
+        self._place_rx_fragment(0, fragment)
+        packet_size = self._rx_buffer[0]
+        if packet_size == 0:
+            _LOGGER.warning("Received zero-length BLE frame packet_size")
+            self._close_rx_frame()
+            return False
+        if packet_size > _RX_FRAME_CAPACITY:
+            _LOGGER.warning(
+                "BLE frame packet_size %d exceeds 4-channel capacity (max 64 bytes)",
+                packet_size,
+            )
+            self._close_rx_frame()
+            return False
+        self._rx_opened_at = now
+        channels = self._rx_frame_channels()
+        for ch in range(1, _RX_CHANNELS):
+            early = self._rx_early[ch]
+            if early is None:
+                continue
+            if now - self._rx_early_at[ch] > _RX_REORDER_WINDOW_SEC:
+                self._rx_early[ch] = None
+            elif ch < channels:
+                self._place_rx_fragment(ch, early)
+                self._rx_adopted[ch] = True
+                self._rx_early[ch] = None
+        return True
+
+    def _place_rx_fragment(self, channel_index: int, fragment: bytes | memoryview) -> None:
+        """Write one channel's 16-byte slice of the frame in place."""
+        offset = channel_index * _RX_CHANNEL_BYTES
+        self._rx_buffer[offset:offset + len(fragment)] = fragment
+        self._rx_channel_lengths[channel_index] = len(fragment)
+        self._rx_adopted[channel_index] = False
+
+    def _rx_frame_channels(self) -> int:
+        """Channels the open frame spans, from channel 0's packet size."""
+        return (self._rx_buffer[0] + _RX_CHANNEL_BYTES - 1) // _RX_CHANNEL_BYTES
+
+    def _complete_rx_frame(self, last_channel: int, now: float) -> memoryview | None:
+        """Return the open frame if every channel it spans is in and it checks out.
+
+        A frame that adopted early fragments is provisional: those may be
+        left over from a frame whose channel 0 was lost. If it fails its
+        checks only the adopted fragments are dropped and the frame waits
+        for its own. Otherwise the fragment that completed a failing frame
+        is kept as an early one, since it may have overtaken the next
+        frame's channel 0 while this frame waited for a lost fragment.
+        """
+        lengths = self._rx_channel_lengths
+        required_channels = range(self._rx_frame_channels())
+        if not all(lengths[ch] for ch in required_channels):
+            return None
+        # Contiguous bytes received; a short fragment ends the frame there
+        # and the length checks reject it.
+        received = 0
+        for ch in required_channels:
+            received = ch * _RX_CHANNEL_BYTES + lengths[ch]
+            if lengths[ch] < _RX_CHANNEL_BYTES:
+                break
+        frame = memoryview(self._rx_buffer)[:min(self._rx_buffer[0], received)]
+        adopted = [ch for ch in required_channels if self._rx_adopted[ch]]
+        try:
+            checked = self._checked_rx_frame(frame)
+        except _BadRxFrame as exc:
+            if adopted:
+                _LOGGER.debug(
+                    "Dropping %d early fragment(s) that do not belong to the frame "
+                    "from %s: %s",
+                    len(adopted),
+                    self.address,
+                    exc,
+                )
+                for ch in adopted:
+                    lengths[ch] = 0
+                    self._rx_adopted[ch] = False
+                    # This frame's own fragment, set aside while the slot was taken.
+                    own = self._rx_early[ch]
+                    if own is not None and self._rx_early_at[ch] >= self._rx_opened_at:
+                        self._place_rx_fragment(ch, own)
+                        self._rx_early[ch] = None
+                return self._complete_rx_frame(last_channel, now)
+            self._log_bad_rx_frame(exc)
+            if last_channel:
+                offset = last_channel * _RX_CHANNEL_BYTES
+                self._rx_early[last_channel] = bytes(
+                    self._rx_buffer[offset:offset + lengths[last_channel]]
+                )
+                self._rx_early_at[last_channel] = now
+            self._close_rx_frame()
+            return None
+        if adopted:
+            self._count_rx_reorder()
+        self._close_rx_frame()
+        return checked
+
+    def _checked_rx_frame(self, frame: memoryview) -> memoryview:
+        """Decrypt or checksum-verify ``frame`` and check its length fields."""
+        # Decrypt if secure-session encryption is active
+        if self._config.unlock_mode == UnlockMode.SECURE_SESSION and self._secure_session is not None:
+            try:
+                frame = memoryview(self._secure_session.decrypt(bytes(frame)))
+            except Exception as exc:
+                raise _BadRxFrame(
+                    logging.ERROR, f"Secure session decryption failed: {exc}"
+                ) from exc
+        else:
+            # Verify XOR CRC
+            xor_crc = xor_checksum(frame)
+            if xor_crc:
+                raise _BadRxFrame(
+                    logging.ERROR, f"CRC error in rx data: crc={xor_crc}, buffer={_hex(frame)}"
+                )
+
+        # Check minimum valid frame length (len(1) + type(2) + addr(2) + datalen(1) + rescode(1) + crc(1) = 8)
+        if len(frame) < 8:
+            raise _BadRxFrame(
+                logging.WARNING,
+                f"Received malformed or undersized BLE frame ({len(frame)} bytes): {_hex(frame)}",
+            )
+        packet_type, _address, expected_data_len = FRAME_HEADER.unpack_from(frame)
+        if packet_type == b"\x81\x00" and len(frame) < expected_data_len + 8:
+            raise _BadRxFrame(
+                logging.WARNING,
+                "Truncated BLE read frame received (expected "
+                f"{expected_data_len} bytes payload, available {len(frame) - 8}): {_hex(frame)}",
+                fault=True,
+            )
+        return frame
+
+    def _log_bad_rx_frame(self, exc: _BadRxFrame) -> None:
+        if exc.fault:
+            self._link_faults += 1
+        _LOGGER.log(exc.level, "%s", exc)
+
+    def _count_rx_reorder(self) -> None:
+        """Record a frame completed from fragments that overtook its channel 0."""
+        source = (
+            _connection_source(self._ble_device) if self._ble_device is not None else "unknown"
+        )
+        reordered = link_tuning_for(self.address).rx_reordered_frames
+        reordered[source] = reordered.get(source, 0) + 1
+        _LOGGER.debug(
+            "Reassembled out-of-order BLE frame from %s via %s (%d so far on that source)",
+            self.address,
+            source,
+            reordered[source],
+        )
+
     def _on_notify_channel_data(self, char: Any, rx_bytes: bytearray) -> None:
         """Callback for received BLE notifications. Reassembles multi-channel packets."""
         # Determine which channel this notification came from
@@ -972,134 +1504,150 @@ class OmronDeviceSession:
             _LOGGER.warning("Received data on unknown handle/uuid: %s", char)
             return
 
-        if channel_index == 0:
-            # Devices send notification channels sequentially (ch0, ch1, ...);
-            # receiving ch0 signals the start of a new frame, so discard stale fragments.
-            self._channel_fragments = [None] * 4
-        self._channel_fragments[channel_index] = rx_bytes
-
-        # Check if we can assemble a complete packet
-        if not self._channel_fragments[0]:
-            return
-
         if self._config.is_single_channel:
-            frame_bytes = bytearray(self._channel_fragments[0])
-            self._channel_fragments = [None] * 4
-            declared = frame_bytes[0] if frame_bytes else 0
-            if declared and len(frame_bytes) < declared:
+            if not rx_bytes:
+                return
+            frame = memoryview(rx_bytes)
+            declared = frame[0]
+            if declared and len(frame) < declared:
+                self._link_faults += 1
                 _LOGGER.warning(
                     "Truncated BLE frame: declared %d bytes, received %d: %s",
                     declared,
-                    len(frame_bytes),
-                    _hex(frame_bytes),
+                    len(frame),
+                    _hex(frame),
                 )
                 return
             if declared:
-                frame_bytes = frame_bytes[:declared]
-        else:
-            packet_size = self._channel_fragments[0][0]
-            if packet_size == 0:
-                _LOGGER.warning("Received zero-length BLE frame packet_size")
-                self._channel_fragments = [None] * 4
-                return
-            if packet_size > 64:
-                _LOGGER.warning(
-                    "BLE frame packet_size %d exceeds 4-channel capacity (max 64 bytes)",
-                    packet_size,
-                )
-                self._channel_fragments = [None] * 4
-                return
-            required_channels = range((packet_size + 15) // 16)
-            # Check all required channels are received
-            for ch in required_channels:
-                if ch >= len(self._channel_fragments) or self._channel_fragments[ch] is None:
-                    return
-            # Combine channels
-            frame_bytes = bytearray()
-            for ch in required_channels:
-                frame_bytes += self._channel_fragments[ch]
-            frame_bytes = frame_bytes[:packet_size]
-            self._channel_fragments = [None] * 4
-
-        # Decrypt if secure-session encryption is active
-        if self._config.unlock_mode == UnlockMode.SECURE_SESSION and self._secure_session is not None:
+                frame = frame[:declared]
             try:
-                frame_bytes = bytearray(self._secure_session.decrypt(bytes(frame_bytes)))
-            except Exception as exc:
-                _LOGGER.error("Secure session decryption failed: %s", exc)
+                frame = self._checked_rx_frame(frame)
+            except _BadRxFrame as exc:
+                self._log_bad_rx_frame(exc)
                 return
         else:
-            # Verify XOR CRC
-            xor_crc = 0
-            for byte in frame_bytes:
-                xor_crc ^= byte
-            if xor_crc:
-                _LOGGER.error(
-                    "CRC error in rx data: crc=%d, buffer=%s", xor_crc, _hex(frame_bytes)
-                )
+            frame = self._take_rx_fragment(channel_index, rx_bytes)
+            if frame is None:
                 return
 
-        # Check minimum valid frame length (len(1) + type(2) + addr(2) + datalen(1) + rescode(1) + crc(1) = 8)
-        if len(frame_bytes) < 8:
-            _LOGGER.warning(
-                "Received malformed or undersized BLE frame (%d bytes): %s",
-                len(frame_bytes),
-                _hex(frame_bytes),
-            )
-            return
-
         # Extract packet fields
-        packet_type = bytes(frame_bytes[1:3])
-        memory_address = bytes(frame_bytes[3:5])
-        expected_data_len = frame_bytes[5]
-
-        # If a specific reply packet type is expected, discard late or unrelated frames,
-        # but always accept 0x8f00 (end-of-transmission / device error frame).
-        if (
-            self._expected_reply_packet_type is not None
-            and packet_type != self._expected_reply_packet_type
-            and packet_type != b"\x8f\x00"
-        ):
+        packet_type, address, expected_data_len = FRAME_HEADER.unpack_from(frame)
+
+        future = self._pending_replies.get((packet_type, address))
+        if future is None:
+            future = self._pending_replies.get((packet_type, None))
+        if (future is None or future.done()) and packet_type == b"\x8f\x00":
+            # 0x8f00 (end-of-transmission / device error frame) carries no usable
+            # address. The device answers strictly in order, so an error frame
+            # nobody asked for belongs to the oldest outstanding command.
+            future = next(
+                (f for f in self._pending_replies.values() if not f.done()), None
+            )
+        if future is None or future.done():
             _LOGGER.debug(
-                "Ignoring unexpected or late reply packet type %s (expected %s)",
+                "Ignoring unexpected, late or duplicate reply %s at address 0x%04X",
                 _hex(packet_type),
-                _hex(self._expected_reply_packet_type),
+                address,
             )
             return
 
-        self._last_reply_packet_type = packet_type
-        self._last_reply_memory_address = memory_address
         if packet_type == b"\x81\x00":
-            # Memory block read: payload length in byte 5, payload at bytes 6..6+data_len
-            if len(frame_bytes) < expected_data_len + 8:
-                _LOGGER.warning(
-                    "Truncated BLE read frame received (expected %d bytes payload, available %d): %s",
-                    expected_data_len,
-                    max(0, len(frame_bytes) - 8),
-                    _hex(frame_bytes),
-                )
-                return
-            self._last_reply_payload = bytes(frame_bytes[6:6 + expected_data_len])
-        elif packet_type == b"\x8f\x00":
-            # End-of-transmission packet: error code is in byte 6
-            self._last_reply_payload = bytes(frame_bytes[6:7])
+            # Memory block read: payload length in byte 5, payload at bytes
+            # 6..6+data_len (length checked in _checked_rx_frame).
+            # The one copy per frame: the receive buffer is reused for the next.
+            payload = bytes(frame[6:6 + expected_data_len])
         else:
-            # Control frame (e.g. 0x8000 session open, 0x81c0 write response): response code in byte 6
-            self._last_reply_payload = bytes(frame_bytes[6:7])
+            # End-of-transmission (0x8f00: error code) or control frame (e.g. 0x8000
+            # session open, 0x81c0 write response): response code in byte 6
+            payload = bytes(frame[6:7])
+
+        future.set_result(_MemoryReply(packet_type, address, payload, time.monotonic()))
+
+    @staticmethod
+    def _reply_key(command: bytes | bytearray) -> _ReplyKey:
+        """Return the key the reply to plaintext ``command`` is dispatched under.
+
+        Block reads and writes echo the EEPROM address, so several of them can
+        be outstanding at once. Control replies (0x8000 open, 0x8f00 close) are
+        matched on packet type alone.
+        """
+        packet_type = bytes([command[1] | 0x80, command[2]])
+        if packet_type in (b"\x81\x00", b"\x81\xc0"):
+            return packet_type, int.from_bytes(command[3:5], "big")
+        return packet_type, None
+
+    def _expect_reply(self, key: _ReplyKey) -> asyncio.Future[_MemoryReply]:
+        """Register (or return the already registered) future for reply ``key``."""
+        future = self._pending_replies.get(key)
+        if future is None or future.done():
+            future = asyncio.get_running_loop().create_future()
+            self._pending_replies[key] = future
+        return future
+
+    def _cancel_pending_replies(self) -> None:
+        """Drop every outstanding reply future (late frames are then ignored)."""
+        for future in self._pending_replies.values():
+            if not future.done():
+                future.cancel()
+        self._pending_replies.clear()
+
+    @staticmethod
+    def _raise_for_error_frame(reply: _MemoryReply, command: bytes | bytearray) -> None:
+        """Raise if ``reply`` is a 0x8f00 error frame answering a non-close command."""
+        if reply.packet_type != b"\x8f\x00" or command[1:3] == b"\x0f\x00":
+            return
+        code = reply.payload[0] if reply.payload else -1
+        raise ConnectionError(
+            f"Device rejected command {_hex(command[:3])} "
+            f"(error frame 0x8f00, code 0x{code:02x})"
+        )
+
+    async def _transmit_command(self, command: bytes | bytearray) -> None:
+        """Write one (already encrypted, if applicable) command across the TX channels."""
+        channel_width = 16
+        if self._config.is_single_channel:
+            channel_width = max(channel_width, len(command))
+
+        remaining_cmd = command
+        num_tx_channels = (len(command) + channel_width - 1) // channel_width
+        for ch_idx in range(num_tx_channels):
+            tx_segment = remaining_cmd[:channel_width]
+            if self._config.is_single_channel:
+                await self._write_char(
+                    self._config.tx_channel_uuids[ch_idx], tx_segment, response=False
+                )
+            else:
+                await self._write_char(
+                    self._config.tx_channel_uuids[ch_idx], tx_segment
+                )
+            remaining_cmd = remaining_cmd[channel_width:]
 
-        self._reply_ready.set()
+    def _reply_timeout(self, attempt: int = 0) -> float:
+        """Retransmit timeout for ``attempt`` from this device's RTT estimate."""
+        ceiling = _MEMORY_PROTOCOL_REPLY_TIMEOUT_SEC
+        timeout = link_tuning_for(self.address).rtt.timeout(
+            ceiling, min(_MEMORY_PROTOCOL_RTO_MIN_SEC, ceiling), ceiling, attempt
+        )
+        return self.budget.cap(timeout) if self.budget is not None else timeout
 
     async def _write_command_and_wait_reply(
         self,
-        command: bytearray,
-        timeout: float = _MEMORY_PROTOCOL_REPLY_TIMEOUT_SEC,
-    ) -> None:
-        """Send a command and wait for response with retry logic."""
-        # Derive expected reply packet type from plaintext command before optional encryption
-        if len(command) >= 3:
-            self._expected_reply_packet_type = bytes([command[1] | 0x80, command[2]])
-        else:
-            self._expected_reply_packet_type = None
+        command: bytes | bytearray,
+        timeout: float | None = None,
+    ) -> _MemoryReply:
+        """Send a command and wait for its reply with retry logic.
+
+        The reply is matched by ``_reply_key`` (derived from the plaintext command
+        before optional encryption), so frames answering an earlier command are
+        never mistaken for this one. A 0x8f00 error frame raises ``ConnectionError``.
+
+        Without an explicit ``timeout`` each attempt waits ``_reply_timeout``;
+        replies to first transmissions feed the device's RTT estimate (Karn:
+        retransmitted commands are never sampled).
+        """
+        plain_command = bytes(command)
+        key = self._reply_key(plain_command)
+        future = self._expect_reply(key)
 
         if self._config.unlock_mode == UnlockMode.SECURE_SESSION and self._secure_session is not None:
             try:
@@ -1111,27 +1659,13 @@ class OmronDeviceSession:
         max_retries = _MEMORY_PROTOCOL_TX_MAX_RETRIES
         try:
             for retry in range(max_retries):
-                self._reply_ready.clear()
-
-                # Split command across TX channels
-                remaining_cmd = command
-                channel_width = 16
-                if self._config.is_single_channel:
-                    channel_width = max(channel_width, len(command))
-
-                num_tx_channels = (len(command) + channel_width - 1) // channel_width
+                if retry:
+                    self._check_budget("memory-protocol retry")
                 try:
-                    for ch_idx in range(num_tx_channels):
-                        tx_segment = remaining_cmd[:channel_width]
-                        if self._config.is_single_channel:
-                            await self._client.write_gatt_char(
-                                self._config.tx_channel_uuids[ch_idx], tx_segment, response=False
-                            )
-                        else:
-                            await self._client.write_gatt_char(
-                                self._config.tx_channel_uuids[ch_idx], tx_segment
-                            )
-                        remaining_cmd = remaining_cmd[channel_width:]
+                    # Stamped before the write, as the pipelined path does:
+                    # the round trip includes the GATT write itself.
+                    sent_at = time.monotonic()
+                    await self._transmit_command(command)
                 except BleakError as exc:
                     msg = str(exc).lower()
                     # Refresh the GATT cache when either:
@@ -1175,24 +1709,28 @@ class OmronDeviceSession:
                     self._debug_ble_link(
                         f"await_reply attempt={retry + 1} cmd_head={_hex(command[:8])}"
                     )
-                    await asyncio.wait_for(self._reply_ready.wait(), timeout=timeout)
-                    if (
-                        self._expected_reply_packet_type is not None
-                        and self._last_reply_packet_type == b"\x8f\x00"
-                        and self._expected_reply_packet_type != b"\x8f\x00"
-                    ):
-                        code = (
-                            self._last_reply_payload[0]
-                            if self._last_reply_payload
-                            else -1
-                        )
-                        raise ConnectionError(
-                            f"Device rejected command {_hex(command[:3])} "
-                            f"(error frame 0x8f00, code 0x{code:02x})"
+                    attempt_timeout = (
+                        timeout if timeout is not None else self._reply_timeout(retry)
+                    )
+                    reply = await asyncio.wait_for(
+                        asyncio.shield(future), timeout=attempt_timeout
+                    )
+                    if retry == 0:
+                        link_tuning_for(self.address).rtt.observe(
+                            reply.received_at - sent_at
                         )
-                    return  # Success
+                    self._raise_for_error_frame(reply, plain_command)
+                    return reply  # Success
                 except asyncio.TimeoutError:
-                    _LOGGER.warning("TX timeout, retry %d/%d", retry + 1, max_retries)
+                    # A wait cut short by the poll budget says nothing about the link.
+                    self._check_budget("memory-protocol reply")
+                    self._link_faults += 1
+                    _LOGGER.warning(
+                        "TX timeout after %.2fs, retry %d/%d",
+                        attempt_timeout,
+                        retry + 1,
+                        max_retries,
+                    )
                     self._debug_ble_link(
                         f"reply_timeout attempt={retry + 1} cmd_head={_hex(command[:8])}"
                     )
@@ -1207,13 +1745,18 @@ class OmronDeviceSession:
                     except Exception:
                         pass
                     if retry + 1 < max_retries:
-                        await asyncio.sleep(_MEMORY_PROTOCOL_RETRY_BACKOFF_SEC)
+                        await asyncio.sleep(
+                            min(_MEMORY_PROTOCOL_RETRY_BACKOFF_SEC, self._reply_timeout())
+                        )
 
             raise ConnectionError(
                 f"Failed to receive response after {max_retries} retries"
             )
         finally:
-            self._expected_reply_packet_type = None
+            if self._pending_replies.get(key) is future:
+                del self._pending_replies[key]
+            if not future.done():
+                future.cancel()
 
     @property
     def memory_session_active(self) -> bool:
@@ -1241,9 +1784,45 @@ class OmronDeviceSession:
                 _LOGGER.debug(
                     "Poll pair step failed (continuing to unlock): %s", exc
                 )
-        await self.unlock()
-        async with self.memory_session():
+        await self.unlock_and_open_memory_session()
+        try:
             yield
+        finally:
+            await self.close_memory_session()
+
+    async def unlock_and_open_memory_session(self) -> None:
+        """Unlock, then open a memory session, enabling RX notify only once.
+
+        The key and token unlocks prime RX channel 0 before enabling the
+        unlock CCCD and stop it again afterwards, after which the memory
+        session subscribes the same channel and settles a second time.
+        Here RX channel 0 is subscribed with the frame handler up front, in
+        the official app's order (RX channel 0 CCCD, then the unlock CCCD),
+        and serves as that prime; the settle after the unlock CCCD covers
+        both. The other channels follow once unlocked, without a settle of
+        their own, and the open reuses them all.
+        """
+        if self._memory_session_active:
+            return
+        primed = False
+        if not self._unlocked and self._config.unlock_mode in (
+            UnlockMode.CLASSIC_KEY,
+            UnlockMode.TOKEN_KEY,
+            UnlockMode.SECURE_SESSION,
+        ):
+            self._require_connected("unlock_and_open_memory_session")
+            try:
+                await self._subscribe_notify_channels(1, settle=False)
+                primed = True
+            except Exception as exc:
+                _LOGGER.debug(
+                    "RX subscribe before unlock failed (unlock primes instead): %s",
+                    exc,
+                )
+        await self.unlock()
+        if primed:
+            await self._subscribe_notify_channels(settle=False)
+        await self.open_memory_session()
 
     async def open_memory_session(self) -> None:
         """Start a data readout session (no-op if already open)."""
@@ -1253,15 +1832,11 @@ class OmronDeviceSession:
         try:
             self._require_connected("open_memory_session")
             self._debug_ble_link("open_memory_session_enter")
-            await self._subscribe_notify_channels()
-            # Universal init command (ubpm cmd_init): byte[5]=0x10 for all devices.
-            start_cmd = bytearray.fromhex("0800000000100018")
-            await self._write_command_and_wait_reply(start_cmd)
-            if self._last_reply_packet_type != bytearray.fromhex("8000"):
-                raise ConnectionError("Invalid response to data readout start")
-            if self._last_reply_payload and self._last_reply_payload[0]:
+            await self._acquire_notify_channels()
+            reply = await self._write_command_and_wait_reply(OPEN_SESSION_FRAME)
+            if reply.payload and reply.payload[0]:
                 raise ConnectionError(
-                    f"Device rejected memory session open (error code 0x{self._last_reply_payload[0]:02x})"
+                    f"Device rejected memory session open (error code 0x{reply.payload[0]:02x})"
                 )
             self._memory_session_active = True
             self._debug_ble_link("open_memory_session_ok")
@@ -1270,7 +1845,9 @@ class OmronDeviceSession:
             self._memory_session_active = False
             self._unlocked = False
             self._debug_ble_link("open_memory_session_fail_cleanup")
-            await self._unsubscribe_notify_channels()
+            # Keep the subscriptions for the next attempt on this link;
+            # reset_session_state() drops them when they are the problem.
+            self._release_notify_channels()
             raise
 
     async def close_memory_session(self) -> None:
@@ -1279,85 +1856,325 @@ class OmronDeviceSession:
             return
 
         try:
-            stop_cmd = bytearray.fromhex("080f000000000007")
-            await self._write_command_and_wait_reply(stop_cmd)
-            if self._last_reply_packet_type != bytearray.fromhex("8f00"):
-                _LOGGER.warning("Invalid response to data readout end")
-            elif self._last_reply_payload and self._last_reply_payload[0]:
+            reply = await self._write_command_and_wait_reply(CLOSE_SESSION_FRAME)
+            if reply.payload and reply.payload[0]:
                 _LOGGER.warning(
                     "Device reported error code %d during session close",
-                    self._last_reply_payload[0],
+                    reply.payload[0],
                 )
         finally:
             self._memory_session_active = False
-            await self._unsubscribe_notify_channels()
+            self._poll_buffer = None
+            self._release_notify_channels()
             _LOGGER.debug("Memory session closed for %s", self.address)
 
     async def read_memory_block(self, address: int, blocksize: int) -> bytes:
         """Read a block of data from device EEPROM."""
-        cmd = bytearray.fromhex("080100")
-        cmd += address.to_bytes(2, "big")
-        cmd += blocksize.to_bytes(1, "big")
-        # Calculate XOR CRC
-        xor_crc = 0
-        for byte in cmd:
-            xor_crc ^= byte
-        cmd += b'\x00'
-        cmd.append(xor_crc)
-
-        await self._write_command_and_wait_reply(cmd)
-        if self._last_reply_memory_address != address.to_bytes(2, "big"):
-            raise ConnectionError(
-                f"Address mismatch: got {self._last_reply_memory_address}, expected {address:#06x}"
-            )
-        if self._last_reply_packet_type != bytearray.fromhex("8100"):
-            raise ConnectionError("Invalid packet type in EEPROM read")
-        return self._last_reply_payload
+        reply = await self._write_command_and_wait_reply(encode_read(address, blocksize))
+        return reply.payload
 
     async def write_memory_block(self, address: int, data: bytearray) -> None:
         """Write a block of data to device EEPROM."""
-        cmd = bytearray()
-        cmd += (len(data) + 8).to_bytes(1, "big")
-        cmd += bytearray.fromhex("01c0")
-        cmd += address.to_bytes(2, "big")
-        cmd += len(data).to_bytes(1, "big")
-        cmd += data
-        # Calculate XOR CRC
-        xor_crc = 0
-        for byte in cmd:
-            xor_crc ^= byte
-        cmd += b'\x00'
-        cmd.append(xor_crc)
-
-        await self._write_command_and_wait_reply(cmd)
-        if self._last_reply_memory_address != address.to_bytes(2, "big"):
-            raise ConnectionError(
-                f"Address mismatch in write: got {self._last_reply_memory_address}, expected {address:#06x}"
-            )
-        if self._last_reply_packet_type != bytearray.fromhex("81c0"):
-            raise ConnectionError("Invalid packet type in EEPROM write")
+        await self._write_command_and_wait_reply(encode_write(address, data))
+
+    @property
+    def read_window(self) -> int:
+        """Block reads ``read_memory_range`` keeps in flight on this link."""
+        if self._config.unlock_mode == UnlockMode.SECURE_SESSION:
+            # The device rejects out-of-sequence CCM counters, so a
+            # retransmitted read could never overtake a newer one in flight.
+            return 1
+        if link_tuning_for(self.address).pipeline_demoted:
+            return 1
+        return max(1, self._config.memory_read_window)
+
+    @property
+    def read_block_size(self) -> int:
+        """Block size ``read_memory_range`` uses when the caller does not pass one."""
+        configured = self._config.transmission_block_size
+        if not self._config.adaptive_block_size:
+            return configured
+        return link_tuning_for(self.address).block_size or configured
+
+    @property
+    def _max_read_block_size(self) -> int:
+        """Largest block size worth probing on this profile."""
+        configured = self._config.transmission_block_size
+        if self._config.is_single_channel or self._config.unlock_mode == UnlockMode.SECURE_SESSION:
+            # One notification (MTU-bound) or CCM overhead per frame: do not
+            # go beyond what the profile was verified with.
+            return configured
+        return max(configured, _MULTI_CHANNEL_MAX_BLOCK_SIZE)
 
     async def read_memory_range(
-        self, start_address: int, bytes_to_read: int, block_size: int = 0x10
+        self,
+        start_address: int,
+        bytes_to_read: int,
+        block_size: int | None = None,
+        *,
+        checkpoint: TransferCheckpoint | None = None,
+    ) -> bytearray:
+        """Read a continuous range from EEPROM in blocks.
+
+        Up to ``read_window`` block reads are kept in flight. If a pipelined
+        read fails while the link is still up, the device is demoted to one
+        read at a time for good and the blocks still missing are re-read
+        that way.
+
+        Without an explicit ``block_size`` the range is read at
+        ``read_block_size`` and the outcome (timeouts or truncated frames seen)
+        feeds the per-device block size tuning. A failed read at a probed size
+        above ``transmission_block_size`` is retried once at the profile's size.
+
+        A ``checkpoint`` supplies parts of the range read by an earlier
+        (interrupted) session and collects the blocks read by this one.
+        Ranges already fetched by ``prefetch`` are served from its buffer.
+        """
+        buffer = self._poll_buffer
+        if buffer is not None and not buffer.missing(start_address, bytes_to_read):
+            return buffer.assemble(start_address, bytes_to_read)
+        if checkpoint is not None and not checkpoint.missing(start_address, bytes_to_read):
+            return checkpoint.assemble(start_address, bytes_to_read)
+        if block_size is not None or not self._config.adaptive_block_size:
+            return await self._read_range_in_blocks(
+                start_address,
+                bytes_to_read,
+                block_size or self._config.transmission_block_size,
+                checkpoint=checkpoint,
+            )
+
+        tuning = link_tuning_for(self.address)
+        block_size = self.read_block_size
+        probing = block_size > self._config.transmission_block_size
+        faults_before = self._link_faults
+        try:
+            data = await self._read_range_in_blocks(
+                start_address,
+                bytes_to_read,
+                block_size,
+                probing=probing,
+                checkpoint=checkpoint,
+            )
+        except DeadlineExhausted:
+            raise
+        except ConnectionError as exc:
+            tuning.record_block_read(
+                block_size,
+                True,
+                self._max_read_block_size,
+                self._config.transmission_block_size,
+            )
+            if not probing or not self.is_connected:
+                raise
+            _LOGGER.info(
+                "EEPROM read with block size 0x%02X failed for %s [%s] (%s); "
+                "retrying at 0x%02X",
+                block_size,
+                self.address,
+                self._config.model,
+                exc,
+                self._config.transmission_block_size,
+            )
+            return await self._read_range_in_blocks(
+                start_address,
+                bytes_to_read,
+                self._config.transmission_block_size,
+                checkpoint=checkpoint,
+            )
+        faulted = self._link_faults != faults_before
+        if not faulted and bytes_to_read < block_size:
+            # No block of the tuned size was sent: says nothing about it.
+            return data
+        tuning.record_block_read(
+            block_size,
+            faulted,
+            self._max_read_block_size,
+            self._config.transmission_block_size,
+        )
+        if tuning.block_size != block_size:
+            _LOGGER.debug(
+                "EEPROM block size for %s [%s]: 0x%02X -> 0x%02X",
+                self.address,
+                self._config.model,
+                block_size,
+                tuning.block_size,
+            )
+        return data
+
+    async def _read_range_in_blocks(
+        self,
+        start_address: int,
+        bytes_to_read: int,
+        block_size: int,
+        *,
+        probing: bool = False,
+        checkpoint: TransferCheckpoint | None = None,
     ) -> bytearray:
-        """Read a continuous range from EEPROM in blocks."""
+        """Read a range in ``block_size`` chunks (pipelined when the window allows).
+
+        ``probing`` marks a read at an untested block size: a pipelined
+        failure is then blamed on the size and re-raised, not on pipelining.
+        With a ``checkpoint`` only the parts it does not hold are read, and
+        every block that arrives is recorded in it even if the read fails.
+        """
+        spans = (
+            checkpoint.missing(start_address, bytes_to_read)
+            if checkpoint is not None
+            else [(start_address, bytes_to_read)]
+        )
+        chunks: list[tuple[int, int]] = []
+        for address, remaining in spans:
+            while remaining > 0:
+                chunk_size = min(remaining, block_size)
+                chunks.append((address, chunk_size))
+                address += chunk_size
+                remaining -= chunk_size
+
+        blocks: dict[int, bytes] = {}
+        try:
+            window = self.read_window
+            if window > 1 and len(chunks) > 1:
+                try:
+                    await self._read_blocks_pipelined(chunks, window, blocks)
+                except DeadlineExhausted:
+                    raise
+                except ConnectionError as exc:
+                    if probing or not self.is_connected:
+                        raise
+                    link_tuning_for(self.address).pipeline_demoted = True
+                    _LOGGER.warning(
+                        "Pipelined EEPROM read (window=%d) failed for %s [%s]: %s; "
+                        "falling back to one read at a time for this device",
+                        window,
+                        self.address,
+                        self._config.model,
+                        exc,
+                    )
+
+            for address, size in chunks:
+                if address not in blocks:
+                    blocks[address] = await self.read_memory_block(address, size)
+        finally:
+            if checkpoint is not None:
+                for address, block in blocks.items():
+                    checkpoint.add(address, block)
+
+        if checkpoint is not None:
+            return checkpoint.assemble(start_address, bytes_to_read)
         result = bytearray()
-        while bytes_to_read > 0:
-            chunk_size = min(bytes_to_read, block_size)
-            result += await self.read_memory_block(start_address, chunk_size)
-            start_address += chunk_size
-            bytes_to_read -= chunk_size
+        for address, _size in chunks:
+            result += blocks[address]
         return result
 
+    async def _read_blocks_pipelined(
+        self,
+        chunks: list[tuple[int, int]],
+        window: int,
+        blocks: dict[int, bytes],
+    ) -> None:
+        """Read ``chunks`` keeping up to ``window`` commands outstanding.
+
+        Completed blocks are stored in ``blocks`` as they arrive, so a caller
+        recovering from a failure only has to re-read what is missing. Replies
+        are matched through the session's reply multiplexer; the device answers
+        in order, so the oldest outstanding read is the one that gets the
+        timeout and retransmit.
+        """
+        pending = list(reversed(chunks))
+        # address -> (plaintext command, attempts, reply future, sent at); oldest first.
+        in_flight: dict[
+            int, tuple[bytearray, int, asyncio.Future[_MemoryReply], float]
+        ] = {}
+        rtt = link_tuning_for(self.address).rtt
+        last_reply_at = 0.0
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < window:
+                    address, size = pending.pop()
+                    command = encode_read(address, size)
+                    future = self._expect_reply(self._reply_key(command))
+                    in_flight[address] = (command, 1, future, time.monotonic())
+                    await self._transmit_command(command)
+
+                address = next(iter(in_flight))
+                command, attempts, future, sent_at = in_flight[address]
+                try:
+                    reply = await asyncio.wait_for(
+                        asyncio.shield(future), self._reply_timeout(attempts - 1)
+                    )
+                except asyncio.TimeoutError:
+                    self._check_budget("pipelined read retransmit")
+                    self._link_faults += 1
+                    self._require_connected("pipelined EEPROM read")
+                    if attempts >= _MEMORY_PROTOCOL_TX_MAX_RETRIES:
+                        raise ConnectionError(
+                            f"No reply to pipelined read at 0x{address:04X} after "
+                            f"{attempts} attempts"
+                        ) from None
+                    _LOGGER.debug(
+                        "Pipelined read timeout at 0x%04X (attempt %d/%d); retransmitting",
+                        address,
+                        attempts,
+                        _MEMORY_PROTOCOL_TX_MAX_RETRIES,
+                    )
+                    # The future stays registered, so a late reply to the first
+                    # transmission is as good as one to the retransmission.
+                    in_flight[address] = (command, attempts + 1, future, time.monotonic())
+                    await self._transmit_command(command)
+                    continue
+                del in_flight[address]
+                if attempts == 1:
+                    # Replies come back in order, so a read queued behind others
+                    # only starts its round trip once the previous reply is out.
+                    rtt.observe(reply.received_at - max(sent_at, last_reply_at))
+                last_reply_at = reply.received_at
+                self._pending_replies.pop(self._reply_key(command), None)
+                self._raise_for_error_frame(reply, command)
+                blocks[address] = reply.payload
+        finally:
+            for command, _attempts, future, _sent_at in in_flight.values():
+                key = self._reply_key(command)
+                if self._pending_replies.get(key) is future:
+                    del self._pending_replies[key]
+                if not future.done():
+                    future.cancel()
+
+    async def prefetch(
+        self,
+        ranges: Iterable[tuple[int, int]],
+        optional: Iterable[tuple[int, int]] = (),
+    ) -> None:
+        """Read the ``(address, length)`` ranges a poll needs in coalesced reads.
+
+        Overlapping and nearby ranges are merged within ``read_block_size``
+        (``optional`` ones only where they come for free, see
+        ``coalesce_ranges``). ``read_memory_range`` then serves every range
+        the reads cover from this buffer until the memory session closes;
+        ``write_memory_range`` keeps it current.
+        """
+        buffer = TransferCheckpoint()
+        self._poll_buffer = None
+        for address, length in coalesce_ranges(ranges, self.read_block_size, optional):
+            buffer.add(address, await self.read_memory_range(address, length))
+        self._poll_buffer = buffer
+
     async def write_memory_range(
         self, start_address: int, data: bytearray, block_size: int = 0x08
     ) -> None:
         """Write continuous data to EEPROM in blocks."""
-        while len(data) > 0:
-            chunk_size = min(len(data), block_size)
-            await self.write_memory_block(start_address, data[:chunk_size])
-            data = data[chunk_size:]
-            start_address += chunk_size
+        written = (start_address, bytes(data))
+        try:
+            while len(data) > 0:
+                chunk_size = min(len(data), block_size)
+                await self.write_memory_block(start_address, data[:chunk_size])
+                data = data[chunk_size:]
+                start_address += chunk_size
+        except BaseException:
+            # Part of the range may have been written: prefetched bytes are stale.
+            self._poll_buffer = None
+            raise
+        if self._poll_buffer is not None:
+            self._poll_buffer.patch(*written)
 
     async def _maybe_send_unlock_probe(
         self,
@@ -1370,10 +2187,10 @@ class OmronDeviceSession:
         unlock_event.clear()
         response_holder[0] = None
         try:
-            await self._client.write_gatt_char(
+            await self._write_char(
                 self._config.unlock_uuid, b'\x02' + b'\x00' * 16, response=True
             )
-            await asyncio.wait_for(unlock_event.wait(), timeout=_UNLOCK_PROBE_WAIT_TIMEOUT_SEC)
+            await self.wait_on_link(unlock_event.wait(), _UNLOCK_PROBE_WAIT_TIMEOUT_SEC)
         except Exception:
             pass
 
@@ -1417,28 +2234,31 @@ class OmronDeviceSession:
 
         # Match pairing flow: briefly prime RX notify so stacks that require
         # a security request trigger can establish encrypted notify reliably.
-        try:
-            await self._client.start_notify(
-                self._config.rx_channel_uuids[0], lambda _h, _d: None
-            )
-            rx_notify_primed = True
-            await asyncio.sleep(_NOTIFY_SUBSCRIBE_SETTLE_SEC)
-        except Exception as exc:
-            _LOGGER.debug("unlock RX pre-notify prime skipped: %s", exc)
-
-        self._debug_ble_link("unlock_before_notify")
-        await self._client.start_notify(self._config.unlock_uuid, _unlock_callback)
-        await asyncio.sleep(_NOTIFY_SUBSCRIBE_SETTLE_SEC)
+        # Not needed (and its stop would drop channel 0) while the link
+        # already holds the RX subscriptions.
+        if not self._rx_notify_held:
+            try:
+                await self._start_notify(
+                    self._config.rx_channel_uuids[0], lambda _h, _d: None
+                )
+                rx_notify_primed = True
+                await asyncio.sleep(_NOTIFY_SUBSCRIBE_SETTLE_SEC)
+            except Exception as exc:
+                _LOGGER.debug("unlock RX pre-notify prime skipped: %s", exc)
+
+        self._debug_ble_link("unlock_before_notify")
+        await self._start_notify(self._config.unlock_uuid, _unlock_callback)
+        await asyncio.sleep(_NOTIFY_SUBSCRIBE_SETTLE_SEC)
         try:
             # Some classic custom-key models are more stable with a 0x02 probe before auth-key unlock.
             await self._maybe_send_unlock_probe(unlock_event, response_holder)
 
             unlock_event.clear()
             response_holder[0] = None
-            await self._client.write_gatt_char(
+            await self._write_char(
                 self._config.unlock_uuid, b'\x01' + unlock_key, response=True
             )
-            await asyncio.wait_for(unlock_event.wait(), timeout=_UNLOCK_AUTH_WAIT_TIMEOUT_SEC)
+            await self.wait_on_link(unlock_event.wait(), _UNLOCK_AUTH_WAIT_TIMEOUT_SEC)
 
             response = response_holder[0]
             if not _is_unlock_auth_key_ack(response):
@@ -1454,10 +2274,10 @@ class OmronDeviceSession:
             self._debug_ble_link("unlock_notify_timeout")
             raise ConnectionError("Unlock failed: notify timeout") from None
         finally:
-            await self._client.stop_notify(self._config.unlock_uuid)
+            await self._stop_notify(self._config.unlock_uuid)
             if rx_notify_primed:
                 try:
-                    await self._client.stop_notify(self._config.rx_channel_uuids[0])
+                    await self._stop_notify(self._config.rx_channel_uuids[0])
                 except Exception as exc:
                     _LOGGER.debug("unlock RX pre-notify stop skipped: %s", exc)
             self._debug_ble_link("unlock_after_stop_notify")
@@ -1509,17 +2329,19 @@ class OmronDeviceSession:
         await self._ensure_services_cache()
 
         # Official app: RX notify CCCD (h=33) before unlock CCCD (h=28).
-        try:
-            await self._client.start_notify(
-                self._config.rx_channel_uuids[0], lambda _h, _d: None
-            )
-            rx_notify_primed = True
-            await asyncio.sleep(_NOTIFY_SUBSCRIBE_SETTLE_SEC)
-        except Exception as exc:
-            _LOGGER.debug("token unlock RX pre-notify prime skipped: %s", exc)
+        # Already enabled when the link holds the RX subscriptions.
+        if not self._rx_notify_held:
+            try:
+                await self._start_notify(
+                    self._config.rx_channel_uuids[0], lambda _h, _d: None
+                )
+                rx_notify_primed = True
+                await asyncio.sleep(_NOTIFY_SUBSCRIBE_SETTLE_SEC)
+            except Exception as exc:
+                _LOGGER.debug("token unlock RX pre-notify prime skipped: %s", exc)
 
         self._debug_ble_link("token_unlock_before_notify")
-        await self._client.start_notify(self._config.unlock_uuid, _unlock_dispatch)
+        await self._start_notify(self._config.unlock_uuid, _unlock_dispatch)
         await asyncio.sleep(_NOTIFY_SUBSCRIBE_SETTLE_SEC)
         try:
             unlock_event.clear()
@@ -1532,13 +2354,11 @@ class OmronDeviceSession:
                     token.hex(),
                     use_response,
                 )
-                await self._client.write_gatt_char(
+                await self._write_char(
                     self._config.unlock_uuid, packet, response=use_response
                 )
                 try:
-                    await asyncio.wait_for(
-                        unlock_event.wait(), timeout=_UNLOCK_AUTH_WAIT_TIMEOUT_SEC
-                    )
+                    await self.wait_on_link(unlock_event.wait(), _UNLOCK_AUTH_WAIT_TIMEOUT_SEC)
                     break
                 except asyncio.TimeoutError:
                     if use_response:
@@ -1570,12 +2390,12 @@ class OmronDeviceSession:
                 self._debug_ble_link("token_unlock_keep_notify")
             else:
                 try:
-                    await self._client.stop_notify(self._config.unlock_uuid)
+                    await self._stop_notify(self._config.unlock_uuid)
                 except Exception as exc:
                     _LOGGER.debug("token unlock stop_notify skipped: %s", exc)
                 if rx_notify_primed:
                     try:
-                        await self._client.stop_notify(self._config.rx_channel_uuids[0])
+                        await self._stop_notify(self._config.rx_channel_uuids[0])
                     except Exception as exc:
                         _LOGGER.debug("token unlock RX pre-notify stop skipped: %s", exc)
                 self._debug_ble_link("token_unlock_after_stop_notify")
@@ -1623,10 +2443,10 @@ class OmronDeviceSession:
             _LOGGER.debug("Sending Pairing Request (len=%d): %s", len(pair_req), pair_req.hex())
             unlock_event.clear()
             response_holder[0] = None
-            await self._client.write_gatt_char(self._config.unlock_uuid, pair_req, response=True)
+            await self._write_char(self._config.unlock_uuid, pair_req, response=True)
             
             # Wait for Pairing Response
-            await asyncio.wait_for(unlock_event.wait(), timeout=_SECURE_HANDSHAKE_WAIT_TIMEOUT_SEC)
+            await self.wait_on_link(unlock_event.wait(), _SECURE_HANDSHAKE_WAIT_TIMEOUT_SEC)
             pair_resp = response_holder[0]
             _LOGGER.debug("Received Pairing Response (len=%d): %s", len(pair_resp) if pair_resp else 0, pair_resp.hex() if pair_resp else "None")
             if not pair_resp:
@@ -1656,10 +2476,10 @@ class OmronDeviceSession:
             _LOGGER.debug("Sending Encryption Start Request (len=%d): %s", len(start_enc_req), start_enc_req.hex())
             unlock_event.clear()
             response_holder[0] = None
-            await self._client.write_gatt_char(self._config.unlock_uuid, start_enc_req, response=True)
+            await self._write_char(self._config.unlock_uuid, start_enc_req, response=True)
 
             # Wait for Encryption Response
-            await asyncio.wait_for(unlock_event.wait(), timeout=_SECURE_HANDSHAKE_WAIT_TIMEOUT_SEC)
+            await self.wait_on_link(unlock_event.wait(), _SECURE_HANDSHAKE_WAIT_TIMEOUT_SEC)
             enc_resp = response_holder[0]
             _LOGGER.debug("Received Encryption Response (len=%d): %s", len(enc_resp) if enc_resp else 0, enc_resp.hex() if enc_resp else "None")
             if not enc_resp:
@@ -1678,10 +2498,10 @@ class OmronDeviceSession:
             _LOGGER.debug("Sending Challenge Request (len=%d): %s", len(challenge_req), challenge_req.hex())
             unlock_event.clear()
             response_holder[0] = None
-            await self._client.write_gatt_char(self._config.unlock_uuid, challenge_req, response=True)
+            await self._write_char(self._config.unlock_uuid, challenge_req, response=True)
 
             # Wait for Challenge Response
-            await asyncio.wait_for(unlock_event.wait(), timeout=_SECURE_HANDSHAKE_WAIT_TIMEOUT_SEC)
+            await self.wait_on_link(unlock_event.wait(), _SECURE_HANDSHAKE_WAIT_TIMEOUT_SEC)
             challenge_resp = response_holder[0]
             _LOGGER.debug("Received Challenge Response (len=%d): %s", len(challenge_resp) if challenge_resp else 0, challenge_resp.hex() if challenge_resp else "None")
             if not challenge_resp:
@@ -1709,15 +2529,17 @@ class OmronDeviceSession:
         finally:
             self._unlock_notify_handler = None
             try:
-                await self._client.stop_notify(self._config.unlock_uuid)
+                await self._stop_notify(self._config.unlock_uuid)
             except Exception as exc:
                 _LOGGER.debug("secure unlock stop_notify skipped: %s", exc)
             # _token_unlock(keep_notify=True) left the RX-channel CCCD enabled
-            # for us; release it here so it doesn't outlive the handshake.
-            try:
-                await self._client.stop_notify(self._config.rx_channel_uuids[0])
-            except Exception as exc:
-                _LOGGER.debug("secure unlock RX notify stop skipped: %s", exc)
+            # for us; release it here so it doesn't outlive the handshake,
+            # unless it belongs to the link's RX subscriptions.
+            if not self._rx_notify_held:
+                try:
+                    await self._stop_notify(self._config.rx_channel_uuids[0])
+                except Exception as exc:
+                    _LOGGER.debug("secure unlock RX notify stop skipped: %s", exc)
 
     async def _pair_os_bonding(self) -> None:
         """Best-effort OS-level BLE bond establishment for modern profiles."""
@@ -1734,6 +2556,8 @@ class OmronDeviceSession:
                 _LOGGER.debug("Post-bond service refresh failed (continuing): %s", refresh_exc)
 
         for attempt in range(1, max_attempts + 1):
+            if attempt > 1:
+                self._check_budget("bonding retry")
             try:
                 if attempt > 1:
                     await asyncio.sleep(_OS_BOND_RETRY_DELAY_SEC)
@@ -1803,13 +2627,17 @@ class OmronDeviceSession:
             unlock_attempts, unlock_retry_delay = _PAIR_UNLOCK_ATTEMPTS_DEFAULT, _PAIRING_SETTLE_DEFAULT_SEC
             key_max_retries = 5
 
-        _LOGGER.debug("Enabling RX notification to trigger BLE pairing")
-        try:
-            await self._client.start_notify(
-                self._config.rx_channel_uuids[0], lambda h, d: None
-            )
-        except Exception as exc:
-            _LOGGER.debug("Ignored error starting RX notify: %s", exc)
+        # A link that holds the RX subscriptions has channel 0 enabled
+        # already; priming (and later stopping) it here would drop it from them.
+        rx_notify_held = self._rx_notify_held
+        if not rx_notify_held:
+            _LOGGER.debug("Enabling RX notification to trigger BLE pairing")
+            try:
+                await self._start_notify(
+                    self._config.rx_channel_uuids[0], lambda h, d: None
+                )
+            except Exception as exc:
+                _LOGGER.debug("Ignored error starting RX notify: %s", exc)
 
         await self._apply_pairing_settle_delay(aggressive_timing)
 
@@ -1823,7 +2651,7 @@ class OmronDeviceSession:
         unlock_subscribed = False
         for attempt in range(unlock_attempts):
             try:
-                await self._client.start_notify(self._config.unlock_uuid, _pair_callback)
+                await self._start_notify(self._config.unlock_uuid, _pair_callback)
                 unlock_subscribed = True
                 break
             except Exception as exc:
@@ -1870,7 +2698,7 @@ class OmronDeviceSession:
             prog_event.clear()
             response_holder[0] = None
             try:
-                await self._client.write_gatt_char(
+                await self._write_char(
                     self._config.unlock_uuid, b'\x02' + b'\x00' * 16, response=True
                 )
             except Exception as exc:
@@ -1878,7 +2706,7 @@ class OmronDeviceSession:
                 _LOGGER.debug("Key programming write attempt %d failed: %s", attempt + 1, exc)
 
             try:
-                await asyncio.wait_for(prog_event.wait(), timeout=_PAIRING_PROG_WAIT_TIMEOUT_SEC)
+                await self.wait_on_link(prog_event.wait(), _PAIRING_PROG_WAIT_TIMEOUT_SEC)
             except asyncio.TimeoutError:
                 pass
 
@@ -1901,8 +2729,9 @@ class OmronDeviceSession:
 
         if not entered_programming:
             try:
-                await self._client.stop_notify(self._config.unlock_uuid)
-                await self._client.stop_notify(self._config.rx_channel_uuids[0])
+                await self._stop_notify(self._config.unlock_uuid)
+                if not rx_notify_held:
+                    await self._stop_notify(self._config.rx_channel_uuids[0])
             except Exception:
                 pass
             _LOGGER.error(
@@ -1925,21 +2754,22 @@ class OmronDeviceSession:
         prog_event.clear()
         response_holder[0] = None
         try:
-            await self._client.write_gatt_char(
+            await self._write_char(
                 self._config.unlock_uuid, b'\x00' + pair_key, response=True
             )
         except Exception as exc:
             _LOGGER.error("Failed to write new key: %s", exc)
 
         try:
-            await asyncio.wait_for(prog_event.wait(), timeout=_PAIRING_KEY_ACK_WAIT_TIMEOUT_SEC)
+            await self.wait_on_link(prog_event.wait(), _PAIRING_KEY_ACK_WAIT_TIMEOUT_SEC)
         except asyncio.TimeoutError:
             pass
 
         resp = response_holder[0]
         try:
-            await self._client.stop_notify(self._config.unlock_uuid)
-            await self._client.stop_notify(self._config.rx_channel_uuids[0])
+            await self._stop_notify(self._config.unlock_uuid)
+            if not rx_notify_held:
+                await self._stop_notify(self._config.rx_channel_uuids[0])
         except Exception:
             pass
 
@@ -2131,6 +2961,34 @@ class OmronDeviceDriver:
         self._cached_settings: bytearray | None = None
         self._now_func = dt.datetime.now
         self._counter_probe_logged = False
+        # Record bytes read by earlier (possibly interrupted) sessions, valid
+        # while the index block's write cursors are unchanged.
+        self._checkpoint = TransferCheckpoint()
+        # Optional persistent copy of the record regions (set by the
+        # integration); when present get_all_records only reads new slots.
+        self.mirror: EepromMirror | None = None
+        # (index snapshot, candidates, confirmed-empty users) from the last
+        # completed index probe; reused while the snapshot is unchanged.
+        self._index_probe_cache: (
+            tuple[tuple[Any, ...], list[tuple[int, dict[str, Any]]], frozenset[int]] | None
+        ) = None
+        # Snapshot of the index block read by the current poll (None if it
+        # was not read successfully).
+        self._last_index_snapshot: tuple[tuple[int, int | None], ...] | None = None
+        # Advertised per-user sequence numbers with the write slot each user
+        # was at when they were seen, and the per-user result returned then;
+        # lets the next poll read only the slots the advert says are new.
+        self._sequence_anchor: tuple[tuple[int, ...], tuple[int | None, ...]] | None = None
+        # Backtrack depth each recent index probe needed (first plausible
+        # slot, extended over a TruRead sequence).
+        self._backtrack_depths: collections.deque[int] = collections.deque(
+            maxlen=_BACKTRACK_DEPTH_HISTORY
+        )
+        self._latest_by_user: dict[int, dict[str, Any]] = {}
+        # Path that produced the last latest-record result ("sequence",
+        # "index", "ring_search", "full_scan", or "mixed" when the per-user
+        # result combines index and full-scan users; None if none did).
+        self.last_record_source: str | None = None
 
     async def sync_eeprom_time(
         self, transport: OmronDeviceSession, now: dt.datetime | None = None
@@ -2265,6 +3123,61 @@ class OmronDeviceDriver:
         result.pop("_offset", None)
         return result
 
+    def poll_read_plan(
+        self,
+        *,
+        sequence_numbers: Sequence[int] | None = None,
+        time_sync: bool = False,
+    ) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+        """``(required, optional)`` EEPROM ranges the next poll is expected to read.
+
+        Required: the time-sync window (with ``time_sync``), the record slots
+        the advertised sequence numbers point at, and the index block unless
+        those slots make it unnecessary; it is optional then.
+        """
+        required: list[tuple[int, int]] = []
+        optional: list[tuple[int, int]] = []
+        read_addr = self._config.settings_read_address
+        sync_range = self._config.settings_time_sync_bytes
+        if (
+            time_sync
+            and self._config.supports_eeprom_time_sync
+            and read_addr is not None
+            and sync_range is not None
+        ):
+            required.append((read_addr + sync_range[0], sync_range[1] - sync_range[0]))
+
+        slots_by_user = (
+            self._sequence_slots(sequence_numbers) if sequence_numbers else None
+        )
+        if slots_by_user:
+            layout = self._config.index_pointer_layout or {}
+            record_byte_size = int(layout.get("record_byte_size", self._config.record_byte_size))
+            for slot_reads in slots_by_user.values():
+                required.extend((address, record_byte_size) for _, address in slot_reads)
+
+        layout = self._config.index_pointer_layout
+        index_size = int(layout.get("index_region_byte_size", 0)) if layout else 0
+        if read_addr is not None and index_size > 0:
+            (optional if slots_by_user else required).append((read_addr, index_size))
+        return required, optional
+
+    async def prefetch_poll_reads(
+        self,
+        transport: OmronDeviceSession,
+        *,
+        sequence_numbers: Sequence[int] | None = None,
+        time_sync: bool = False,
+    ) -> None:
+        """Fetch ``poll_read_plan`` in coalesced block reads for the poll to reuse."""
+        required, optional = self.poll_read_plan(
+            sequence_numbers=sequence_numbers, time_sync=time_sync
+        )
+        if not required:
+            return
+        await transport.unlock()
+        await transport.prefetch(required, optional)
+
     async def get_all_records(
         self, transport: OmronDeviceSession
     ) -> list[list[dict[str, Any]]]:
@@ -2272,10 +3185,33 @@ class OmronDeviceDriver:
 
         Returns a list of lists: [[user1_records], [user2_records], ...]
         """
-        await transport.unlock()
+        num_users = self._config.num_users
+        records_by_user = await self.get_user_records(transport, range(1, num_users + 1))
+        return [records_by_user[user] for user in range(1, num_users + 1)]
 
-        all_user_records = []
-        for user_idx in range(self._config.num_users):
+    async def get_user_records(
+        self, transport: OmronDeviceSession, users: Iterable[int]
+    ) -> dict[int, list[dict[str, Any]]]:
+        """Read all records of the given users (1-based) and no other region.
+
+        Returns ``{user: [records]}`` for every configured user requested.
+        """
+        user_indices = sorted(
+            {user - 1 for user in users if 1 <= user <= self._config.num_users}
+        )
+        if not user_indices:
+            return {}
+        await transport.unlock()
+        regions = await self._sync_mirror(transport, user_indices)
+        if regions is not None:
+            return {
+                user_idx + 1: self._parse_user_records(region, user_idx)
+                for user_idx, region in regions.items()
+            }
+        checkpoint = await self._resume_checkpoint(transport)
+
+        records_by_user: dict[int, list[dict[str, Any]]] = {}
+        for user_idx in user_indices:
             start_addr = self._config.user_start_addresses[user_idx]
             total_bytes = (
                 self._config.per_user_records_count[user_idx]
@@ -2283,32 +3219,76 @@ class OmronDeviceDriver:
             )
 
             raw_data = await transport.read_memory_range(
-                start_addr, total_bytes, self._config.transmission_block_size
+                start_addr, total_bytes, checkpoint=checkpoint
             )
 
-            records = self._parse_user_records(raw_data, user_idx)
-            all_user_records.append(records)
+            records_by_user[user_idx + 1] = self._parse_user_records(raw_data, user_idx)
 
-        return all_user_records
+        return records_by_user
 
     async def get_latest_record(
-        self, transport: OmronDeviceSession
+        self,
+        transport: OmronDeviceSession,
+        *,
+        sequence_numbers: Sequence[int] | None = None,
     ) -> dict[str, Any] | None:
-        """Read latest record using index first, then fallback to full scan."""
+        """Read latest record using index first, then fallback to full scan.
+
+        With advertised ``sequence_numbers`` the slots they announce are read
+        directly first (see ``_get_latest_via_sequence``).
+        """
+        self.last_record_source = None
+        if sequence_numbers:
+            targeted = await self._get_latest_via_sequence(transport, sequence_numbers)
+            if targeted:
+                _, record = max(
+                    targeted.items(),
+                    key=lambda item: item[1].get("datetime", dt.datetime.min),
+                )
+                self.last_record_source = "sequence"
+                return dict(record)
+        self._last_index_snapshot = None
         indexed = await self._get_latest_via_index(transport)
         if indexed is not None:
+            self._remember_sequence_anchor(
+                sequence_numbers, {int(indexed.get("user", 1)): indexed}
+            )
+            self.last_record_source = "index"
             return indexed
+        searched, record = await self._get_latest_via_ring_search(transport)
+        if searched:
+            self.last_record_source = "ring_search" if record is not None else None
+            return record
+        budget: DeadlineBudget | None = getattr(transport, "budget", None)
+        if budget is not None and not budget.allows(_FULL_SCAN_MIN_BUDGET_SEC):
+            _LOGGER.debug(
+                "%s index path did not yield a latest record; %.1fs of poll budget "
+                "left, skipping the full-scan fallback",
+                self._config.model,
+                budget.remaining(),
+            )
+            return None
         _LOGGER.debug(
             "%s index path did not yield a valid latest record; falling back to full scan",
             self._config.model,
         )
-        return await self._get_latest_via_full_scan(transport)
+        record = await self._get_latest_via_full_scan(transport)
+        self.last_record_source = "full_scan" if record is not None else None
+        return record
 
     async def get_latest_records_per_user(
-        self, transport: OmronDeviceSession
+        self,
+        transport: OmronDeviceSession,
+        *,
+        sequence_numbers: Sequence[int] | None = None,
     ) -> dict[int, dict[str, Any]]:
         """Return latest valid record per configured user index (1-based).
 
+        When the advertisement carried per-user ``sequence_numbers`` and an
+        earlier poll anchored them to write slots, only the newly announced
+        slots are read (no index block); any mismatch falls back to the
+        index path below.
+
         Tries the index-based fast path first.  If the index covers all expected
         users the result is returned immediately.  When only a subset of users has
         a valid index entry the partial result is kept and a full-scan fallback
@@ -2323,6 +3303,26 @@ class OmronDeviceDriver:
         100-slot users) and tends to produce spurious TX timeouts as the
         device runs out of payload to send back.
         """
+        self.last_record_source = None
+        if sequence_numbers:
+            targeted = await self._get_latest_via_sequence(transport, sequence_numbers)
+            if targeted is not None:
+                self.last_record_source = "sequence"
+                return targeted
+        self._last_index_snapshot = None
+        latest_by_user = await self._get_latest_records_per_user_indexed(transport)
+        self._remember_sequence_anchor(sequence_numbers, latest_by_user)
+        if latest_by_user and self.last_record_source is None:
+            self.last_record_source = "index"
+        return latest_by_user
+
+    async def _get_latest_records_per_user_indexed(
+        self, transport: OmronDeviceSession
+    ) -> dict[int, dict[str, Any]]:
+        """Index probe per user, full-scan fallback for the users it missed.
+
+        Sets ``last_record_source`` when the fallback supplied any user.
+        """
         latest_by_user: dict[int, dict[str, Any]] = {}
         expected_user_count = len(self._config.per_user_records_count)
 
@@ -2378,13 +3378,10 @@ class OmronDeviceDriver:
             self._config.model,
             sorted(scan_required_users),
         )
-        # Full-scan fallback — only processes users absent from latest_by_user
-        # *and* not in ``confirmed_empty_users``.
-        all_user_records = await self.get_all_records(transport)
-        for user_idx, user_records in enumerate(all_user_records):
-            user = user_idx + 1
-            if user not in scan_required_users:
-                continue
+        # Full-scan fallback — only reads the regions of users absent from
+        # latest_by_user *and* not in ``confirmed_empty_users``.
+        records_by_user = await self.get_user_records(transport, scan_required_users)
+        for user, user_records in sorted(records_by_user.items()):
             if not user_records:
                 continue
             selected = self._select_latest_candidate([(user, rec) for rec in user_records])
@@ -2392,8 +3389,239 @@ class OmronDeviceDriver:
                 continue
             _, record = selected
             latest_by_user[user] = self._finalize_public_latest_record(record, user)
+            self.last_record_source = "mixed" if indexed_candidates else "full_scan"
         return latest_by_user
 
+    async def get_records_since(
+        self,
+        transport: OmronDeviceSession,
+        cursor_state: Sequence[tuple[int, str | None] | None] | None,
+    ) -> tuple[list[dict[str, Any]], tuple[tuple[int, str | None] | None, ...]]:
+        """Return every record written since ``cursor_state`` and the new cursor state.
+
+        ``cursor_state`` holds, per user, the raw write cursor and the hex
+        bytes of the newest slot as returned by the previous call; persist it
+        between polls. For each user only the slots between the old and the
+        current write cursor are read, oldest first and wrapping round the
+        ring, together with the slot that was newest last time. After a
+        memory clear or a ring overrun the cursor delta can look like an
+        ordinary one, but that slot no longer matches; the user's whole ring
+        is then read instead, as it is when no slot bytes were stored.
+        A user without a previous entry (or ``cursor_state=None``) only gets
+        a baseline: no records are returned for them.
+
+        Records are ordered per user, oldest first, and carry ``user``.
+        Raises ValueError if the profile has no usable index pointer layout.
+        """
+        layout = self._config.index_pointer_layout
+        index_region_byte_size = int((layout or {}).get("index_region_byte_size", 0))
+        if (
+            layout is None
+            or self._config.settings_read_address is None
+            or index_region_byte_size <= 0
+        ):
+            raise ValueError(f"{self._config.model} has no index pointer layout")
+
+        await transport.unlock()
+        index_bytes = await transport.read_memory_range(
+            self._config.settings_read_address, index_region_byte_size
+        )
+        cursors = self._write_cursors(index_bytes)
+        if cursors is None:
+            raise ValueError(f"{self._config.model} index pointer layout is incomplete")
+        checkpoint = await self._resume_checkpoint(transport, index_bytes)
+
+        previous = list(cursor_state or [])
+        num_users = min(
+            len(cursors),
+            len(layout.get("record_addresses") or self._config.user_start_addresses),
+            len(self._config.per_user_records_count),
+        )
+
+        records: list[dict[str, Any]] = []
+        state: list[tuple[int, str | None] | None] = []
+        for user_idx in range(num_users):
+            old = previous[user_idx] if user_idx < len(previous) else None
+            old_raw, old_newest = old if old is not None else (None, None)
+            new_slot = self._cursor_slot(user_idx, cursors[user_idx])
+            if new_slot is None:
+                state.append((cursors[user_idx], None))
+                continue
+            if old_raw == cursors[user_idx] and old_newest is not None:
+                state.append((old_raw, old_newest))
+                continue
+            pointer_min = int(layout["users"][user_idx].get("slot_index_min", 0))
+            count = self._ring_slot_count(user_idx)
+            newest = new_slot - pointer_min
+            if old is None:
+                raw = await self._read_ring_slots(transport, user_idx, [newest], checkpoint)
+                state.append((cursors[user_idx], raw[newest].hex()))
+                continue
+
+            slots = None
+            if old_newest is not None:
+                slots = self._slots_written_between(user_idx, old_raw, cursors[user_idx])
+            raw = None
+            if slots:
+                anchor = (slots[0] - 1) % count
+                raw = await self._read_ring_slots(
+                    transport, user_idx, [anchor, *slots], checkpoint
+                )
+                if raw[anchor].hex() != old_newest:
+                    _LOGGER.debug(
+                        "Delta sync [%s] user%d: newest synced slot %d changed "
+                        "(memory cleared or ring overrun?); reading the whole ring",
+                        self._config.model, user_idx + 1, anchor,
+                    )
+                    slots = None
+            if slots is None:
+                # Whole ring, oldest slot (the one after the newest) first.
+                slots = [(newest + step) % count for step in range(1, count + 1)]
+                raw = await self._read_ring_slots(transport, user_idx, slots, checkpoint)
+            state.append((cursors[user_idx], raw[newest].hex()))
+
+            record_byte_size = int(layout.get("record_byte_size", self._config.record_byte_size))
+            user_records = [
+                self._finalize_public_latest_record(record, user_idx + 1)
+                for record in self._parse_user_records(
+                    bytearray(b"".join(raw[slot] for slot in slots)),
+                    user_idx,
+                    record_byte_size,
+                )
+            ]
+            _LOGGER.debug(
+                "Delta sync [%s] user%d: cursor 0x%04X -> 0x%04X, %d slot(s) read, %d record(s)",
+                self._config.model, user_idx + 1, old_raw, cursors[user_idx],
+                len(slots), len(user_records),
+            )
+            records.extend(user_records)
+        return records, tuple(state)
+
+    async def _read_ring_slots(
+        self,
+        transport: OmronDeviceSession,
+        user_idx: int,
+        slots: list[int],
+        checkpoint: TransferCheckpoint | None,
+    ) -> dict[int, bytes]:
+        """Raw bytes of ``user_idx``'s logical ring ``slots``, one range read per run."""
+        layout = self._config.index_pointer_layout or {}
+        record_addresses = layout.get("record_addresses") or self._config.user_start_addresses
+        record_byte_size = int(layout.get("record_byte_size", self._config.record_byte_size))
+        record_step = int(layout.get("record_step", record_byte_size))
+        base_addr = int(record_addresses[user_idx])
+        runs = (
+            _slot_runs(slots)
+            if record_step == record_byte_size
+            else [(slot, 1) for slot in slots]
+        )
+        raw: dict[int, bytes] = {}
+        for first, length in runs:
+            data = await transport.read_memory_range(
+                base_addr + first * record_step,
+                length * record_byte_size,
+                checkpoint=checkpoint,
+            )
+            for i in range(length):
+                raw[first + i] = bytes(data[i * record_byte_size:(i + 1) * record_byte_size])
+        return raw
+
+    async def _get_latest_via_ring_search(
+        self, transport: OmronDeviceSession
+    ) -> tuple[bool, dict[str, Any] | None]:
+        """Latest record across users, each located by ``_search_newest_slot``.
+
+        Returns ``(searched, record)``; ``searched`` is False when any user's
+        ring does not look time-ordered, so the caller falls back to the
+        full scan. ``(True, None)`` means every ring is empty.
+        """
+        await transport.unlock()
+        candidates: list[tuple[int, dict[str, Any]]] = []
+        for user_idx in range(self._config.num_users):
+            try:
+                found, record = await self._search_newest_slot(transport, user_idx)
+            except Exception as exc:
+                _LOGGER.debug(
+                    "Ring search [%s] user%d failed: %s", self._config.model, user_idx + 1, exc
+                )
+                return False, None
+            if not found:
+                return False, None
+            if record is not None:
+                candidates.append((user_idx + 1, record))
+        selected = self._select_latest_candidate(candidates)
+        if selected is None:
+            return True, None
+        user, record = selected
+        return True, self._finalize_public_latest_record(record, user)
+
+    async def _search_newest_slot(
+        self, transport: OmronDeviceSession, user_idx: int
+    ) -> tuple[bool, dict[str, Any] | None]:
+        """Binary-search ``user_idx``'s record ring for the newest record.
+
+        Slots are written in time order from slot 0 and wrap, so the ring is
+        a rotated sorted array: every slot up to the newest one compares
+        ``>=`` slot 0, every slot after it (older or still empty) compares
+        lower. Needs about log2(N) + 2 slot reads instead of N.
+
+        The slot after the newest one must be empty (all 0xFF) or older;
+        anything else (a corrupt slot, a clock reset) may have stopped the
+        search early. Returns ``(found, record)``: ``(True, None)`` for an
+        empty ring, ``(False, None)`` when the ordering cannot be trusted.
+        """
+        count = self._config.per_user_records_count[user_idx]
+        base_addr = self._config.user_start_addresses[user_idx]
+        record_byte_size = self._config.record_byte_size
+        keys: dict[int, tuple[dt.datetime, int] | None] = {}
+        records: dict[int, dict[str, Any]] = {}
+        unreadable: set[int] = set()
+
+        async def _key(slot: int) -> tuple[dt.datetime, int] | None:
+            if slot not in keys:
+                raw = await transport.read_memory_range(
+                    base_addr + slot * record_byte_size, record_byte_size
+                )
+                parsed = self._parse_user_records(raw, user_idx)
+                if parsed:
+                    parsed[0]["_slot_index"] = slot
+                    records[slot] = parsed[0]
+                    keys[slot] = (parsed[0]["datetime"], parsed[0].get("_record_id", -1))
+                else:
+                    keys[slot] = None
+                    if any(b != 0xFF for b in raw):
+                        unreadable.add(slot)
+            return keys[slot]
+
+        if count <= 0:
+            return True, None
+        first = await _key(0)
+        if first is None:
+            # Writing starts at slot 0; an empty slot 0 means an empty ring.
+            return True, None
+        lo, hi = 0, count - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            key = await _key(mid)
+            if key is not None and key >= first:
+                lo = mid
+            else:
+                hi = mid - 1
+        newest = keys[lo]
+        following_slot = (lo + 1) % count
+        following = await _key(following_slot) if count > 1 else None
+        if following_slot in unreadable or (following is not None and following > newest):
+            _LOGGER.debug(
+                "Ring search [%s] user%d: slots are not time-ordered around slot %d",
+                self._config.model, user_idx + 1, lo,
+            )
+            return False, None
+        _LOGGER.debug(
+            "Ring search [%s] user%d: newest slot=%d after %d read(s)",
+            self._config.model, user_idx + 1, lo, len(keys),
+        )
+        return True, records[lo]
+
     async def _get_latest_via_full_scan(
         self, transport: OmronDeviceSession
     ) -> dict[str, Any] | None:
@@ -2410,6 +3638,598 @@ class OmronDeviceDriver:
         user, record = selected
         return self._finalize_public_latest_record(record, user)
 
+    def _remember_sequence_anchor(
+        self,
+        sequence_numbers: Sequence[int] | None,
+        latest_by_user: dict[int, dict[str, Any]],
+    ) -> None:
+        """Anchor advertised sequence numbers to the index block this poll read."""
+        snapshot = self._last_index_snapshot
+        if not sequence_numbers or snapshot is None or len(snapshot) != len(sequence_numbers):
+            self._sequence_anchor = None
+            return
+        self._sequence_anchor = (
+            tuple(sequence_numbers),
+            tuple(
+                self._cursor_slot(user_idx, raw_cursor)
+                for user_idx, (raw_cursor, _) in enumerate(snapshot)
+            ),
+        )
+        self._latest_by_user = {
+            user: dict(record) for user, record in latest_by_user.items()
+        }
+
+    def _sequence_slots(
+        self, sequence_numbers: Sequence[int]
+    ) -> dict[int, list[tuple[int, int]]] | None:
+        """``(slot, address)`` per user index of the slots written since the anchor.
+
+        Only users whose sequence number advanced are listed. None when there
+        is no anchor, nothing advanced or a delta cannot be mapped onto the
+        ring (the index path has to be used).
+        """
+        anchor = self._sequence_anchor
+        layout = self._config.index_pointer_layout
+        if anchor is None or layout is None or len(sequence_numbers) != len(anchor[0]):
+            return None
+        old_sequence, old_slots = anchor
+        deltas = [new - old for old, new in zip(old_sequence, sequence_numbers)]
+        if not any(deltas):
+            return None
+
+        record_addresses = layout.get("record_addresses") or self._config.user_start_addresses
+        record_byte_size = int(layout.get("record_byte_size", self._config.record_byte_size))
+        record_step = int(layout.get("record_step", record_byte_size))
+        slots_by_user: dict[int, list[tuple[int, int]]] = {}
+        for user_idx, delta in enumerate(deltas):
+            if delta == 0:
+                continue
+            old_slot = old_slots[user_idx]
+            if (
+                delta < 0
+                or old_slot is None
+                or user_idx >= len(record_addresses)
+                or delta > self._ring_slot_count(user_idx)
+            ):
+                _LOGGER.debug(
+                    "Sequence read [%s] user%d: delta %d from slot %s not usable; "
+                    "falling back to the index block",
+                    self._config.model, user_idx + 1, delta, old_slot,
+                )
+                return None
+            pointer_min = int(layout["users"][user_idx].get("slot_index_min", 0))
+            pointer_max = pointer_min + self._ring_slot_count(user_idx) - 1
+            slot_reads: list[tuple[int, int]] = []
+            slot = old_slot
+            for _ in range(delta):
+                slot = self._wrap_pointer_to_range(slot + 1, pointer_min, pointer_max)
+                slot_reads.append(
+                    (slot, int(record_addresses[user_idx]) + (slot - pointer_min) * record_step)
+                )
+            slots_by_user[user_idx] = slot_reads
+        return slots_by_user
+
+    async def _get_latest_via_sequence(
+        self, transport: OmronDeviceSession, sequence_numbers: Sequence[int]
+    ) -> dict[int, dict[str, Any]] | None:
+        """Read only the slots written since the anchored sequence numbers.
+
+        Each user's sequence delta is mapped onto the slots following the
+        write slot anchored with the previous sequence numbers; the index
+        block is not read. Returns None (use the index path) when there is no
+        anchor, nothing advanced, a delta is out of range, or a slot does not
+        hold a plausible record at least as new as the one before it.
+        """
+        slots_by_user = self._sequence_slots(sequence_numbers)
+        if slots_by_user is None:
+            return None
+        layout = self._config.index_pointer_layout or {}
+        record_byte_size = int(layout.get("record_byte_size", self._config.record_byte_size))
+        latest_by_user = {user: dict(record) for user, record in self._latest_by_user.items()}
+        new_slots = list(self._sequence_anchor[1])
+
+        await transport.unlock()
+        for user_idx, slot_reads in slots_by_user.items():
+            user = user_idx + 1
+            previous = self._latest_by_user.get(user)
+            newest_seen = previous.get("datetime") if previous else None
+            candidates: list[tuple[int, dict[str, Any]]] = []
+            for slot, address in slot_reads:
+                raw_record = await transport.read_memory_range(address, record_byte_size)
+                try:
+                    parsed = self._config.parse_record(bytes(raw_record))
+                except Exception:
+                    parsed = None
+                if (
+                    parsed is None
+                    or not self._is_record_plausible(parsed)
+                    or (newest_seen is not None and parsed["datetime"] < newest_seen)
+                ):
+                    _LOGGER.debug(
+                        "Sequence read [%s] user%d slot=%d does not hold the expected "
+                        "new record; falling back to the index block",
+                        self._config.model, user, slot,
+                    )
+                    return None
+                parsed["_slot_index"] = slot
+                newest_seen = parsed["datetime"]
+                candidates.append((user, parsed))
+            selected = self._select_user_latest(user, candidates)
+            if selected is None:
+                return None
+            latest_by_user[user] = self._finalize_public_latest_record(selected[1], user)
+            new_slots[user_idx] = slot
+            _LOGGER.debug(
+                "Sequence read [%s] user%d: %d new slot(s) up to slot=%d, index block skipped",
+                self._config.model, user, len(slot_reads), slot,
+            )
+
+        self._sequence_anchor = (tuple(sequence_numbers), tuple(new_slots))
+        self._latest_by_user = {user: dict(record) for user, record in latest_by_user.items()}
+        return latest_by_user
+
+    def _write_cursors(self, index_bytes: bytes | bytearray) -> tuple[int, ...] | None:
+        """Return the raw write cursor of every user in the index block."""
+        layout = self._config.index_pointer_layout or {}
+        cursors: list[int] = []
+        for user_cfg in layout.get("users", []):
+            offset = int(user_cfg.get("write_cursor_offset", -1))
+            if offset < 0 or offset + 2 > len(index_bytes):
+                return None
+            cursors.append(
+                int.from_bytes(
+                    index_bytes[offset:offset + 2],
+                    str(layout.get("endianness", self._config.endianness)),
+                )
+            )
+        return tuple(cursors) or None
+
+    def _index_snapshot(
+        self, index_bytes: bytes | bytearray
+    ) -> tuple[tuple[int, int | None], ...] | None:
+        """Return ``(write cursor, unread counter)`` per user from the index block.
+
+        The unread counter is None for layouts without ``unread_counter_offset``.
+        The counter alone is not trusted as "nothing new": this integration
+        never clears it, the vendor app does.
+        """
+        cursors = self._write_cursors(index_bytes)
+        if cursors is None:
+            return None
+        layout = self._config.index_pointer_layout or {}
+        endianness = str(layout.get("endianness", self._config.endianness))
+        snapshot: list[tuple[int, int | None]] = []
+        for cursor, user_cfg in zip(cursors, layout.get("users", [])):
+            offset = int(user_cfg.get("unread_counter_offset", -1))
+            unread = None
+            if 0 <= offset and offset + 2 <= len(index_bytes):
+                unread = int.from_bytes(index_bytes[offset:offset + 2], endianness)
+            snapshot.append((cursor, unread))
+        return tuple(snapshot)
+
+    def _cursor_slot(self, user_idx: int, raw_pointer: int) -> int | None:
+        """Latest written slot for a raw write cursor (None: cleared or invalid).
+
+        Same mask / bias / wrap rules as ``_get_latest_via_index``.
+        """
+        user_cfg = (self._config.index_pointer_layout or {})["users"][user_idx]
+        clear_value = user_cfg.get("clear_value", 0x8000)
+        if clear_value is not None and raw_pointer == clear_value:
+            return None
+        pointer_min = int(user_cfg.get("slot_index_min", 0))
+        pointer_max = int(
+            user_cfg.get(
+                "slot_index_max", self._config.per_user_records_count[user_idx] - 1
+            )
+        )
+        pointer = (raw_pointer & int(user_cfg.get("write_cursor_mask", 0xFF))) + int(
+            user_cfg.get("slot_index_bias", -1)
+        )
+        return self._wrap_pointer_to_range(pointer, pointer_min, pointer_max)
+
+    def _ring_slot_count(self, user_idx: int) -> int:
+        """Number of slots in ``user_idx``'s record ring (index window size)."""
+        user_cfg = (self._config.index_pointer_layout or {})["users"][user_idx]
+        pointer_min = int(user_cfg.get("slot_index_min", 0))
+        pointer_max = int(
+            user_cfg.get(
+                "slot_index_max", self._config.per_user_records_count[user_idx] - 1
+            )
+        )
+        return max(pointer_max - pointer_min + 1, 0)
+
+    def _mirror_layout_supported(self) -> bool:
+        """True if index slots map 1:1 onto the contiguous record regions."""
+        layout = self._config.index_pointer_layout
+        if layout is None or self._config.settings_read_address is None:
+            return False
+        num_users = self._config.num_users
+        users = layout.get("users", [])
+        if len(users) < num_users:
+            return False
+        record_addresses = layout.get("record_addresses") or self._config.user_start_addresses
+        if list(record_addresses[:num_users]) != list(self._config.user_start_addresses[:num_users]):
+            return False
+        record_byte_size = int(layout.get("record_byte_size", self._config.record_byte_size))
+        if record_byte_size != self._config.record_byte_size:
+            return False
+        if int(layout.get("record_step", record_byte_size)) != record_byte_size:
+            return False
+        for user_idx in range(num_users):
+            count = self._config.per_user_records_count[user_idx]
+            pointer_min = int(users[user_idx].get("slot_index_min", 0))
+            pointer_max = int(users[user_idx].get("slot_index_max", count - 1))
+            if pointer_max - pointer_min + 1 != count:
+                return False
+        return True
+
+    def _slots_written_between(
+        self, user_idx: int, old_raw: int | None, new_raw: int
+    ) -> list[int] | None:
+        """Logical ring slots (0-based) written between two cursors, oldest first.
+
+        None means the cursors alone show the delta cannot be trusted (first
+        sync, a cleared cursor, or the ring wrapped exactly round) and the
+        whole ring must be read. A clear followed by new readings, or a lap
+        of more than the ring, still looks like an ordinary delta here:
+        callers confirm it against the newest slot they already hold.
+        """
+        if old_raw is None:
+            return None
+        if old_raw == new_raw:
+            return []
+        old_slot = self._cursor_slot(user_idx, old_raw)
+        new_slot = self._cursor_slot(user_idx, new_raw)
+        if old_slot is None or new_slot is None:
+            return None
+        user_cfg = (self._config.index_pointer_layout or {})["users"][user_idx]
+        pointer_min = int(user_cfg.get("slot_index_min", 0))
+        count = self._ring_slot_count(user_idx)
+        if count <= 0:
+            return None
+        distance = (new_slot - old_slot) % count
+        if distance == 0:
+            return None
+        return [
+            (old_slot - pointer_min + step) % count for step in range(1, distance + 1)
+        ]
+
+    async def _sync_mirror(
+        self, transport: OmronDeviceSession, user_indices: Sequence[int]
+    ) -> dict[int, bytearray] | None:
+        """Bring the mirror of ``user_indices`` up to date; return their region bytes.
+
+        Reads the index block, then per user either nothing (cursor
+        unchanged), only the slots written since the mirrored cursor, or the
+        whole region when no trustworthy delta exists. Returns None when no
+        mirror is attached or the profile's layout cannot be mirrored.
+        """
+        mirror = self.mirror
+        if mirror is None or not self._mirror_layout_supported():
+            return None
+        if mirror.model != self._config.model:
+            mirror = self.mirror = EepromMirror(model=self._config.model)
+
+        layout = self._config.index_pointer_layout or {}
+        index_bytes = await transport.read_memory_range(
+            self._config.settings_read_address,
+            int(layout.get("index_region_byte_size", 0)),
+        )
+        cursors = self._write_cursors(index_bytes)
+        if cursors is None or len(cursors) < self._config.num_users:
+            return None
+        checkpoint = await self._resume_checkpoint(transport, index_bytes)
+
+        record_byte_size = self._config.record_byte_size
+        regions: dict[int, bytearray] = {}
+        for user_idx in user_indices:
+            base_addr = self._config.user_start_addresses[user_idx]
+            region_size = self._config.per_user_records_count[user_idx] * record_byte_size
+            region = mirror.regions.get(user_idx)
+            slots = None
+            if region is not None and len(region) == region_size:
+                slots = self._slots_written_between(
+                    user_idx, mirror.cursor(user_idx), cursors[user_idx]
+                )
+            if slots:
+                delta = await self._read_mirror_delta(transport, user_idx, region, slots)
+                if delta is None:
+                    slots = None
+                else:
+                    region = delta
+            if slots is None and user_idx in mirror.scans:
+                scan = self._region_scan(mirror, user_idx, cursors[user_idx])
+                missing = sorted(set(range(len(scan.region) // record_byte_size)) - scan.slots_read)
+                _LOGGER.debug(
+                    "EEPROM mirror [%s] user%d: completing amortized scan, %d slot(s) left",
+                    self._config.model, user_idx + 1, len(missing),
+                )
+                await self._read_scan_slots(transport, user_idx, scan, missing)
+                region = scan.region
+            elif slots is None:
+                _LOGGER.debug(
+                    "EEPROM mirror [%s] user%d: reading full region (cursor 0x%04X)",
+                    self._config.model, user_idx + 1, cursors[user_idx],
+                )
+                region = bytearray(
+                    await transport.read_memory_range(
+                        base_addr, region_size, checkpoint=checkpoint
+                    )
+                )
+            else:
+                region = bytearray(region)
+            mirror.store_user(user_idx, cursors[user_idx], region)
+            regions[user_idx] = region
+        return regions
+
+    async def _read_mirror_delta(
+        self,
+        transport: OmronDeviceSession,
+        user_idx: int,
+        region: bytes | bytearray,
+        slots: list[int],
+    ) -> bytearray | None:
+        """Read the ``slots`` written since the mirror into a copy of ``region``.
+
+        The newest mirrored slot is read along with them (it precedes the
+        first new slot, so usually in the same run). After a memory clear
+        followed by new measurements the cursor delta looks like an ordinary
+        one, but that slot is then empty or holds a newer record; None is
+        returned when it no longer matches the mirror, and the caller reads
+        the whole region instead.
+        """
+        record_byte_size = self._config.record_byte_size
+        base_addr = self._config.user_start_addresses[user_idx]
+        anchor = (slots[0] - 1) % (len(region) // record_byte_size)
+        fresh = bytearray(region)
+        for first, length in _slot_runs([anchor, *slots]):
+            offset = first * record_byte_size
+            fresh[offset:offset + length * record_byte_size] = (
+                await transport.read_memory_range(
+                    base_addr + offset, length * record_byte_size
+                )
+            )
+        anchor_offset = anchor * record_byte_size
+        anchor_bytes = slice(anchor_offset, anchor_offset + record_byte_size)
+        if fresh[anchor_bytes] != region[anchor_bytes]:
+            _LOGGER.debug(
+                "EEPROM mirror [%s] user%d: newest mirrored slot %d changed "
+                "(memory cleared?); re-reading the region",
+                self._config.model, user_idx + 1, anchor,
+            )
+            return None
+        _LOGGER.debug(
+            "EEPROM mirror [%s] user%d: %d new slot(s) read",
+            self._config.model, user_idx + 1, len(slots),
+        )
+        return fresh
+
+    def _region_scan(self, mirror: EepromMirror, user_idx: int, cursor: int) -> RegionScan:
+        """Return ``user_idx``'s amortized scan, brought up to ``cursor``.
+
+        Slots written since the scan's cursor are marked unread again; a scan
+        whose delta cannot be trusted (memory cleared, ring lapped) restarts.
+        """
+        region_size = self._config.per_user_records_count[user_idx] * self._config.record_byte_size
+        scan = mirror.scans.get(user_idx)
+        if scan is not None and len(scan.region) == region_size and scan.cursor != cursor:
+            written = self._slots_written_between(user_idx, scan.cursor, cursor)
+            if written is None:
+                scan = None
+            else:
+                scan.slots_read.difference_update(written)
+                scan.cursor = cursor
+        if scan is None or len(scan.region) != region_size:
+            scan = mirror.scans[user_idx] = RegionScan(cursor, bytearray(region_size))
+        return scan
+
+    async def _read_scan_slots(
+        self,
+        transport: OmronDeviceSession,
+        user_idx: int,
+        scan: RegionScan,
+        slots: Iterable[int],
+        deadline: float | None = None,
+    ) -> None:
+        """Read ``slots`` into ``scan`` one run at a time (in the order given),
+        stopping at ``deadline``."""
+        record_byte_size = self._config.record_byte_size
+        base_addr = self._config.user_start_addresses[user_idx]
+        for first, length in _slot_runs(slots):
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            offset = first * record_byte_size
+            scan.region[offset:offset + length * record_byte_size] = (
+                await transport.read_memory_range(base_addr + offset, length * record_byte_size)
+            )
+            scan.slots_read.update(range(first, first + length))
+
+    async def advance_background_scan(
+        self,
+        transport: OmronDeviceSession,
+        *,
+        byte_budget: int,
+        time_budget: float | None = None,
+    ) -> bool:
+        """Spend up to ``byte_budget`` bytes (and ``time_budget`` s) filling the mirror.
+
+        Users whose region is not mirrored yet get the slots they still lack
+        read, newest first, into a ``RegionScan`` kept in the mirror (and so
+        persisted with it). A region whose every slot has been read under the
+        current write cursor becomes a regular mirrored region, which later
+        full scans only delta-sync. Returns True once every user's region is
+        mirrored; False also when no mirror is attached or the layout cannot
+        be mirrored.
+        """
+        mirror = self.mirror
+        if mirror is None or not self._mirror_layout_supported():
+            return False
+        if mirror.model != self._config.model:
+            mirror = self.mirror = EepromMirror(model=self._config.model)
+
+        layout = self._config.index_pointer_layout or {}
+        await transport.unlock()
+        index_bytes = await transport.read_memory_range(
+            self._config.settings_read_address,
+            int(layout.get("index_region_byte_size", 0)),
+        )
+        cursors = self._write_cursors(index_bytes)
+        if cursors is None or len(cursors) < self._config.num_users:
+            return False
+
+        record_byte_size = self._config.record_byte_size
+        deadline = None if time_budget is None else time.monotonic() + time_budget
+        budget: DeadlineBudget | None = getattr(transport, "budget", None)
+        if budget is not None:
+            deadline = budget.deadline if deadline is None else min(deadline, budget.deadline)
+        slot_budget = max(byte_budget, 0) // record_byte_size
+        complete = True
+        for user_idx in range(self._config.num_users):
+            count = self._config.per_user_records_count[user_idx]
+            region = mirror.regions.get(user_idx)
+            if region is not None and len(region) == count * record_byte_size:
+                continue
+            scan = self._region_scan(mirror, user_idx, cursors[user_idx])
+            newest = self._cursor_slot(user_idx, cursors[user_idx])
+            if newest is None:
+                newest = 0
+            else:
+                newest -= int(layout["users"][user_idx].get("slot_index_min", 0))
+            wanted = [
+                slot
+                for slot in ((newest - back) % count for back in range(count))
+                if slot not in scan.slots_read
+            ][:slot_budget]
+            already_read = len(scan.slots_read)
+            await self._read_scan_slots(transport, user_idx, scan, wanted, deadline)
+            # Only what was read counts; a deadline stop leaves the rest.
+            slot_budget -= len(scan.slots_read) - already_read
+            if len(scan.slots_read) == count:
+                mirror.store_user(user_idx, cursors[user_idx], scan.region)
+                _LOGGER.debug(
+                    "EEPROM mirror [%s] user%d: amortized scan complete",
+                    self._config.model, user_idx + 1,
+                )
+            else:
+                complete = False
+                _LOGGER.debug(
+                    "EEPROM mirror [%s] user%d: amortized scan at %d/%d slot(s)",
+                    self._config.model, user_idx + 1, len(scan.slots_read), count,
+                )
+        return complete
+
+    async def _resume_checkpoint(
+        self,
+        transport: OmronDeviceSession,
+        index_bytes: bytes | bytearray | None = None,
+    ) -> TransferCheckpoint | None:
+        """Return the transfer checkpoint, validated for this link.
+
+        The checkpoint is only trusted once the index block has been read on
+        the current link and its write cursors match the ones the stored bytes
+        were read under; otherwise it is emptied. Profiles without an index
+        layout get None (nothing to validate against).
+        """
+        layout = self._config.index_pointer_layout
+        if layout is None or self._config.settings_read_address is None:
+            return None
+        if index_bytes is None:
+            if self._checkpoint.link_epoch == transport.link_epoch:
+                return self._checkpoint
+            index_region_byte_size = int(layout.get("index_region_byte_size", 0))
+            if index_region_byte_size <= 0:
+                return None
+            index_bytes = await transport.read_memory_range(
+                self._config.settings_read_address, index_region_byte_size
+            )
+        cursors = self._write_cursors(index_bytes)
+        if cursors is None:
+            return None
+        if self._checkpoint.validate(cursors, transport.link_epoch):
+            _LOGGER.debug(
+                "Resuming EEPROM transfer for %s with %d byte(s) from an earlier session",
+                self._config.model,
+                self._checkpoint.byte_count,
+            )
+        return self._checkpoint
+
+    def _learned_backtrack_depth(self, max_probe: int) -> int:
+        """Deepest backtrack recent probes needed (``max_probe`` until known)."""
+        return max(self._backtrack_depths) if self._backtrack_depths else max_probe
+
+    @staticmethod
+    def _truread_span(record: dict[str, Any]) -> int:
+        """Slots a record's reading sequence occupies, ending at the record.
+
+        A TruRead reading at position N (``pos`` 2 or 3) follows its N-1
+        companion readings in the slots just before it.
+        """
+        pos = record.get("pos")
+        return pos if isinstance(pos, int) and 2 <= pos <= 3 else 1
+
+    async def _read_backtrack_window(
+        self,
+        transport: OmronDeviceSession,
+        base_addr: int,
+        record_step: int,
+        record_byte_size: int,
+        latest_slot: int,
+        pointer_min: int,
+        record_count: int,
+        backs: range,
+        checkpoint: TransferCheckpoint | None,
+    ) -> list[tuple[int, bytes]]:
+        """Read the slots ``latest_slot - back`` for ``backs``; newest first.
+
+        Packed records (``record_step == record_byte_size``) are fetched with
+        one range read, split in two only where the window wraps the ring.
+        """
+        logical = [(latest_slot - back - pointer_min) % record_count for back in backs]
+        if record_step == record_byte_size:
+            runs = _slot_runs(sorted(logical))
+        else:
+            runs = [(slot, 1) for slot in sorted(logical)]
+        slot_bytes: dict[int, bytes] = {}
+        for first, length in runs:
+            raw = await transport.read_memory_range(
+                base_addr + first * record_step,
+                (length - 1) * record_step + record_byte_size,
+                checkpoint=checkpoint,
+            )
+            for offset in range(length):
+                start = offset * record_step
+                slot_bytes[first + offset] = bytes(raw[start:start + record_byte_size])
+        return [(pointer_min + slot, slot_bytes[slot]) for slot in logical]
+
+    def _parse_probe_slot(
+        self, idx: int, probe_slot: int, raw_record: bytes
+    ) -> dict[str, Any] | None:
+        """Parse one probed index slot; None if unparseable or implausible."""
+        _LOGGER.debug(
+            "User%d [%s] slot=%d raw=%s",
+            idx + 1, self._config.model, probe_slot, raw_record.hex(),
+        )
+        try:
+            parsed = self._config.parse_record(raw_record)
+        except Exception as parse_exc:
+            _LOGGER.debug(
+                "User%d [%s] slot=%d parse error: %s",
+                idx + 1, self._config.model, probe_slot, parse_exc,
+            )
+            return None
+        parsed["_slot_index"] = probe_slot
+        _LOGGER.debug(
+            "User%d [%s] slot=%d parsed: sys=%s dia=%s bpm=%s "
+            "dt=%s ihb=%s mov=%s cuff=%s pos=%s",
+            idx + 1, self._config.model, probe_slot,
+            parsed.get("sys"), parsed.get("dia"), parsed.get("bpm"),
+            parsed.get("datetime"), parsed.get("ihb"),
+            parsed.get("mov"), parsed.get("cuff"), parsed.get("pos"),
+        )
+        if not self._is_record_plausible(parsed):
+            return None
+        return parsed
+
     @staticmethod
     def _wrap_pointer_to_range(pointer: int, pointer_min: int, pointer_max: int) -> int | None:
         """Wrap pointer into [min, max] range (device index window semantics)."""
@@ -2476,7 +4296,6 @@ class OmronDeviceDriver:
             index_bytes = await transport.read_memory_range(
                 self._config.settings_read_address,
                 index_region_byte_size,
-                self._config.transmission_block_size,
             )
             _LOGGER.debug(
                 "Index block [%s]: addr=0x%04X size=%d endian=%s raw=%s",
@@ -2486,137 +4305,151 @@ class OmronDeviceDriver:
                 ptr_endian,
                 bytes(index_bytes).hex(),
             )
-            for idx, user_cfg in enumerate(user_layouts):
-                if idx >= len(record_addresses) or idx >= len(self._config.per_user_records_count):
-                    continue
-                write_cursor_offset = int(user_cfg.get("write_cursor_offset", -1))
-                if write_cursor_offset < 0 or write_cursor_offset + 2 > len(index_bytes):
-                    _LOGGER.debug(
-                        "User%d [%s]: write_cursor_offset=0x%02X invalid (index_bytes len=%d), skipping",
-                        idx + 1, self._config.model, write_cursor_offset, len(index_bytes),
-                    )
-                    continue
-
-                raw_pointer = int.from_bytes(
-                    index_bytes[write_cursor_offset:write_cursor_offset + 2],
-                    ptr_endian,
-                    signed=False,
+            checkpoint = await self._resume_checkpoint(transport, index_bytes)
+            snapshot = self._index_snapshot(index_bytes)
+            cached = self._index_probe_cache
+            if snapshot is not None and cached is not None and cached[0] == snapshot:
+                # No write cursor or unread counter moved since the slots were
+                # last probed: nothing new was recorded, reuse that result.
+                _LOGGER.debug(
+                    "Index block [%s] unchanged since last probe; skipping slot reads",
+                    self._config.model,
                 )
-                # Unrecorded users have their pointer set to clear_value (0x8000 on legacy/classic profiles).
-                # Modern formatVersion 4 (WLD3/WLD4) profiles always set bit15 (e.g. 0x8006) and rely on the
-                # empty-slot (all-0xFF) backtrack heuristic instead.
-                clear_value = user_cfg.get("clear_value", 0x8000)
-                if clear_value is not None and raw_pointer == clear_value:
-                    _LOGGER.debug(
-                        "User%d [%s]: cursor raw=0x%04X matches clear_value 0x%04X "
-                        "(no recorded measurements) — skipping and marking user confirmed empty",
-                        idx + 1,
-                        self._config.model,
-                        raw_pointer,
-                        clear_value,
+                candidates = [(user, dict(record)) for user, record in cached[1]]
+                confirmed_empty_users = set(cached[2])
+            else:
+                for idx, user_cfg in enumerate(user_layouts):
+                    if idx >= len(record_addresses) or idx >= len(self._config.per_user_records_count):
+                        continue
+                    write_cursor_offset = int(user_cfg.get("write_cursor_offset", -1))
+                    if write_cursor_offset < 0 or write_cursor_offset + 2 > len(index_bytes):
+                        _LOGGER.debug(
+                            "User%d [%s]: write_cursor_offset=0x%02X invalid (index_bytes len=%d), skipping",
+                            idx + 1, self._config.model, write_cursor_offset, len(index_bytes),
+                        )
+                        continue
+
+                    raw_pointer = int.from_bytes(
+                        index_bytes[write_cursor_offset:write_cursor_offset + 2],
+                        ptr_endian,
+                        signed=False,
                     )
-                    confirmed_empty_users.add(idx + 1)
-                    continue
+                    # Unrecorded users have their pointer set to clear_value (0x8000 on legacy/classic profiles).
+                    # Modern formatVersion 4 (WLD3/WLD4) profiles always set bit15 (e.g. 0x8006) and rely on the
+                    # empty-slot (all-0xFF) backtrack heuristic instead.
+                    clear_value = user_cfg.get("clear_value", 0x8000)
+                    if clear_value is not None and raw_pointer == clear_value:
+                        _LOGGER.debug(
+                            "User%d [%s]: cursor raw=0x%04X matches clear_value 0x%04X "
+                            "(no recorded measurements) — skipping and marking user confirmed empty",
+                            idx + 1,
+                            self._config.model,
+                            raw_pointer,
+                            clear_value,
+                        )
+                        confirmed_empty_users.add(idx + 1)
+                        continue
 
-                pointer_mask = int(user_cfg.get("write_cursor_mask", 0xFF))
-                pointer_min = int(user_cfg.get("slot_index_min", 0))
-                pointer_max = int(
-                    user_cfg.get(
-                        "slot_index_max",
-                        self._config.per_user_records_count[idx] - 1,
+                    pointer_mask = int(user_cfg.get("write_cursor_mask", 0xFF))
+                    pointer_min = int(user_cfg.get("slot_index_min", 0))
+                    pointer_max = int(
+                        user_cfg.get(
+                            "slot_index_max",
+                            self._config.per_user_records_count[idx] - 1,
+                        )
                     )
-                )
-                correction = int(user_cfg.get("slot_index_bias", -1))
-                pointer_masked = raw_pointer & pointer_mask
-                pointer_corrected = pointer_masked + correction
-                pointer_wrapped = self._wrap_pointer_to_range(
-                    pointer_corrected, pointer_min, pointer_max
-                )
-                if pointer_wrapped is None:
+                    correction = int(user_cfg.get("slot_index_bias", -1))
+                    pointer_masked = raw_pointer & pointer_mask
+                    pointer_corrected = pointer_masked + correction
+                    pointer_wrapped = self._wrap_pointer_to_range(
+                        pointer_corrected, pointer_min, pointer_max
+                    )
+                    if pointer_wrapped is None:
+                        _LOGGER.debug(
+                            "User%d [%s]: cursor raw=0x%04X masked=0x%02X corrected=%d wrapped=None "
+                            "(range [%d,%d]), skipping",
+                            idx + 1, self._config.model,
+                            raw_pointer, pointer_masked, pointer_corrected,
+                            pointer_min, pointer_max,
+                        )
+                        continue
+                    record_count = (pointer_max - pointer_min) + 1
+                    if record_count <= 0:
+                        continue
+                    latest_slot = pointer_wrapped
                     _LOGGER.debug(
-                        "User%d [%s]: cursor raw=0x%04X masked=0x%02X corrected=%d wrapped=None "
-                        "(range [%d,%d]), skipping",
+                        "User%d [%s]: cursor raw=0x%04X masked=0x%02X bias=%+d "
+                        "→ slot=%d (range [%d,%d]) base_addr=0x%04X record_step=%d",
                         idx + 1, self._config.model,
-                        raw_pointer, pointer_masked, pointer_corrected,
-                        pointer_min, pointer_max,
+                        raw_pointer, pointer_masked, correction,
+                        latest_slot, pointer_min, pointer_max,
+                        int(record_addresses[idx]), record_step,
                     )
-                    continue
-                record_count = (pointer_max - pointer_min) + 1
-                if record_count <= 0:
-                    continue
-                latest_slot = pointer_wrapped
-                _LOGGER.debug(
-                    "User%d [%s]: cursor raw=0x%04X masked=0x%02X bias=%+d "
-                    "→ slot=%d (range [%d,%d]) base_addr=0x%04X record_step=%d",
-                    idx + 1, self._config.model,
-                    raw_pointer, pointer_masked, correction,
-                    latest_slot, pointer_min, pointer_max,
-                    int(record_addresses[idx]), record_step,
-                )
-                max_probe = min(max(backtrack_slots, 0), max(record_count - 1, 0))
-                parsed = None
-                base_addr = int(record_addresses[idx])
-                # Track whether every probed slot for this user was the
-                # device's empty marker (all-0xFF).  If so, the user has
-                # never recorded a measurement and the caller can skip the
-                # full-scan fallback safely.
-                user_had_any_read = False
-                user_all_probed_slots_empty = True
-                for back in range(max_probe + 1):
-                    probe_slot = latest_slot - back
-                    while probe_slot < pointer_min:
-                        probe_slot += record_count
-                    logical_slot = probe_slot - pointer_min
-                    probe_addr = base_addr + (logical_slot * record_step)
-                    raw_record = await transport.read_memory_range(
-                        probe_addr,
-                        record_byte_size,
-                        self._config.transmission_block_size,
+                    max_probe = min(max(backtrack_slots, 0), max(record_count - 1, 0))
+                    base_addr = int(record_addresses[idx])
+                    # Start with the depth recent polls actually needed; the
+                    # rest of the configured window is only read on a miss.
+                    window = min(max_probe, self._learned_backtrack_depth(max_probe))
+                    probes = await self._read_backtrack_window(
+                        transport, base_addr, record_step, record_byte_size,
+                        latest_slot, pointer_min, record_count, range(window + 1),
+                        checkpoint,
                     )
-                    _LOGGER.debug(
-                        "User%d [%s] slot=%d addr=0x%04X raw=%s",
-                        idx + 1, self._config.model, probe_slot,
-                        probe_addr, bytes(raw_record).hex(),
+                    parsed_probes = [
+                        (slot, raw, self._parse_probe_slot(idx, slot, raw))
+                        for slot, raw in probes
+                    ]
+                    hits = [back for back, (_, _, rec) in enumerate(parsed_probes) if rec]
+                    wanted = max_probe
+                    if hits:
+                        wanted = min(
+                            max_probe,
+                            hits[0] + self._truread_span(parsed_probes[hits[0]][2]) - 1,
+                        )
+                    if wanted > window:
+                        more = await self._read_backtrack_window(
+                            transport, base_addr, record_step, record_byte_size,
+                            latest_slot, pointer_min, record_count,
+                            range(window + 1, wanted + 1), checkpoint,
+                        )
+                        parsed_probes.extend(
+                            (slot, raw, self._parse_probe_slot(idx, slot, raw))
+                            for slot, raw in more
+                        )
+                        hits = [back for back, (_, _, rec) in enumerate(parsed_probes) if rec]
+                    self._backtrack_depths.append(
+                        min(
+                            max_probe,
+                            hits[0] + self._truread_span(parsed_probes[hits[0]][2]) - 1,
+                        )
+                        if hits
+                        else max_probe
                     )
-                    user_had_any_read = True
-                    # The device leaves un-written slots as all-0xFF.  A
-                    # single byte that differs means *something* was stored
-                    # at this slot, even if our parser rejects it.
-                    if any(b != 0xFF for b in raw_record):
-                        user_all_probed_slots_empty = False
-                    try:
-                        parsed = self._config.parse_record(bytes(raw_record))
-                    except Exception as parse_exc:
+                    for _, _, record in parsed_probes:
+                        if record is not None:
+                            candidates.append((idx + 1, record))
+                    # The device leaves un-written slots as all-0xFF.  A single
+                    # byte that differs means *something* was stored at a slot,
+                    # even if our parser rejects it.  If every probed slot is
+                    # blank the user has never recorded a measurement and the
+                    # caller can skip the full-scan fallback safely.
+                    if parsed_probes and all(
+                        all(b == 0xFF for b in raw) for _, raw, _ in parsed_probes
+                    ):
+                        confirmed_empty_users.add(idx + 1)
                         _LOGGER.debug(
-                            "User%d [%s] slot=%d parse error: %s",
-                            idx + 1, self._config.model, probe_slot, parse_exc,
+                            "User%d [%s] confirmed empty: cursor slot and %d "
+                            "backtrack slot(s) all 0xFF — full-scan fallback "
+                            "will be skipped for this user",
+                            idx + 1, self._config.model, len(parsed_probes) - 1,
                         )
-                        parsed = None
-                        continue
-                    parsed["_slot_index"] = probe_slot
-                    _LOGGER.debug(
-                        "User%d [%s] slot=%d parsed: sys=%s dia=%s bpm=%s "
-                        "dt=%s ihb=%s mov=%s cuff=%s pos=%s",
-                        idx + 1, self._config.model, probe_slot,
-                        parsed.get("sys"), parsed.get("dia"), parsed.get("bpm"),
-                        parsed.get("datetime"), parsed.get("ihb"),
-                        parsed.get("mov"), parsed.get("cuff"), parsed.get("pos"),
-                    )
-                    if not self._is_record_plausible(parsed):
-                        parsed = None
-                        continue
-                    candidates.append((idx + 1, parsed))
-                    break
-                # After the backtrack window completes: if every read came
-                # back all-0xFF, mark this user as definitively empty.
-                if user_had_any_read and user_all_probed_slots_empty:
-                    confirmed_empty_users.add(idx + 1)
-                    _LOGGER.debug(
-                        "User%d [%s] confirmed empty: cursor slot and %d "
-                        "backtrack slot(s) all 0xFF — full-scan fallback "
-                        "will be skipped for this user",
-                        idx + 1, self._config.model, max_probe,
+                if snapshot is not None:
+                    self._index_probe_cache = (
+                        snapshot,
+                        [(user, dict(record)) for user, record in candidates],
+                        frozenset(confirmed_empty_users),
                     )
+            self._last_index_snapshot = snapshot
         except Exception as exc:
             if self._config.host_pairing_mode == HostPairingMode.OS_BONDING:
                 _LOGGER.warning(
@@ -2648,58 +4481,7 @@ class OmronDeviceDriver:
             for user_idx in range(len(user_layouts)):
                 user = user_idx + 1
                 user_candidates = [c for c in candidates if c[0] == user]
-                
-                # Check for TruRead sequence in user_candidates
-                # They are ordered newest to oldest if probed sequentially
-                truread_avg = None
-                if len(user_candidates) >= 3:
-                    # Sort candidates by slot index just to be safe, newest last
-                    sorted_cands = sorted(user_candidates, key=lambda x: x[1].get('_slot_index', -1))
-                    if len(sorted_cands) >= 3:
-                        c3, c2, c1 = sorted_cands[-1], sorted_cands[-2], sorted_cands[-3]
-                        if c3[1].get('pos') == 3 and c2[1].get('pos') == 2 and c1[1].get('pos') == 1:
-                            dt3 = c3[1].get('datetime')
-                            dt1 = c1[1].get('datetime')
-                            # Check if the whole session fits in 15 minutes
-                            import datetime as dt_mod
-                            if dt3 and dt1 and (dt3 - dt1) <= dt_mod.timedelta(minutes=15):
-                                avg_sys = round((c3[1].get('sys', 0) + c2[1].get('sys', 0) + c1[1].get('sys', 0)) / 3)
-                                avg_dia = round((c3[1].get('dia', 0) + c2[1].get('dia', 0) + c1[1].get('dia', 0)) / 3)
-                                avg_bpm = round((c3[1].get('bpm', 0) + c2[1].get('bpm', 0) + c1[1].get('bpm', 0)) / 3)
-                                
-                                # Clone c3 as the base for the virtual average record
-                                avg_record = dict(c3[1])
-                                avg_record['sys'] = avg_sys
-                                avg_record['dia'] = avg_dia
-                                avg_record['bpm'] = avg_bpm
-                                avg_record['measurement_type'] = 'TruRead Average'
-                                # c3 carries pos=3 (sequence index); overwrite with 0
-                                # so the aggregate doesn't report improper_position=True,
-                                # while still pushing a fresh value to the sensor.
-                                avg_record['pos'] = 0
-                                
-                                # Store individual records for attributes
-                                def _clean_rec(r):
-                                    return {
-                                        'sys': r.get('sys'),
-                                        'dia': r.get('dia'),
-                                        'bpm': r.get('bpm'),
-                                        'time': r.get('datetime').isoformat() if r.get('datetime') else None,
-                                        'pos': r.get('pos')
-                                    }
-                                avg_record['truread_details'] = [
-                                    _clean_rec(c1[1]),
-                                    _clean_rec(c2[1]),
-                                    _clean_rec(c3[1])
-                                ]
-                                truread_avg = (user, avg_record)
-
-                if truread_avg:
-                    selected = truread_avg
-                else:
-                    selected = self._select_latest_candidate(user_candidates)
-                    if selected:
-                        selected[1]['measurement_type'] = 'Single'
+                selected = self._select_user_latest(user, user_candidates)
 
                 if selected:
                     result_per_user[user] = self._finalize_public_latest_record(selected[1], user)
@@ -2779,6 +4561,63 @@ class OmronDeviceDriver:
             ),
         )
 
+    def _select_user_latest(
+        self, user: int, user_candidates: list[tuple[int, dict[str, Any]]]
+    ) -> tuple[int, dict[str, Any]] | None:
+        """Pick one user's latest record, folding a TruRead triple into its average."""
+        # Check for TruRead sequence in user_candidates
+        # They are ordered newest to oldest if probed sequentially
+        truread_avg = None
+        if len(user_candidates) >= 3:
+            # Sort candidates by slot index just to be safe, newest last
+            sorted_cands = sorted(user_candidates, key=lambda x: x[1].get('_slot_index', -1))
+            if len(sorted_cands) >= 3:
+                c3, c2, c1 = sorted_cands[-1], sorted_cands[-2], sorted_cands[-3]
+                if c3[1].get('pos') == 3 and c2[1].get('pos') == 2 and c1[1].get('pos') == 1:
+                    dt3 = c3[1].get('datetime')
+                    dt1 = c1[1].get('datetime')
+                    # Check if the whole session fits in 15 minutes
+                    import datetime as dt_mod
+                    if dt3 and dt1 and (dt3 - dt1) <= dt_mod.timedelta(minutes=15):
+                        avg_sys = round((c3[1].get('sys', 0) + c2[1].get('sys', 0) + c1[1].get('sys', 0)) / 3)
+                        avg_dia = round((c3[1].get('dia', 0) + c2[1].get('dia', 0) + c1[1].get('dia', 0)) / 3)
+                        avg_bpm = round((c3[1].get('bpm', 0) + c2[1].get('bpm', 0) + c1[1].get('bpm', 0)) / 3)
+
+                        # Clone c3 as the base for the virtual average record
+                        avg_record = dict(c3[1])
+                        avg_record['sys'] = avg_sys
+                        avg_record['dia'] = avg_dia
+                        avg_record['bpm'] = avg_bpm
+                        avg_record['measurement_type'] = 'TruRead Average'
+                        # c3 carries pos=3 (sequence index); overwrite with 0
+                        # so the aggregate doesn't report improper_position=True,
+                        # while still pushing a fresh value to the sensor.
+                        avg_record['pos'] = 0
+
+                        # Store individual records for attributes
+                        def _clean_rec(r):
+                            return {
+                                'sys': r.get('sys'),
+                                'dia': r.get('dia'),
+                                'bpm': r.get('bpm'),
+                                'time': r.get('datetime').isoformat() if r.get('datetime') else None,
+                                'pos': r.get('pos')
+                            }
+                        avg_record['truread_details'] = [
+                            _clean_rec(c1[1]),
+                            _clean_rec(c2[1]),
+                            _clean_rec(c3[1])
+                        ]
+                        truread_avg = (user, avg_record)
+
+        if truread_avg:
+            selected = truread_avg
+        else:
+            selected = self._select_latest_candidate(user_candidates)
+            if selected:
+                selected[1]['measurement_type'] = 'Single'
+        return selected
+
     def _is_record_plausible(self, record: dict[str, Any]) -> bool:
         """Sanity-check parsed values to avoid stale/garbage slot selection."""
         date_value = record.get("datetime")
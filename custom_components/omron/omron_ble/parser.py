@@ -36,7 +36,11 @@ from .const import (
     ExtendedBinarySensorDeviceClass,
 )
 from .setup import async_sync_device_time, async_sync_eeprom_time
+from .deadline_budget import DeadlineBudget
+from .device_capabilities import DeviceCapabilities
 from .devices import HostPairingMode, DeviceConfig, get_device_config, resolve_profile_model_id
+from .eeprom_mirror import EepromMirror
+from .gatt_io import gatt_read, gatt_start_notify, gatt_stop_notify, gatt_write
 from .omron_driver import (
     OmronDeviceSession,
     OmronDeviceDriver,
@@ -45,6 +49,21 @@ from ..util import slugify_for_entity_key
 
 _LOGGER = logging.getLogger(__name__)
 
+# Amortized full scan (opt-in, see background_scan_bytes): after the latest
+# records are served, each poll spends at most this many record bytes /
+# seconds filling the EEPROM mirror.
+BACKGROUND_SCAN_BYTES_PER_POLL = 0x230
+BACKGROUND_SCAN_SECONDS_PER_POLL = 15.0
+
+# Poll deadline budget (see deadline_budget.py). Connecting may spend this
+# share of it, the memory-session open attempts this share of what is left
+# after connecting; the last-resort session fallback and the optional
+# phases (BLS reads, device information) only start with enough time left.
+CONNECT_BUDGET_SHARE = 0.5
+MEMORY_OPEN_BUDGET_SHARE = 0.6
+MEMORY_FALLBACK_MIN_SECONDS = 30.0
+OPTIONAL_PHASE_MIN_SECONDS = 15.0
+
 
 def _normalize_user_aliases(user_aliases: dict[int, str] | None) -> dict[int, str]:
     """Build 1-based user index -> display label; empty strings become user{n}."""
@@ -60,6 +79,19 @@ def _normalize_user_aliases(user_aliases: dict[int, str] | None) -> dict[int, st
         out[idx] = label if label else f"user{idx}"
     return out
 
+def _bls_racp_unsupported(racp_response: bytes | None, exc: BaseException) -> bool:
+    """True if a failed BLS RACP read shows the device lacks the path.
+
+    Only a RACP refusal or a "not permitted" GATT error says so; timeouts and
+    dropped links leave the capability unknown so the next poll tries again.
+    """
+    if racp_response is not None and len(racp_response) >= 4 and racp_response[0] == 0x06:
+        # Response Code: op code / operator not supported, invalid operator
+        # or invalid operand.
+        return racp_response[3] in (0x02, 0x03, 0x04, 0x05)
+    return "not permitted" in str(exc).lower()
+
+
 class OmronBluetoothDeviceData(BluetoothData):
     """Data handler for Omron BLE blood pressure monitors."""
 
@@ -77,8 +109,10 @@ class OmronBluetoothDeviceData(BluetoothData):
         self._user_aliases: dict[int, str] = _normalize_user_aliases(user_aliases)
         self._last_record_signature: tuple[Any, ...] | None = None
         self._last_record_signatures_by_user: dict[int, tuple[Any, ...]] = {}
-        self._bp_char_unavailable = False
         self._bls_racp_unavailable_logged = False
+        # GATT layout and optional features learned from the device; the
+        # integration swaps in the persisted profile.
+        self.capabilities = DeviceCapabilities(model=device_model)
         self._poll_guard = asyncio.Lock()
         self.omron_extra_attributes = {}
 
@@ -95,6 +129,18 @@ class OmronBluetoothDeviceData(BluetoothData):
         self.user_register_count: int = 0
         self.guidance_mode: int = 0
         self.result_identifier_num: int = 0
+        self.user_sequence_numbers: tuple[int, ...] = ()
+        # Record counters from the latest advertisement (None when its format
+        # carries none) and the ones seen when the last readout completed.
+        self._advertised_record_counters: tuple[Any, ...] | None = None
+        self._polled_record_counters: tuple[Any, ...] | None = None
+        self._readout_completed = False
+        # Per-poll byte budget of the amortized full scan. None (the default)
+        # disables it: only the get_user_records fallback reads a complete
+        # mirror, so opt in (e.g. with BACKGROUND_SCAN_BYTES_PER_POLL) where
+        # that is worth the EEPROM traffic. Reset to None once every user's
+        # region is mirrored.
+        self.background_scan_bytes: int | None = None
 
         self._seed_measurement_entities()
 
@@ -108,10 +154,25 @@ class OmronBluetoothDeviceData(BluetoothData):
         """Set the device model and update internal config."""
         self._device_model = model
         self._device_config = get_device_config(model)
+        mirror = self._driver.mirror
         self._driver = OmronDeviceDriver(self._device_config)
+        # The driver drops a mirror taken under another model on its next sync.
+        self._driver.mirror = mirror
+        if self.capabilities.model != model:
+            self.capabilities = DeviceCapabilities(model=model)
         self._last_record_signature = None
         self._last_record_signatures_by_user = {}
 
+    @property
+    def eeprom_mirror(self) -> EepromMirror | None:
+        """Record-region mirror used by full EEPROM scans (None: disabled)."""
+        return self._driver.mirror
+
+    @eeprom_mirror.setter
+    def eeprom_mirror(self, mirror: EepromMirror | None) -> None:
+        """Attach (or detach) a record-region mirror."""
+        self._driver.mirror = mirror
+
     def _seed_measurement_entities(self) -> None:
         """Pre-register measurement sensor descriptions for offline startup.
 
@@ -263,6 +324,13 @@ class OmronBluetoothDeviceData(BluetoothData):
         self.user_register_count = fields["user_register_count"]
         self.guidance_mode = fields["guidance_mode"]
         self.result_identifier_num = fields["result_identifier_num"]
+        self.user_sequence_numbers = fields["user_sequence_numbers"]
+        if payload[0] == 0x03:
+            self._advertised_record_counters = (0x03, self.result_identifier_num)
+        elif self.user_sequence_numbers:
+            self._advertised_record_counters = (payload[0], *self.user_sequence_numbers)
+        else:
+            self._advertised_record_counters = None
 
         self.update_binary_sensor(
             "forced_transfer",
@@ -283,6 +351,19 @@ class OmronBluetoothDeviceData(BluetoothData):
             "Pairing Mode",
         )
 
+    def poll_needed(self) -> bool:
+        """Whether a scheduled poll has to connect to find out what is new.
+
+        False only when the latest advertisement carries record counters
+        (format 0x03 result identifier, legacy per-user sequence numbers)
+        that match the ones seen when the last readout completed, and no
+        status flag asks for a connection.
+        """
+        if self.invalid_time or self.forced_transfer or self.pairing_mode:
+            return True
+        counters = self._advertised_record_counters
+        return counters is None or counters != self._polled_record_counters
+
     @staticmethod
     def _decode_omron_msd_fields(payload: bytes) -> dict[str, Any] | None:
         """Decode OMRON MSD into a normalized dict, or ``None`` on mismatch.
@@ -299,8 +380,13 @@ class OmronBluetoothDeviceData(BluetoothData):
             Status byte at ``payload[1]`` uses the same bit layout as
             0x08 / 0x09.  Per-user sequence numbers occupy
             ``payload[i*3 + 2 .. i*3 + 4]``, so minimum required length is
-            ``4 + (user_count * 3)``.  HEM-7142T2 and other older
-            single-user cuffs emit format 0x01 with ``len(payload) == 5``.
+            ``4 + (user_count * 3)`` and never less than the full
+            ``2 + 3 * max(user_count, 1)`` sequence bytes; a shorter payload
+            is rejected rather than yielding a truncated counter.
+            HEM-7142T2 and other older single-user cuffs emit format 0x01
+            with ``len(payload) == 5`` (format, status, one 3-byte counter).
+            The sequence numbers are returned as ``user_sequence_numbers``
+            (little-endian, at least one user); other formats return ``()``.
 
         Format 0x08 (BLS-style, fixed per user count):
             user_count == 0 → ``len(payload) == 10`` (MSD 12B)
@@ -332,6 +418,7 @@ class OmronBluetoothDeviceData(BluetoothData):
                 "guidance_mode": (b12 & 0x30) >> 4,
                 "result_identifier_num": payload[2],
                 # Not present in this format.
+                "user_sequence_numbers": (),
                 "streaming_mode": False,
                 "service_uuid_mode": False,
                 "forced_transfer": False,
@@ -340,11 +427,17 @@ class OmronBluetoothDeviceData(BluetoothData):
         if b11 in (0x01, 0x02, 0x06):
             b13 = payload[1]
             user_count = b13 & 0x03
-            min_len = 4 + (user_count * 3)
+            counters = max(user_count, 1)
+            min_len = max(4 + (user_count * 3), 2 + counters * 3)
             if len(payload) < min_len:
                 return None
+            sequence_numbers = tuple(
+                int.from_bytes(payload[i * 3 + 2:i * 3 + 5], "little")
+                for i in range(counters)
+            )
             return {
                 "user_register_count": user_count,
+                "user_sequence_numbers": sequence_numbers,
                 "invalid_time": bool(b13 & 0x04),
                 "pairing_mode": bool(b13 & 0x08),
                 "streaming_mode": bool(b13 & 0x10),
@@ -374,6 +467,7 @@ class OmronBluetoothDeviceData(BluetoothData):
                 # Not present in this format.
                 "guidance_mode": 0,
                 "result_identifier_num": 0,
+                "user_sequence_numbers": (),
             }
 
         if b11 == 0x09:
@@ -392,6 +486,7 @@ class OmronBluetoothDeviceData(BluetoothData):
                 # Not present in this format.
                 "guidance_mode": 0,
                 "result_identifier_num": 0,
+                "user_sequence_numbers": (),
             }
 
         return None
@@ -774,10 +869,17 @@ class OmronBluetoothDeviceData(BluetoothData):
         }
 
     async def _read_latest_via_bls_racp(self, client: BleakClient) -> dict[str, Any] | None:
-        """Request latest BP measurement via BLS RACP and parse 0x2A35 notification."""
+        """Request latest BP measurement via BLS RACP and parse 0x2A35 notification.
+
+        Skipped without any GATT traffic once the capability profile records
+        that the path does not work on this device.
+        """
+        if self.capabilities.bls_racp is False:
+            return None
         meas_char = client.services.get_characteristic(BP_MEASUREMENT_CHAR_UUID)
         racp_char = client.services.get_characteristic(BP_RACP_CHAR_UUID)
         if meas_char is None or racp_char is None:
+            self.capabilities.bls_racp = False
             if not self._bls_racp_unavailable_logged:
                 _LOGGER.debug(
                     "BLS RACP path unavailable: missing characteristics "
@@ -790,6 +892,7 @@ class OmronBluetoothDeviceData(BluetoothData):
 
         measurement_future: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
         racp_done = asyncio.Event()
+        racp_response: list[bytes] = []
 
         def _meas_cb(_: Any, data: bytearray) -> None:
             if not measurement_future.done() and data:
@@ -797,33 +900,53 @@ class OmronBluetoothDeviceData(BluetoothData):
 
         def _racp_cb(_: Any, data: bytearray) -> None:
             # Response code or procedure-complete indication.
-            if data:
-                racp_done.set()
+            if not data:
+                return
+            racp_response.append(bytes(data))
+            racp_done.set()
+            # A response code other than success ends the wait: no record
+            # (0x06) or the procedure is refused.
+            if (
+                len(data) >= 4
+                and data[0] == 0x06
+                and data[3] != 0x01
+                and not measurement_future.done()
+            ):
+                measurement_future.set_exception(
+                    ConnectionError(f"RACP response {bytes(data).hex()}")
+                )
 
         try:
-            await client.start_notify(BP_MEASUREMENT_CHAR_UUID, _meas_cb)
-            await client.start_notify(BP_RACP_CHAR_UUID, _racp_cb)
+            await gatt_start_notify(client, meas_char, _meas_cb)
+            await gatt_start_notify(client, racp_char, _racp_cb)
             await asyncio.sleep(0.5)
             # RACP: Report Stored Records (0x01), operator Last Record (0x06)
-            await client.write_gatt_char(BP_RACP_CHAR_UUID, b"\x01\x06", response=True)
+            await gatt_write(client, racp_char, b"\x01\x06", response=True)
             raw = await asyncio.wait_for(measurement_future, timeout=3.0)
             try:
                 await asyncio.wait_for(racp_done.wait(), timeout=1.5)
             except asyncio.TimeoutError:
                 pass
+            self.capabilities.bls_racp = True
             return self._parse_bp_measurement(raw)
         except Exception as exc:
             if not self._bls_racp_unavailable_logged:
                 self._bls_racp_unavailable_logged = True
+            if self.capabilities.bls_racp is None and _bls_racp_unsupported(
+                racp_response[-1] if racp_response else None, exc
+            ):
+                # Refused on this GATT layout: stop probing until the layout
+                # changes rather than paying the wait every poll.
+                self.capabilities.bls_racp = False
             _LOGGER.debug("BLS RACP latest read failed: %s", exc)
             return None
         finally:
             try:
-                await client.stop_notify(BP_MEASUREMENT_CHAR_UUID)
+                await gatt_stop_notify(client, meas_char)
             except Exception:
                 pass
             try:
-                await client.stop_notify(BP_RACP_CHAR_UUID)
+                await gatt_stop_notify(client, racp_char)
             except Exception:
                 pass
 
@@ -840,6 +963,39 @@ class OmronBluetoothDeviceData(BluetoothData):
         self.set_device_manufacturer(manufacturer)
         self.pending = False
 
+    def _observe_gatt_layout(self, session: OmronDeviceSession) -> None:
+        """Check the capability profile against this link's GATT layout.
+
+        A different service set, a moved handle or a characteristic that no
+        longer resolves drops every cached flag, so the optional features
+        are probed again.
+        """
+        try:
+            services, handles = session.gatt_layout()
+        except Exception as exc:
+            _LOGGER.debug("GATT layout unavailable for %s: %s", session.address, exc)
+            return
+        if not self.capabilities.observe_layout(services, handles):
+            _LOGGER.debug(
+                "Learning GATT capabilities for %s (%d services)",
+                session.address,
+                len(services),
+            )
+
+    @staticmethod
+    def _optional_phase_allowed(session: OmronDeviceSession, phase: str) -> bool:
+        """True unless the poll budget is too low to start the optional ``phase``."""
+        budget = session.budget
+        if budget is None or budget.allows(OPTIONAL_PHASE_MIN_SECONDS):
+            return True
+        _LOGGER.debug(
+            "Skipping %s for %s: %.1fs of poll budget left",
+            phase,
+            session.address,
+            budget.remaining(),
+        )
+        return False
+
     async def _poll_device_readout(
         self,
         session: OmronDeviceSession,
@@ -849,6 +1005,21 @@ class OmronBluetoothDeviceData(BluetoothData):
         memory_session_active: bool,
     ) -> None:
         """Time sync, record fetch, and device info reads for one poll cycle."""
+        if memory_session_active:
+            try:
+                # Index block, time-sync window and expected record slots in
+                # as few block reads as possible; the steps below reuse them.
+                await self._driver.prefetch_poll_reads(
+                    session,
+                    sequence_numbers=self.user_sequence_numbers,
+                    time_sync=self._device_config.supports_eeprom_time_sync,
+                )
+            except Exception as exc:
+                _LOGGER.debug(
+                    "EEPROM prefetch failed for %s (reading on demand): %s",
+                    ble_device.address,
+                    exc,
+                )
         try:
             if memory_session_active:
                 if self._device_config.supports_eeprom_time_sync:
@@ -876,8 +1047,13 @@ class OmronBluetoothDeviceData(BluetoothData):
         record: dict[str, Any] | None = None
         latest_by_user: dict[int, dict[str, Any]] = {}
         if multi_user_mode:
-            latest_by_user = await self._driver.get_latest_records_per_user(session)
-            if not latest_by_user:
+            latest_by_user = await self._driver.get_latest_records_per_user(
+                session, sequence_numbers=self.user_sequence_numbers
+            )
+            record_source = self._driver.last_record_source
+            if not latest_by_user and self._optional_phase_allowed(
+                session, "diagnostic BLS RACP probe"
+            ):
                 # Diagnostic only: the classic EEPROM index/full-scan path found
                 # nothing usable. Probe the standard BLE Blood Pressure Service
                 # RACP path too so the log shows whether this device exposes
@@ -898,30 +1074,36 @@ class OmronBluetoothDeviceData(BluetoothData):
                         exc,
                     )
         else:
-            record = await self._driver.get_latest_record(session)
+            record = await self._driver.get_latest_record(
+                session, sequence_numbers=self.user_sequence_numbers
+            )
+            record_source = self._driver.last_record_source
             live_record: dict[str, Any] | None = None
-            live_record = await self._read_latest_via_bls_racp(client)
-            if not self._bp_char_unavailable:
-                try:
-                    bp_raw = await client.read_gatt_char(BP_MEASUREMENT_CHAR_UUID)
-                    if bp_raw:
-                        if live_record is None:
-                            live_record = self._parse_bp_measurement(bytes(bp_raw))
-                except Exception as exc:
-                    if "Read not permitted" in str(exc):
-                        self._bp_char_unavailable = True
-                        _LOGGER.debug(
-                            "BP measurement char 0x2A35 read not permitted on %s; "
-                            "disabling live BLS read path",
-                            ble_device.address,
+            if self._optional_phase_allowed(session, "BLS live read"):
+                live_record = await self._read_latest_via_bls_racp(client)
+                if BP_MEASUREMENT_CHAR_UUID not in self.capabilities.unreadable:
+                    try:
+                        bp_raw = await gatt_read(
+                            client, session.gatt_char(BP_MEASUREMENT_CHAR_UUID)
                         )
-                    else:
-                        _LOGGER.debug(
-                            "Read BP measurement char 0x2A35 failed for %s: %s",
-                            ble_device.address,
-                            exc,
-                        )
-                    live_record = None
+                        if bp_raw:
+                            if live_record is None:
+                                live_record = self._parse_bp_measurement(bytes(bp_raw))
+                    except Exception as exc:
+                        if "Read not permitted" in str(exc):
+                            self.capabilities.unreadable.add(BP_MEASUREMENT_CHAR_UUID)
+                            _LOGGER.debug(
+                                "BP measurement char 0x2A35 read not permitted on %s; "
+                                "disabling live BLS read path",
+                                ble_device.address,
+                            )
+                        else:
+                            _LOGGER.debug(
+                                "Read BP measurement char 0x2A35 failed for %s: %s",
+                                ble_device.address,
+                                exc,
+                            )
+                        live_record = None
 
             if live_record and isinstance(live_record.get("sys"), int) and isinstance(live_record.get("dia"), int):
                 eeprom_dt = record.get("datetime") if record else None
@@ -954,6 +1136,7 @@ class OmronBluetoothDeviceData(BluetoothData):
                     if "user" not in merged:
                         merged["user"] = 1
                     record = merged
+                    record_source = "bls"
 
         if multi_user_mode:
             if latest_by_user:
@@ -989,6 +1172,25 @@ class OmronBluetoothDeviceData(BluetoothData):
             if signature != self._last_record_signature:
                 self._last_record_signature = signature
 
+        self._readout_completed = True
+        if record_source is not None:
+            self.capabilities.record_source = record_source
+
+        if memory_session_active and self.background_scan_bytes:
+            try:
+                if await self._driver.advance_background_scan(
+                    session,
+                    byte_budget=self.background_scan_bytes,
+                    time_budget=BACKGROUND_SCAN_SECONDS_PER_POLL,
+                ):
+                    self.background_scan_bytes = None
+            except Exception as exc:
+                _LOGGER.debug(
+                    "Amortized EEPROM scan step failed for %s: %s",
+                    ble_device.address,
+                    exc,
+                )
+
         absolute_latest_record = None
         if multi_user_mode and latest_by_user:
             absolute_latest_record = max(
@@ -1021,13 +1223,13 @@ class OmronBluetoothDeviceData(BluetoothData):
                     "Found battery characteristic in cached services for %s",
                     ble_device.address,
                 )
-                bat_bytes = await client.read_gatt_char(char_bat)
+                bat_bytes = await gatt_read(client, char_bat)
             else:
                 _LOGGER.debug(
                     "Battery char not in cached services, falling back to UUID for %s",
                     ble_device.address,
                 )
-                bat_bytes = await client.read_gatt_char(BATTERY_LEVEL_UUID)
+                bat_bytes = await gatt_read(client, BATTERY_LEVEL_UUID)
 
             if bat_bytes:
                 bat_level = int(bat_bytes[0])
@@ -1040,10 +1242,15 @@ class OmronBluetoothDeviceData(BluetoothData):
         except Exception as exc:
             _LOGGER.debug("Failed to read Battery Level: %s", exc)
 
+        # Battery Service above is always read; the Device Information
+        # strings below only change with a firmware update.
+        if not self._optional_phase_allowed(session, "device information reads"):
+            return
+
         try:
             char_fw = client.services.get_characteristic(FIRMWARE_REVISION_UUID)
             if char_fw:
-                fw_bytes = await client.read_gatt_char(char_fw)
+                fw_bytes = await gatt_read(client, char_fw)
                 if fw_bytes:
                     fw_rev = fw_bytes.decode("utf-8").strip(" \x00")
                     self.set_device_sw_version(fw_rev)
@@ -1053,7 +1260,7 @@ class OmronBluetoothDeviceData(BluetoothData):
         try:
             char_hw = client.services.get_characteristic(HARDWARE_REVISION_UUID)
             if char_hw:
-                hw_bytes = await client.read_gatt_char(char_hw)
+                hw_bytes = await gatt_read(client, char_hw)
                 if hw_bytes:
                     hw_rev = hw_bytes.decode("utf-8").strip(" \x00")
                     self.set_device_hw_version(hw_rev)
@@ -1063,7 +1270,7 @@ class OmronBluetoothDeviceData(BluetoothData):
         try:
             char_mfg = client.services.get_characteristic(MANUFACTURER_NAME_UUID)
             if char_mfg:
-                mfg_bytes = await client.read_gatt_char(char_mfg)
+                mfg_bytes = await gatt_read(client, char_mfg)
                 if mfg_bytes:
                     mfg_name = mfg_bytes.decode("utf-8").strip(" \x00")
                     self.set_device_manufacturer(mfg_name)
@@ -1073,21 +1280,27 @@ class OmronBluetoothDeviceData(BluetoothData):
         try:
             char_model = client.services.get_characteristic(MODEL_NUMBER_UUID)
             if char_model:
-                await client.read_gatt_char(char_model)
+                await gatt_read(client, char_model)
         except Exception as exc:
             _LOGGER.debug("Failed to read Model Number: %s", exc)
 
     async def async_poll(
-        self, ble_device: BLEDevice, preconnected_session: OmronDeviceSession | None = None
+        self,
+        ble_device: BLEDevice,
+        preconnected_session: OmronDeviceSession | None = None,
+        budget: DeadlineBudget | None = None,
     ) -> SensorUpdate:
         """Poll the device to retrieve measurement records via GATT connection.
 
         If ``preconnected_session`` is supplied and still connected, the poll
         adopts that setup session (unlock + memory session state preserved) so
         pairing, time sync, and the initial read share one connection.
+        ``budget`` bounds the whole poll; each phase gets a share of it.
         """
         async with self._poll_guard:
             self._events_updates.clear()
+            record_counters = self._advertised_record_counters
+            self._readout_completed = False
 
             try:
                 if (
@@ -1109,7 +1322,10 @@ class OmronBluetoothDeviceData(BluetoothData):
                         preconnected_session.reclaim_ownership()
                         await preconnected_session.aclose()
                     session = OmronDeviceSession(ble_device, self._device_config)
+                if budget is not None:
+                    session.budget = budget.share(CONNECT_BUDGET_SHARE)
                 async with session:
+                    session.budget = budget
                     client = session.client
 
                     if not await session.verify_parent_service():
@@ -1126,6 +1342,7 @@ class OmronBluetoothDeviceData(BluetoothData):
                             stack_label,
                         )
                         return self._finish_update()
+                    self._observe_gatt_layout(session)
 
                     if self.last_service_info and not self._device_config.is_advertisement_compatible(
                         self.last_service_info.service_uuids
@@ -1176,7 +1393,15 @@ class OmronBluetoothDeviceData(BluetoothData):
                         else:
                             memory_session_active = False
                             last_session_exc: Exception | None = None
+                            open_budget = (
+                                budget.share(MEMORY_OPEN_BUDGET_SHARE)
+                                if budget is not None
+                                else None
+                            )
                             for session_attempt in range(3):
+                                # Each open attempt's reply and retry loops run
+                                # against the open share, not the whole poll.
+                                session.budget = open_budget
                                 try:
                                     pair_first = (
                                         session_attempt == 0
@@ -1188,6 +1413,7 @@ class OmronBluetoothDeviceData(BluetoothData):
                                         pair_first=pair_first
                                     ):
                                         memory_session_active = True
+                                        session.budget = budget
                                         await self._poll_device_readout(
                                             session,
                                             client,
@@ -1209,6 +1435,14 @@ class OmronBluetoothDeviceData(BluetoothData):
                                         session_attempt + 1,
                                         exc,
                                     )
+                                    if open_budget is not None and open_budget.expired:
+                                        _LOGGER.debug(
+                                            "Memory session open budget spent after "
+                                            "attempt %d/3 for %s",
+                                            session_attempt + 1,
+                                            ble_device.address,
+                                        )
+                                        break
                                     if session_attempt < 2:
                                         try:
                                             await session.reset_session_state()
@@ -1219,6 +1453,7 @@ class OmronBluetoothDeviceData(BluetoothData):
                                             )
                                         await session.refresh_services()
                                         await asyncio.sleep(0.5)
+                            session.budget = budget
                             if not memory_session_active and last_session_exc is not None:
                                 if (
                                     self._device_config.host_pairing_mode
@@ -1239,21 +1474,31 @@ class OmronBluetoothDeviceData(BluetoothData):
                                         "after retries: %s",
                                         last_session_exc,
                                     )
-                                try:
-                                    async with session.memory_session_after_unlock():
-                                        await self._poll_device_readout(
-                                            session,
-                                            client,
-                                            ble_device,
-                                            memory_session_active=True,
-                                        )
-                                # Exception, never BaseException — see above:
-                                # cancellation has to reach the poll deadline.
-                                except Exception as fallback_exc:
+                                if budget is not None and not budget.allows(
+                                    MEMORY_FALLBACK_MIN_SECONDS
+                                ):
                                     _LOGGER.debug(
-                                        "Fallback memory session readout failed: %s",
-                                        fallback_exc,
+                                        "Skipping fallback memory session for %s: "
+                                        "%.1fs of poll budget left",
+                                        ble_device.address,
+                                        budget.remaining(),
                                     )
+                                else:
+                                    try:
+                                        async with session.memory_session_after_unlock():
+                                            await self._poll_device_readout(
+                                                session,
+                                                client,
+                                                ble_device,
+                                                memory_session_active=True,
+                                            )
+                                    # Exception, never BaseException — see above:
+                                    # cancellation has to reach the poll deadline.
+                                    except Exception as fallback_exc:
+                                        _LOGGER.debug(
+                                            "Fallback memory session readout failed: %s",
+                                            fallback_exc,
+                                        )
                     else:
                         await self._poll_device_readout(
                             session,
@@ -1283,6 +1528,8 @@ class OmronBluetoothDeviceData(BluetoothData):
                     exc_info=exc,
                 )
 
+            if self._readout_completed:
+                self._polled_record_counters = record_counters
             return self._finish_update()
 
     async def async_retry_pairing(self, ble_device: BLEDevice) -> OmronDeviceSession:
@@ -0,0 +1,49 @@
+"""Coalesce the EEPROM ranges one poll needs into as few block reads as possible.
+
+A poll touches the index block, the time-sync window of the settings block
+and a few record slots. These often overlap or sit a few bytes apart; read
+one by one, the same settings bytes cross the radio two or three times.
+"""
+from __future__ import annotations
+
+from typing import Iterable
+
+
+def block_count(length: int, block_size: int) -> int:
+    """Number of ``block_size`` reads needed for ``length`` bytes."""
+    return -(-length // block_size)
+
+
+def coalesce_ranges(
+    required: Iterable[tuple[int, int]],
+    block_size: int,
+    optional: Iterable[tuple[int, int]] = (),
+) -> list[tuple[int, int]]:
+    """Merge ``(address, length)`` ranges into the reads that cover them.
+
+    Two ranges become one read when the merged span needs no more
+    ``block_size`` reads than the two apart. An optional range is only kept
+    when it fits into a required read without adding a block read.
+    Returns the reads sorted by address; they never overlap.
+    """
+    block_size = max(block_size, 1)
+    ranges = sorted(
+        [(address, address + length, True) for address, length in required if length > 0]
+        + [(address, address + length, False) for address, length in optional if length > 0]
+    )
+    runs: list[tuple[int, int, bool]] = []
+    for start, end, needed in ranges:
+        if runs:
+            run_start, run_end, run_needed = runs[-1]
+            merged = block_count(max(run_end, end) - run_start, block_size)
+            run_blocks = block_count(run_end - run_start, block_size)
+            blocks = block_count(end - start, block_size)
+            if run_needed == needed:
+                fits = merged <= run_blocks + blocks
+            else:
+                fits = merged <= (run_blocks if run_needed else blocks)
+            if fits:
+                runs[-1] = (run_start, max(run_end, end), run_needed or needed)
+                continue
+        runs.append((start, end, needed))
+    return [(start, end - start) for start, end, needed in runs if needed]
@@ -11,6 +11,7 @@ from bleak import BleakClient
 
 from .const import CTS_CHARACTERISTIC_UUID, LOCAL_TIME_INFO_UUID
 from .devices import get_device_config
+from .gatt_io import gatt_read, gatt_start_notify, gatt_stop_notify, gatt_write
 from .omron_driver import OmronDeviceDriver, OmronDeviceSession, _bleak_refresh_services
 
 if TYPE_CHECKING:
@@ -38,8 +39,15 @@ def build_cts_payload(now: dt.datetime) -> bytearray:
     return payload
 
 
-async def _sync_time_via_cts(client: BleakClient, model: str) -> bool:
-    """Write Current Time Service (+ optional Local Time Information). Returns True if CTS write ran."""
+async def _sync_time_via_cts(
+    client: BleakClient,
+    model: str,
+    transport: OmronDeviceSession | None = None,
+) -> bool:
+    """Write Current Time Service (+ optional Local Time Information). Returns True if CTS write ran.
+
+    With ``transport`` the notify wait ends as soon as its link drops.
+    """
     try:
         await _bleak_refresh_services(client)
         services = client.services
@@ -76,12 +84,12 @@ async def _sync_time_via_cts(client: BleakClient, model: str) -> bool:
         cts_notify_ready.set()
 
     try:
-        await client.start_notify(CTS_CHARACTERISTIC_UUID, _cts_callback)
+        await gatt_start_notify(client, char_cts, _cts_callback)
         await asyncio.sleep(0.5)
         cts_notify_started = True
 
         try:
-            cts_snapshot = await client.read_gatt_char(CTS_CHARACTERISTIC_UUID)
+            cts_snapshot = await gatt_read(client, char_cts)
             if cts_snapshot:
                 cts_snapshot_ok = True
                 _LOGGER.debug(
@@ -97,7 +105,10 @@ async def _sync_time_via_cts(client: BleakClient, model: str) -> bool:
             )
 
         try:
-            await asyncio.wait_for(cts_notify_ready.wait(), timeout=1.0)
+            if transport is not None:
+                await transport.wait_on_link(cts_notify_ready.wait(), 1.0)
+            else:
+                await asyncio.wait_for(cts_notify_ready.wait(), timeout=1.0)
             if cts_notify_payload[0] is not None:
                 cts_notify_ok = True
                 _LOGGER.debug(
@@ -123,7 +134,7 @@ async def _sync_time_via_cts(client: BleakClient, model: str) -> bool:
                 cts_notify_ok,
             )
         else:
-            await client.write_gatt_char(CTS_CHARACTERISTIC_UUID, payload, response=True)
+            await gatt_write(client, char_cts, payload, response=True)
             _LOGGER.debug(
                 "Synced current time via CTS for %s: %s (notify_ok=%s)",
                 model,
@@ -146,7 +157,7 @@ async def _sync_time_via_cts(client: BleakClient, model: str) -> bool:
                         dst_byte = 0x04
 
                     lti_payload = bytes([tz_byte, dst_byte])
-                    await client.write_gatt_char(LOCAL_TIME_INFO_UUID, lti_payload, response=True)
+                    await gatt_write(client, char_lti, lti_payload, response=True)
                     _LOGGER.debug(
                         "Local Time Info sync success for %s (tz_offset_15m=%d, dst=%d)",
                         model,
@@ -160,7 +171,7 @@ async def _sync_time_via_cts(client: BleakClient, model: str) -> bool:
     finally:
         if cts_notify_started:
             try:
-                await client.stop_notify(CTS_CHARACTERISTIC_UUID)
+                await gatt_stop_notify(client, char_cts)
             except Exception as exc:
                 _LOGGER.debug("CTS stop_notify failed for %s: %s", model, exc)
 
@@ -207,8 +218,7 @@ async def _sync_eeprom_with_session(
     if transport.memory_session_active:
         return await _sync_time_via_eeprom(client, model, config, transport)
     if leave_memory_session_open:
-        await transport.unlock()
-        await transport.open_memory_session()
+        await transport.unlock_and_open_memory_session()
         return await _sync_time_via_eeprom(client, model, config, transport)
     async with transport.memory_session_after_unlock():
         return await _sync_time_via_eeprom(client, model, config, transport)
@@ -267,7 +277,7 @@ async def async_sync_device_time(
         if eeprom_success:
             return True
 
-    cts_success = await _sync_time_via_cts(client, model)
+    cts_success = await _sync_time_via_cts(client, model, transport)
 
     if config.supports_eeprom_time_sync and not eeprom_success:
         eeprom_success = await _sync_eeprom_with_session(
@@ -0,0 +1,83 @@
+"""EEPROM ranges already transferred, kept so an interrupted readout can resume.
+
+Weak links often drop mid-scan. Each block read successfully is recorded
+here together with the write cursors seen in the index block; the next
+session reuses the bytes for as long as the cursors are unchanged (no new
+measurement, no memory clear) and only reads what is still missing.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TransferCheckpoint:
+    """Address spans read from one device and the write cursors they belong to."""
+
+    # Raw write cursor per user from the index block the spans were read under.
+    write_cursors: tuple[int, ...] | None = None
+    # Start address -> bytes read there. Spans never overlap.
+    spans: dict[int, bytes] = field(default_factory=dict)
+    # OmronDeviceSession.link_epoch the cursors were last checked under; a
+    # new link must re-read the index block before trusting the spans.
+    link_epoch: int | None = None
+
+    def validate(self, write_cursors: tuple[int, ...], link_epoch: int) -> bool:
+        """Adopt ``write_cursors``; drop all spans if they differ from the stored ones.
+
+        Returns True when existing spans were kept.
+        """
+        kept = self.write_cursors == write_cursors and bool(self.spans)
+        if self.write_cursors != write_cursors:
+            self.spans.clear()
+        self.write_cursors = write_cursors
+        self.link_epoch = link_epoch
+        return kept
+
+    def add(self, address: int, data: bytes) -> None:
+        """Record ``data`` as read at ``address``."""
+        if data:
+            self.spans[address] = bytes(data)
+
+    def patch(self, address: int, data: bytes) -> None:
+        """Overwrite the held bytes that ``data`` written at ``address`` replaces."""
+        end = address + len(data)
+        for span_start, span in list(self.spans.items()):
+            lo = max(span_start, address)
+            hi = min(span_start + len(span), end)
+            if lo < hi:
+                updated = bytearray(span)
+                updated[lo - span_start:hi - span_start] = data[lo - address:hi - address]
+                self.spans[span_start] = bytes(updated)
+
+    def missing(self, start: int, length: int) -> list[tuple[int, int]]:
+        """Return ``(address, length)`` gaps of ``[start, start+length)`` not yet read."""
+        gaps: list[tuple[int, int]] = []
+        cursor, end = start, start + length
+        for address in sorted(self.spans):
+            span_end = address + len(self.spans[address])
+            if span_end <= cursor or address >= end:
+                continue
+            if address > cursor:
+                gaps.append((cursor, address - cursor))
+            cursor = max(cursor, span_end)
+            if cursor >= end:
+                break
+        if cursor < end:
+            gaps.append((cursor, end - cursor))
+        return gaps
+
+    def assemble(self, start: int, length: int) -> bytearray:
+        """Return ``[start, start+length)`` from the recorded spans (must be complete)."""
+        out = bytearray(length)
+        for address, data in self.spans.items():
+            lo = max(address, start)
+            hi = min(address + len(data), start + length)
+            if lo < hi:
+                out[lo - start:hi - start] = data[lo - address:hi - address]
+        return out
+
+    @property
+    def byte_count(self) -> int:
+        """Number of bytes held."""
+        return sum(len(data) for data in self.spans.values())
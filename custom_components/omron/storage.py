@@ -0,0 +1,99 @@
+"""Persistent storage for per-device EEPROM record mirrors and GATT capabilities."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Generic, Protocol, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .omron_ble.device_capabilities import DeviceCapabilities
+from .omron_ble.eeprom_mirror import EepromMirror
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.eeprom_mirror"
+CAPABILITIES_STORAGE_KEY = f"{DOMAIN}.capabilities"
+# Polls can update the mirror every few minutes; batch the disk writes.
+SAVE_DELAY_SECONDS = 30
+
+
+class _StoredData(Protocol):
+    def as_dict(self) -> dict[str, Any]: ...
+
+
+_T = TypeVar("_T", bound=_StoredData)
+
+
+class _AddressStore(Generic[_T]):
+    """Plain-data objects of all configured devices, keyed by BLE address."""
+
+    def __init__(
+        self, hass: HomeAssistant, key: str, from_dict: Callable[[Any], _T | None]
+    ) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, key)
+        self._from_dict = from_dict
+        self._data: dict[str, Any] = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Load stored objects from disk (once; concurrent callers wait)."""
+        async with self._load_lock:
+            if not self._loaded:
+                self._data = await self._store.async_load() or {}
+                self._loaded = True
+
+    def get(self, address: str) -> _T | None:
+        """Return the stored object for ``address``, if any."""
+        stored = self._data.get(address.upper())
+        return self._from_dict(stored) if stored is not None else None
+
+    @callback
+    def async_schedule_save(self, address: str, value: _T | None) -> None:
+        """Store ``value`` for ``address`` and schedule a delayed write."""
+        if value is None:
+            return
+        self._data[address.upper()] = value.as_dict()
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY_SECONDS)
+
+    @callback
+    def async_remove(self, address: str) -> None:
+        """Forget the object for ``address`` (e.g. when the entry is removed)."""
+        if self._data.pop(address.upper(), None) is not None:
+            self._store.async_delay_save(lambda: self._data, SAVE_DELAY_SECONDS)
+
+
+class OmronMirrorStore(_AddressStore[EepromMirror]):
+    """EEPROM mirrors of all configured devices, keyed by BLE address."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        super().__init__(hass, STORAGE_KEY, EepromMirror.from_dict)
+
+
+class OmronCapabilityStore(_AddressStore[DeviceCapabilities]):
+    """GATT capability profiles of all configured devices, keyed by BLE address."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        super().__init__(hass, CAPABILITIES_STORAGE_KEY, DeviceCapabilities.from_dict)
+
+
+async def async_get_mirror_store(hass: HomeAssistant) -> OmronMirrorStore:
+    """Return the shared mirror store, loading it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    store = domain_data.get("_eeprom_mirror_store")
+    if store is None:
+        store = domain_data["_eeprom_mirror_store"] = OmronMirrorStore(hass)
+    await store.async_load()
+    return store
+
+
+async def async_get_capability_store(hass: HomeAssistant) -> OmronCapabilityStore:
+    """Return the shared capability store, loading it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    store = domain_data.get("_capability_store")
+    if store is None:
+        store = domain_data["_capability_store"] = OmronCapabilityStore(hass)
+    await store.async_load()
+    return store
@@ -0,0 +1,88 @@
+"""Microbenchmarks: memory-protocol frame codec vs. the byte-by-byte encoding it replaced.
+
+Usage: python3 scripts/bench_frame_codec.py [<repo_root>]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import timeit
+
+REPO = sys.argv[1] if len(sys.argv) > 1 else os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+sys.path.insert(0, os.path.join(REPO, "tests"))
+import conftest  # noqa: E402, F401  (stubs homeassistant/bleak so the package imports)
+
+from custom_components.omron.omron_ble.frame_codec import (  # noqa: E402
+    FRAME_HEADER,
+    encode_read,
+    encode_write,
+    xor_checksum,
+)
+
+
+# ------------------------------------------------------- previous encoding
+def _loop_xor(data) -> int:
+    crc = 0
+    for byte in data:
+        crc ^= byte
+    return crc
+
+
+def _old_read(address: int, blocksize: int) -> bytearray:
+    cmd = bytearray.fromhex("080100")
+    cmd += address.to_bytes(2, "big")
+    cmd += blocksize.to_bytes(1, "big")
+    xor_crc = 0
+    for byte in cmd:
+        xor_crc ^= byte
+    cmd += b"\x00"
+    cmd.append(xor_crc)
+    return cmd
+
+
+def _old_write(address: int, data: bytes) -> bytearray:
+    cmd = bytearray()
+    cmd += (len(data) + 8).to_bytes(1, "big")
+    cmd += bytearray.fromhex("01c0")
+    cmd += address.to_bytes(2, "big")
+    cmd += len(data).to_bytes(1, "big")
+    cmd += data
+    xor_crc = 0
+    for byte in cmd:
+        xor_crc ^= byte
+    cmd += b"\x00"
+    cmd.append(xor_crc)
+    return cmd
+
+
+def _old_header(frame: bytearray):
+    return bytes(frame[1:3]), int.from_bytes(bytes(frame[3:5]), "big"), frame[5]
+
+
+# ------------------------------------------------------------------ runner
+def _bench(label: str, old, new, number: int = 50_000, repeat: int = 20) -> None:
+    # Old and new runs alternate so machine noise hits both alike.
+    old_s = new_s = float("inf")
+    for _ in range(repeat):
+        old_s = min(old_s, timeit.timeit(old, number=number))
+        new_s = min(new_s, timeit.timeit(new, number=number))
+    print(
+        f"{label:32s} old {old_s / number * 1e9:8.0f} ns   "
+        f"new {new_s / number * 1e9:8.0f} ns   x{old_s / new_s:5.2f}"
+    )
+
+
+def main() -> None:
+    reply = bytearray(encode_write(0x02AC, bytes(range(0x38))))
+    view = memoryview(reply)
+    data = bytes(range(8))
+
+    _bench("read command", lambda: _old_read(0x02AC, 0x38), lambda: encode_read(0x02AC, 0x38))
+    _bench("write command (8 B)", lambda: _old_write(0x0286, data), lambda: encode_write(0x0286, data))
+    _bench("rx check byte (64 B frame)", lambda: _loop_xor(reply), lambda: xor_checksum(view))
+    _bench("rx header fields", lambda: _old_header(reply), lambda: FRAME_HEADER.unpack_from(view))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Adaptive 0x0801 block size tuning (LinkTuning + OmronDeviceSession.read_memory_range)."""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.omron.omron_ble import omron_driver
+from custom_components.omron.omron_ble.deadline_budget import (
+    DeadlineBudget,
+    DeadlineExhausted,
+)
+from custom_components.omron.omron_ble.devices import DeviceConfig
+from custom_components.omron.omron_ble.link_tuning import (
+    BLOCK_SIZE_FLOOR,
+    CLEAN_READS_BEFORE_GROWING,
+    LinkTuning,
+    link_tuning_for,
+    reset_link_tuning,
+)
+from custom_components.omron.omron_ble.omron_driver import OmronDeviceSession
+
+_ADDRESS = "AA:BB:CC:DD:EE:01"
+
+
+class TestRecordBlockRead:
+    def test_grows_after_clean_reads_up_to_max(self):
+        tuning = LinkTuning()
+        size = 0x28
+        for _ in range(10 * CLEAN_READS_BEFORE_GROWING):
+            tuning.record_block_read(size, False, 0x38)
+            size = tuning.block_size
+        assert tuning.block_size == 0x38
+
+    def test_fault_halves_and_caps_future_growth(self):
+        tuning = LinkTuning()
+        tuning.record_block_read(0x38, True, 0x38)
+        assert tuning.block_size == 0x1C
+        assert tuning.block_size_ceiling == 0x30
+
+        size = tuning.block_size
+        for _ in range(10 * CLEAN_READS_BEFORE_GROWING):
+            tuning.record_block_read(size, False, 0x38)
+            size = tuning.block_size
+        assert tuning.block_size == 0x30
+
+    def test_fault_at_configured_size_recovers_it(self):
+        tuning = LinkTuning()
+        tuning.record_block_read(0x2C, True, 0x38, 0x2C)
+        assert tuning.block_size == 0x16
+        assert tuning.block_size_ceiling == 0x2C
+
+        size = tuning.block_size
+        for _ in range(10 * CLEAN_READS_BEFORE_GROWING):
+            tuning.record_block_read(size, False, 0x38, 0x2C)
+            size = tuning.block_size
+        assert tuning.block_size == 0x2C
+
+    def test_never_shrinks_below_floor(self):
+        tuning = LinkTuning()
+        tuning.record_block_read(BLOCK_SIZE_FLOOR, True, 0x38)
+        assert tuning.block_size == BLOCK_SIZE_FLOOR
+
+
+def _frame(address: int, payload: bytes) -> bytearray:
+    frame = bytearray([len(payload) + 8, 0x81, 0x00])
+    frame += address.to_bytes(2, "big")
+    frame.append(len(payload))
+    frame += payload
+    frame.append(0x00)
+    crc = 0
+    for b in frame:
+        crc ^= b
+    frame.append(crc)
+    return frame
+
+
+@pytest.fixture(autouse=True)
+def _fast_protocol(monkeypatch):
+    monkeypatch.setattr(omron_driver, "_MEMORY_PROTOCOL_REPLY_TIMEOUT_SEC", 0.02)
+    monkeypatch.setattr(omron_driver, "_MEMORY_PROTOCOL_RETRY_BACKOFF_SEC", 0.0)
+    reset_link_tuning()
+    yield
+    reset_link_tuning()
+
+
+def _session(max_answered: int) -> tuple[OmronDeviceSession, list[int]]:
+    """Session over a 4-channel fake that never answers blocks above ``max_answered``."""
+    ble_device = MagicMock()
+    ble_device.address = _ADDRESS
+    session = OmronDeviceSession(
+        ble_device,
+        DeviceConfig(
+            model="HEM-7322T",
+            transmission_block_size=0x30,
+        ),
+    )
+    sizes: list[int] = []
+
+    async def write_gatt_char(_uuid, data, response=True):
+        data = bytes(data)
+        address, size = int.from_bytes(data[3:5], "big"), data[5]
+        sizes.append(size)
+        if size > max_answered:
+            return
+        frame = _frame(address, bytes(size))
+
+        def _deliver():
+            for ch in range(0, len(frame), 16):
+                session._on_notify_channel_data(ch // 16, frame[ch:ch + 16])
+
+        asyncio.get_running_loop().call_soon(_deliver)
+
+    client = MagicMock()
+    client.is_connected = True
+    client.write_gatt_char = write_gatt_char
+    session._client = client
+    session._notify_handle_to_channel = {0: 0, 1: 1, 2: 2, 3: 3}
+    return session, sizes
+
+
+def test_clean_reads_grow_block_size_to_multi_channel_max():
+    session, sizes = _session(max_answered=0x38)
+
+    async def _run():
+        for _ in range(CLEAN_READS_BEFORE_GROWING + 1):
+            await session.read_memory_range(0x0100, 0xE0)
+
+    asyncio.run(_run())
+    assert max(sizes) == 0x38
+    assert session.read_block_size == 0x38
+
+
+def test_failed_probe_falls_back_and_remembers_smaller_size():
+    session, sizes = _session(max_answered=0x30)
+    link_tuning_for(_ADDRESS).block_size = 0x38
+
+    data = asyncio.run(session.read_memory_range(0x0100, 0x70))
+
+    assert len(data) == 0x70
+    assert 0x38 in sizes
+    # Retried at the profile's transmission_block_size after the probe failed.
+    last_probe = len(sizes) - 1 - sizes[::-1].index(0x38)
+    assert sizes[last_probe + 1:] == [0x30, 0x30, 0x10]
+    assert session.read_block_size < 0x38
+    # The fault was blamed on the block size, not on pipelining.
+    assert not link_tuning_for(_ADDRESS).pipeline_demoted
+
+
+def test_explicit_block_size_is_not_tuned():
+    session, sizes = _session(max_answered=0x38)
+
+    asyncio.run(session.read_memory_range(0x0100, 0x40, 0x10))
+
+    assert set(sizes) == {0x10}
+    assert link_tuning_for(_ADDRESS).block_size is None
+
+
+def test_spent_poll_budget_leaves_tuning_alone():
+    session, sizes = _session(max_answered=0)
+    tuning = link_tuning_for(_ADDRESS)
+    tuning.block_size = 0x30
+    session.budget = DeadlineBudget.start(0.03)
+
+    with pytest.raises(DeadlineExhausted):
+        asyncio.run(session.read_memory_range(0x0100, 0x70))
+
+    assert sizes
+    assert tuning.block_size == 0x30
+    assert tuning.block_size_ceiling is None
+    assert not tuning.pipeline_demoted
@@ -0,0 +1,93 @@
+"""Advertisement record counters gate the scheduled poll.
+
+conftest replaces the Home Assistant base classes with MagicMock, so
+OmronBluetoothDeviceData cannot be instantiated here; the functions under
+test are compiled straight from the parser source instead.
+"""
+import ast
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+_COMPONENT = Path(__file__).resolve().parent.parent / "custom_components" / "omron"
+
+
+def _load_method(relative_path: str, name: str):
+    tree = ast.parse((_COMPONENT / relative_path).read_text(encoding="utf-8"))
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == name:
+            node.decorator_list = []
+            namespace: dict[str, Any] = {"Any": Any}
+            exec(compile(ast.Module(body=[node], type_ignores=[]), relative_path, "exec"), namespace)
+            return namespace[name]
+    raise AssertionError(f"{name} not found in {relative_path}")
+
+
+_decode = _load_method("omron_ble/parser.py", "_decode_omron_msd_fields")
+_poll_needed = _load_method("omron_ble/parser.py", "poll_needed")
+
+
+def _parser_state(**overrides) -> SimpleNamespace:
+    state = dict(
+        invalid_time=False,
+        forced_transfer=False,
+        pairing_mode=False,
+        _advertised_record_counters=(0x03, 7),
+        _polled_record_counters=(0x03, 7),
+    )
+    state.update(overrides)
+    return SimpleNamespace(**state)
+
+
+class TestDecodeSequenceNumbers:
+    def test_legacy_format_carries_per_user_sequence_numbers(self):
+        fields = _decode(bytes([0x02, 0x02, 0x05, 0x00, 0x00, 0x09, 0x01, 0x00, 0x00, 0x00]))
+        assert fields["user_sequence_numbers"] == (0x05, 0x0109)
+
+    def test_single_user_legacy_format_keeps_one_counter(self):
+        fields = _decode(bytes([0x01, 0x00, 0x2A, 0x00, 0x00]))
+        assert fields["user_sequence_numbers"] == (0x2A,)
+
+    def test_single_user_counter_is_three_bytes_wide(self):
+        # HEM-7142T2 length contract: format 0x01, status, one 3-byte LE
+        # counter and nothing else (len(payload) == 5). A wider field would
+        # not fit, a narrower one would leave a byte over.
+        fields = _decode(bytes([0x01, 0x00, 0x34, 0x12, 0x01]))
+        assert fields["user_sequence_numbers"] == (0x011234,)
+
+    def test_short_legacy_payload_is_rejected_not_truncated(self):
+        assert _decode(bytes([0x01, 0x00, 0x2A, 0x00])) is None
+        # Two users need 2 + 2 * 3 sequence bytes.
+        assert _decode(bytes([0x02, 0x02, 0x05, 0x00, 0x00, 0x09, 0x01])) is None
+
+    def test_formats_without_counters_report_none(self):
+        fields = _decode(bytes([0x09, 0x00]) + b"\x00" * 7)
+        assert fields["user_sequence_numbers"] == ()
+
+
+class TestPollNeeded:
+    def test_unchanged_counters_skip_the_poll(self):
+        assert _poll_needed(_parser_state()) is False
+
+    def test_changed_counters_poll(self):
+        assert _poll_needed(_parser_state(_advertised_record_counters=(0x03, 8))) is True
+
+    def test_no_counters_always_poll(self):
+        state = _parser_state(_advertised_record_counters=None, _polled_record_counters=None)
+        assert _poll_needed(state) is True
+
+    def test_status_flags_force_a_connection(self):
+        assert _poll_needed(_parser_state(invalid_time=True)) is True
+        assert _poll_needed(_parser_state(forced_transfer=True)) is True
+
+
+def test_poll_skip_is_checked_before_taking_the_session_lock():
+    tree = ast.parse((_COMPONENT / "__init__.py").read_text(encoding="utf-8"))
+    fn = next(
+        node for node in ast.walk(tree)
+        if isinstance(node, ast.AsyncFunctionDef) and node.name == "_async_poll_data"
+    )
+    source = ast.unparse(fn)
+    assert "poll_needed()" in source
+    assert source.index("poll_needed()") < source.index("async with session_lock")
+    assert "force_poll" in source
@@ -0,0 +1,127 @@
+"""Amortized full scan: the mirror is filled a budgeted window per poll."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.omron.omron_ble.devices import DeviceConfig, Endianness
+from custom_components.omron.omron_ble.eeprom_mirror import EepromMirror
+from custom_components.omron.omron_ble.omron_driver import (
+    OmronDeviceDriver,
+    OmronDeviceSession,
+)
+
+_BASE = 0x0300
+_RECORD = 0x0E
+_SLOTS = 10
+_INDEX = 0x0260
+
+
+def _config() -> DeviceConfig:
+    return DeviceConfig(
+        model="HEM-7131U",
+        endianness=Endianness.BIG,
+        user_start_addresses=[_BASE],
+        per_user_records_count=[_SLOTS],
+        record_byte_size=_RECORD,
+        settings_read_address=_INDEX,
+        index_pointer_layout={
+            "index_region_byte_size": 0x04,
+            "endianness": "big",
+            "users": [
+                {"write_cursor_offset": 0x00, "slot_index_min": 0, "slot_index_max": _SLOTS - 1},
+            ],
+        },
+    )
+
+
+class _Device:
+    def __init__(self):
+        self.image = bytearray(b"\xff" * 0x1000)
+        for slot in range(_SLOTS):
+            self.write_slot(slot, slot)
+        self.set_cursor(0x0005)  # slot 4 is the newest
+        self.reads: list[tuple[int, int]] = []
+
+    def write_slot(self, slot: int, fill: int) -> None:
+        self.image[_BASE + slot * _RECORD:_BASE + (slot + 1) * _RECORD] = bytes([fill]) * _RECORD
+
+    def set_cursor(self, raw: int) -> None:
+        self.image[_INDEX:_INDEX + 2] = raw.to_bytes(2, "big")
+
+    def transport(self) -> OmronDeviceSession:
+        transport = OmronDeviceSession(MagicMock(), _config())
+        transport.unlock = AsyncMock()
+
+        async def fake_read_memory_range(addr, size, block_size=None, checkpoint=None):
+            self.reads.append((addr, size))
+            return bytearray(self.image[addr:addr + size])
+
+        transport.read_memory_range = AsyncMock(side_effect=fake_read_memory_range)
+        return transport
+
+    def step(self, driver: OmronDeviceDriver, byte_budget: int) -> bool:
+        self.reads.clear()
+        return asyncio.run(
+            driver.advance_background_scan(self.transport(), byte_budget=byte_budget)
+        )
+
+    def record_reads(self) -> list[tuple[int, int]]:
+        return [read for read in self.reads if read[0] != _INDEX]
+
+
+def _slot(n: int) -> int:
+    return _BASE + n * _RECORD
+
+
+def _driver() -> OmronDeviceDriver:
+    driver = OmronDeviceDriver(_config())
+    driver.mirror = EepromMirror(model="HEM-7131U")
+    return driver
+
+
+def test_budget_bounds_each_poll_and_newest_slots_come_first():
+    device = _Device()
+    driver = _driver()
+
+    assert device.step(driver, 4 * _RECORD) is False
+    assert device.record_reads() == [(_slot(1), 4 * _RECORD)]
+    assert driver.mirror.scans[0].slots_read == {1, 2, 3, 4}
+
+    assert device.step(driver, 4 * _RECORD) is False
+    # Newest first: slot 0, then 9 down to 7 as one run.
+    assert device.record_reads() == [(_slot(0), _RECORD), (_slot(7), 3 * _RECORD)]
+
+    assert device.step(driver, 4 * _RECORD) is True
+    assert device.record_reads() == [(_slot(5), 2 * _RECORD)]
+    assert driver.mirror.regions[0] == device.image[_BASE:_BASE + _SLOTS * _RECORD]
+    assert driver.mirror.scans == {}
+
+
+def test_progress_survives_storage_and_new_slots_are_reread():
+    device = _Device()
+    driver = _driver()
+    device.step(driver, 4 * _RECORD)
+
+    restored = _driver()
+    restored.mirror = EepromMirror.from_dict(driver.mirror.as_dict())
+    # Two measurements land on slots 5 and 6 between polls.
+    device.write_slot(5, 0x50)
+    device.write_slot(6, 0x60)
+    device.set_cursor(0x0007)
+
+    while not device.step(restored, 4 * _RECORD):
+        pass
+    assert restored.mirror.regions[0] == device.image[_BASE:_BASE + _SLOTS * _RECORD]
+    assert restored.mirror.cursor(0) == 0x0007
+
+
+def test_full_scan_reads_only_what_the_amortized_scan_lacks():
+    device = _Device()
+    driver = _driver()
+    device.step(driver, 8 * _RECORD)
+
+    device.reads.clear()
+    records = asyncio.run(driver.get_user_records(device.transport(), [1]))
+
+    assert sorted(device.record_reads()) == [(_slot(5), 2 * _RECORD)]
+    assert driver.mirror.scans == {}
+    assert 1 in records
@@ -0,0 +1,131 @@
+"""Index-path backtrack windows are read as one range and learn their depth."""
+import asyncio
+import datetime as dt
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.omron.omron_ble.devices import DeviceConfig, Endianness
+from custom_components.omron.omron_ble.omron_driver import OmronDeviceDriver, OmronDeviceSession
+
+_BASE = 0x02AC
+_RECORD = 0x0E
+_INDEX = 0x0260
+_SLOTS = 60
+
+_CONFIG = dict(
+    model="HEM-7320T",
+    endianness=Endianness.BIG,
+    user_start_addresses=[_BASE],
+    per_user_records_count=[_SLOTS],
+    record_byte_size=_RECORD,
+    settings_read_address=_INDEX,
+    index_pointer_layout={
+        "index_region_byte_size": 0x08,
+        "endianness": "big",
+        "backtrack_slots": 2,
+        "users": [
+            {"write_cursor_offset": 0x00, "write_cursor_mask": 0xFF, "slot_index_min": 0, "slot_index_max": 59, "slot_index_bias": -1},
+        ],
+    },
+)
+
+
+def _record(minute: int) -> bytes:
+    """Classic 14-byte vital record, 2026-03-02 08:<minute>, 120/80 70 bpm."""
+    flags1 = 8 | (2 << 5) | (3 << 10)
+    flags2 = minute << 6
+    return (
+        bytes([120 - 25, 80, 70, 26])
+        + flags1.to_bytes(2, "little")
+        + flags2.to_bytes(2, "little")
+        + b"\x00" * 6
+    )
+
+
+class _Device:
+    def __init__(self):
+        self.image = bytearray(b"\xff" * 0x1000)
+        self.image[_INDEX:_INDEX + 8] = b"\x00" * 8
+        self.reads: list[tuple[int, int]] = []
+        self.driver = OmronDeviceDriver(DeviceConfig(**_CONFIG))
+        self.driver._now_func = lambda: dt.datetime(2026, 3, 3)
+
+    def store(self, slot: int, data: bytes) -> None:
+        self.image[_BASE + slot * _RECORD:_BASE + (slot + 1) * _RECORD] = data
+
+    def point_at(self, slot: int) -> None:
+        self.image[_INDEX:_INDEX + 2] = (slot + 1).to_bytes(2, "big")
+
+    def latest(self) -> dict | None:
+        transport = OmronDeviceSession(MagicMock(), self.driver._config)
+        transport.unlock = AsyncMock()
+
+        async def fake_read_memory_range(addr, size, block_size=None, checkpoint=None):
+            self.reads.append((addr, size))
+            return bytearray(self.image[addr:addr + size])
+
+        transport.read_memory_range = AsyncMock(side_effect=fake_read_memory_range)
+        self.reads.clear()
+        return asyncio.run(self.driver.get_latest_record(transport))
+
+    def record_reads(self) -> list[tuple[int, int]]:
+        return [read for read in self.reads if read[0] != _INDEX]
+
+
+def test_first_poll_reads_the_whole_window_in_one_range():
+    device = _Device()
+    for slot in range(5):
+        device.store(slot, _record(slot))
+    device.point_at(4)
+
+    record = device.latest()
+
+    assert record["datetime"].minute == 4
+    assert device.record_reads() == [(_BASE + 2 * _RECORD, 3 * _RECORD)]
+
+
+def test_learned_depth_shrinks_the_next_window_to_the_cursor_slot():
+    device = _Device()
+    for slot in range(5):
+        device.store(slot, _record(slot))
+    device.point_at(4)
+    device.latest()
+    device.store(5, _record(5))
+    device.point_at(5)
+
+    record = device.latest()
+
+    assert record["datetime"].minute == 5
+    assert device.record_reads() == [(_BASE + 5 * _RECORD, _RECORD)]
+
+
+def test_window_wrapping_the_ring_splits_into_two_reads():
+    device = _Device()
+    device.store(_SLOTS - 1, _record(1))
+    device.store(0, _record(2))
+    device.point_at(0)
+
+    record = device.latest()
+
+    assert record["datetime"].minute == 2
+    assert sorted(device.record_reads()) == [
+        (_BASE, _RECORD),
+        (_BASE + (_SLOTS - 2) * _RECORD, 2 * _RECORD),
+    ]
+
+
+def test_miss_in_the_learned_window_reads_the_remaining_depth():
+    device = _Device()
+    for slot in range(5):
+        device.store(slot, _record(slot))
+    device.point_at(4)
+    device.latest()
+    # The cursor advances over a slot the device has not finished writing.
+    device.point_at(6)
+
+    record = device.latest()
+
+    assert record["datetime"].minute == 4
+    assert device.record_reads() == [
+        (_BASE + 6 * _RECORD, _RECORD),
+        (_BASE + 4 * _RECORD, 2 * _RECORD),
+    ]
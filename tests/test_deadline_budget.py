@@ -0,0 +1,115 @@
+"""Poll deadline budget (DeadlineBudget) and the retry loops that honour it."""
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.omron.omron_ble import omron_driver
+from custom_components.omron.omron_ble.deadline_budget import (
+    DeadlineBudget,
+    DeadlineExhausted,
+)
+from custom_components.omron.omron_ble.devices import DeviceConfig
+from custom_components.omron.omron_ble.frame_codec import encode_read
+from custom_components.omron.omron_ble.link_tuning import reset_link_tuning
+from custom_components.omron.omron_ble.omron_driver import (
+    OmronDeviceDriver,
+    OmronDeviceSession,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_tuning():
+    reset_link_tuning()
+    yield
+    reset_link_tuning()
+
+
+class TestDeadlineBudget:
+    def test_share_is_a_fraction_of_what_remains(self):
+        budget = DeadlineBudget.start(100.0)
+        share = budget.share(0.25)
+        assert 24.0 < share.remaining() <= 25.0
+        assert share.deadline <= budget.deadline
+
+    def test_cap_and_allows(self):
+        budget = DeadlineBudget.start(2.0)
+        assert budget.cap(5.0) <= 2.0
+        assert budget.cap(0.5) == 0.5
+        assert budget.allows(1.0)
+        assert not budget.allows(10.0)
+
+    def test_spent_budget_raises_typed_error(self):
+        budget = DeadlineBudget(time.monotonic() - 1.0)
+        assert budget.expired
+        assert budget.remaining() == 0.0
+        with pytest.raises(DeadlineExhausted):
+            budget.check("retry")
+        assert issubclass(DeadlineExhausted, ConnectionError)
+
+
+def _silent_session():
+    """Session over a fake client that accepts writes and never replies."""
+    ble_device = MagicMock()
+    ble_device.address = "AA:BB:CC:DD:EE:22"
+    session = OmronDeviceSession(ble_device, DeviceConfig(model="HEM-7322T"))
+    writes = []
+
+    async def write_gatt_char(_char, data, response=None):
+        writes.append(bytes(data))
+
+    client = MagicMock()
+    client.is_connected = True
+    client.write_gatt_char = write_gatt_char
+    session._client = client
+    return session, writes
+
+
+def test_reply_retries_stop_when_the_budget_is_spent(monkeypatch):
+    monkeypatch.setattr(omron_driver, "_MEMORY_PROTOCOL_REPLY_TIMEOUT_SEC", 5.0)
+    monkeypatch.setattr(omron_driver, "_MEMORY_PROTOCOL_RETRY_BACKOFF_SEC", 0.0)
+    session, writes = _silent_session()
+    session.budget = DeadlineBudget.start(0.1)
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExhausted):
+        asyncio.run(session._write_command_and_wait_reply(encode_read(0x0260, 0x10)))
+
+    # One capped wait instead of four 5 s reply timeouts.
+    assert time.monotonic() - started < 1.0
+    assert len(writes) == 1
+
+
+def test_reply_timeout_is_capped_by_the_budget():
+    session, _writes = _silent_session()
+    assert session._reply_timeout() == omron_driver._MEMORY_PROTOCOL_REPLY_TIMEOUT_SEC
+    session.budget = DeadlineBudget.start(0.5)
+    assert session._reply_timeout() <= 0.5
+
+
+def test_full_scan_fallback_skipped_on_a_short_budget(monkeypatch):
+    driver = OmronDeviceDriver(DeviceConfig(model="HEM-7322T"))
+    full_scans = []
+
+    async def _none(*_args, **_kwargs):
+        return None
+
+    async def _no_search(*_args, **_kwargs):
+        return False, None
+
+    async def _full_scan(*_args, **_kwargs):
+        full_scans.append(True)
+        return {"sys": 120}
+
+    monkeypatch.setattr(driver, "_get_latest_via_index", _none)
+    monkeypatch.setattr(driver, "_get_latest_via_ring_search", _no_search)
+    monkeypatch.setattr(driver, "_get_latest_via_full_scan", _full_scan)
+    transport = MagicMock()
+
+    transport.budget = DeadlineBudget.start(1.0)
+    assert asyncio.run(driver.get_latest_record(transport)) is None
+    assert not full_scans
+
+    transport.budget = None
+    assert asyncio.run(driver.get_latest_record(transport)) == {"sys": 120}
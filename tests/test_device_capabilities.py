@@ -0,0 +1,111 @@
+"""DeviceCapabilities persistence, invalidation, and the session's GATT layout."""
+import ast
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+from custom_components.omron.omron_ble.const import BP_MEASUREMENT_CHAR_UUID
+from custom_components.omron.omron_ble.device_capabilities import DeviceCapabilities
+from custom_components.omron.omron_ble.devices import DeviceConfig
+from custom_components.omron.omron_ble.omron_driver import OmronDeviceSession
+
+_SERVICES = ["00001810-0000-1000-8000-00805f9b34fb", "ecbe3980-c9a2-11e1-b1bd-0002a5d5c51b"]
+_HANDLES = {BP_MEASUREMENT_CHAR_UUID: 0x21, "db5b55e0-aee7-11e1-965e-0002a5d5c51b": 0x40}
+
+
+def _learned() -> DeviceCapabilities:
+    capabilities = DeviceCapabilities(model="HEM-7322T")
+    capabilities.observe_layout(list(_SERVICES), dict(_HANDLES))
+    capabilities.unreadable.add(BP_MEASUREMENT_CHAR_UUID)
+    capabilities.bls_racp = False
+    capabilities.record_source = "index"
+    return capabilities
+
+
+class TestDeviceCapabilities:
+    def test_round_trips_through_storage_dict(self):
+        capabilities = _learned()
+        assert DeviceCapabilities.from_dict(capabilities.as_dict()) == capabilities
+
+    def test_unreadable_storage_is_discarded(self):
+        assert DeviceCapabilities.from_dict({"handles": {"x": "zz"}}) is None
+
+    def test_same_layout_keeps_learned_flags(self):
+        capabilities = _learned()
+        assert capabilities.observe_layout(list(reversed(_SERVICES)), dict(_HANDLES))
+        assert capabilities.bls_racp is False
+        assert BP_MEASUREMENT_CHAR_UUID in capabilities.unreadable
+
+    def test_first_layout_is_learned_not_kept(self):
+        capabilities = DeviceCapabilities(model="HEM-7322T")
+        assert not capabilities.observe_layout(list(_SERVICES), dict(_HANDLES))
+        assert capabilities.known
+
+    def test_changed_service_set_invalidates(self):
+        capabilities = _learned()
+        assert not capabilities.observe_layout(_SERVICES[:1], dict(_HANDLES))
+        assert capabilities.bls_racp is None
+        assert not capabilities.unreadable
+        assert capabilities.services == sorted(_SERVICES[:1])
+
+    def test_moved_handle_invalidates(self):
+        capabilities = _learned()
+        moved = dict(_HANDLES, **{BP_MEASUREMENT_CHAR_UUID: 0x25})
+        assert not capabilities.observe_layout(list(_SERVICES), moved)
+        assert capabilities.record_source is None
+
+    def test_failed_lookup_invalidates(self):
+        capabilities = _learned()
+        missing = {uuid: h for uuid, h in _HANDLES.items() if uuid != BP_MEASUREMENT_CHAR_UUID}
+        assert not capabilities.observe_layout(list(_SERVICES), missing)
+        assert capabilities.bls_racp is None
+
+
+def test_session_reports_services_and_resolved_handles():
+    ble_device = MagicMock()
+    ble_device.address = "AA:BB:CC:DD:EE:23"
+    session = OmronDeviceSession(ble_device, DeviceConfig(model="HEM-7322T"))
+    unlock = session.config.unlock_uuid
+
+    def get_characteristic(uuid):
+        return MagicMock(handle=0x50) if uuid == unlock else None
+
+    services = MagicMock()
+    services.__iter__.return_value = iter([MagicMock(uuid=_SERVICES[0])])
+    services.get_characteristic.side_effect = get_characteristic
+    client = MagicMock()
+    client.services = services
+    session._client = client
+
+    assert session.gatt_layout() == ([_SERVICES[0]], {unlock: 0x50})
+
+
+def _load_function(relative_path: str, name: str):
+    """Compile one function from the parser source (HA base classes are mocked)."""
+    source = Path(__file__).resolve().parent.parent / "custom_components" / "omron" / relative_path
+    tree = ast.parse(source.read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == name:
+            namespace: dict[str, Any] = {}
+            exec(compile(ast.Module(body=[node], type_ignores=[]), relative_path, "exec"), namespace)
+            return namespace[name]
+    raise AssertionError(f"{name} not found in {relative_path}")
+
+
+_bls_racp_unsupported = _load_function("omron_ble/parser.py", "_bls_racp_unsupported")
+
+
+class TestBlsRacpFailure:
+    def test_refused_procedure_disables_the_path(self):
+        # Response Code for Report Stored Records: operator not supported.
+        assert _bls_racp_unsupported(bytes([0x06, 0x00, 0x01, 0x04]), ConnectionError())
+
+    def test_not_permitted_disables_the_path(self):
+        assert _bls_racp_unsupported(None, Exception("Write not permitted"))
+
+    def test_timeouts_and_link_drops_leave_it_unknown(self):
+        assert not _bls_racp_unsupported(None, asyncio.TimeoutError())
+        assert not _bls_racp_unsupported(None, ConnectionError("BLE disconnected"))
+        # No stored record is an answer, not a refusal.
+        assert not _bls_racp_unsupported(bytes([0x06, 0x00, 0x01, 0x06]), ConnectionError())
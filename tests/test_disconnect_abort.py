@@ -0,0 +1,88 @@
+"""Disconnected callback ends pending reply and handshake waits immediately."""
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.omron.omron_ble import omron_driver
+from custom_components.omron.omron_ble.devices import DeviceConfig
+from custom_components.omron.omron_ble.frame_codec import encode_read
+from custom_components.omron.omron_ble.omron_driver import OmronDeviceSession
+
+
+@pytest.fixture(autouse=True)
+def _slow_replies(monkeypatch):
+    # Long enough that only the disconnected callback can end the wait in time.
+    monkeypatch.setattr(omron_driver, "_MEMORY_PROTOCOL_REPLY_TIMEOUT_SEC", 5.0)
+
+
+def _session():
+    ble_device = MagicMock()
+    ble_device.address = "AA:BB:CC:DD:EE:20"
+    session = OmronDeviceSession(ble_device, DeviceConfig(model="HEM-7322T"))
+    client = MagicMock()
+    client.is_connected = True
+
+    async def write_gatt_char(_char, _data, response=True):
+        return None  # the device never answers
+
+    client.write_gatt_char = write_gatt_char
+    session._client = client
+    return session, client
+
+
+def test_drop_fails_pending_reply_without_waiting_for_timeout():
+    session, client = _session()
+
+    async def _run():
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, session._on_client_disconnected, client)
+        started = time.monotonic()
+        with pytest.raises(ConnectionError):
+            await session._write_command_and_wait_reply(encode_read(0x0260, 0x10))
+        return time.monotonic() - started
+
+    assert asyncio.run(_run()) < 1.0
+    assert not session._pending_replies
+
+
+def test_drop_ends_handshake_wait_with_connection_error():
+    session, client = _session()
+
+    async def _run():
+        event = asyncio.Event()
+        asyncio.get_running_loop().call_later(
+            0.05, session._on_client_disconnected, client
+        )
+        with pytest.raises(ConnectionError):
+            await session.wait_on_link(event.wait(), 5.0)
+
+    asyncio.run(_run())
+    assert not session._link_waiters
+
+
+def test_wait_on_link_returns_result_or_times_out():
+    session, _client = _session()
+
+    async def _run():
+        event = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.01, event.set)
+        assert await session.wait_on_link(event.wait(), 1.0) is True
+        with pytest.raises(asyncio.TimeoutError):
+            await session.wait_on_link(asyncio.Event().wait(), 0.01)
+
+    asyncio.run(_run())
+
+
+def test_callback_from_an_earlier_client_is_ignored():
+    session, _client = _session()
+
+    async def _run():
+        event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, session._on_client_disconnected, MagicMock())
+        loop.call_later(0.05, event.set)
+        assert await session.wait_on_link(event.wait(), 1.0) is True
+
+    asyncio.run(_run())
@@ -0,0 +1,141 @@
+"""EepromMirror persistence and OmronDeviceDriver delta sync by write cursor."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.omron.omron_ble.devices import DeviceConfig, Endianness
+from custom_components.omron.omron_ble.eeprom_mirror import EepromMirror
+from custom_components.omron.omron_ble.omron_driver import (
+    OmronDeviceDriver,
+    OmronDeviceSession,
+)
+
+_BASE = 0x0300
+_RECORD = 0x0E
+_SLOTS = 10
+
+
+def _config() -> DeviceConfig:
+    return DeviceConfig(
+        model="HEM-7131U",
+        endianness=Endianness.BIG,
+        user_start_addresses=[_BASE],
+        per_user_records_count=[_SLOTS],
+        record_byte_size=_RECORD,
+        settings_read_address=0x0260,
+        index_pointer_layout={
+            "index_region_byte_size": 0x04,
+            "endianness": "big",
+            "users": [
+                {"write_cursor_offset": 0x00, "slot_index_min": 0, "slot_index_max": _SLOTS - 1},
+            ],
+        },
+    )
+
+
+class _Device:
+    def __init__(self):
+        self.image = bytearray(b"\xff" * 0x1000)
+        self.reads: list[tuple[int, int]] = []
+        self.set_cursor(0x8000)
+
+    def set_cursor(self, raw: int) -> None:
+        self.image[0x0260:0x0262] = raw.to_bytes(2, "big")
+
+    def transport(self) -> OmronDeviceSession:
+        transport = OmronDeviceSession(MagicMock(), _config())
+        transport.unlock = AsyncMock()
+
+        async def fake_read_memory_range(addr, size, block_size=None, checkpoint=None):
+            self.reads.append((addr, size))
+            return bytearray(self.image[addr:addr + size])
+
+        transport.read_memory_range = AsyncMock(side_effect=fake_read_memory_range)
+        return transport
+
+    def sync(self, driver: OmronDeviceDriver) -> list[tuple[int, int]]:
+        self.reads.clear()
+        asyncio.run(driver.get_all_records(self.transport()))
+        return [r for r in self.reads if r[0] != 0x0260]
+
+
+def _slot(n: int) -> int:
+    return _BASE + n * _RECORD
+
+
+class TestEepromMirror:
+    def test_round_trips_through_storage_dict(self):
+        mirror = EepromMirror(model="HEM-7131U")
+        mirror.store_user(1, 0x0005, b"\x01\x02")
+        restored = EepromMirror.from_dict(mirror.as_dict())
+        assert restored == mirror
+
+    def test_unreadable_storage_is_discarded(self):
+        assert EepromMirror.from_dict({"regions": {"0": "zz"}}) is None
+
+
+class TestMirrorDeltaSync:
+    def test_first_sync_reads_full_region_then_only_new_slots(self):
+        device = _Device()
+        driver = OmronDeviceDriver(_config())
+        driver.mirror = EepromMirror(model="HEM-7131U")
+
+        device.set_cursor(3)  # slots 0..2 written
+        assert device.sync(driver) == [(_BASE, _SLOTS * _RECORD)]
+
+        device.set_cursor(5)  # slots 3, 4 written
+        device.image[_slot(3):_slot(5)] = b"\x11" * (2 * _RECORD)
+        # With slot 2, the newest mirrored one, to detect a memory clear.
+        assert device.sync(driver) == [(_slot(2), 3 * _RECORD)]
+        assert driver.mirror.regions[0][3 * _RECORD:5 * _RECORD] == b"\x11" * (2 * _RECORD)
+
+        # Unchanged cursor: index block only.
+        assert device.sync(driver) == []
+
+    def test_ring_wrap_reads_two_runs(self):
+        device = _Device()
+        driver = OmronDeviceDriver(_config())
+        driver.mirror = EepromMirror(model="HEM-7131U")
+        device.set_cursor(5)
+        device.sync(driver)
+
+        device.set_cursor(2)  # slots 5..9 and 0..1 written
+        assert device.sync(driver) == [(_slot(4), 6 * _RECORD), (_slot(0), 2 * _RECORD)]
+
+    def test_memory_clear_forces_full_read(self):
+        device = _Device()
+        driver = OmronDeviceDriver(_config())
+        driver.mirror = EepromMirror(model="HEM-7131U")
+        device.set_cursor(5)
+        device.sync(driver)
+
+        device.set_cursor(0x8000)
+        assert device.sync(driver) == [(_BASE, _SLOTS * _RECORD)]
+
+    def test_memory_clear_then_new_measurements_forces_full_read(self):
+        device = _Device()
+        driver = OmronDeviceDriver(_config())
+        driver.mirror = EepromMirror(model="HEM-7131U")
+        device.image[_slot(0):_slot(5)] = b"\x22" * (5 * _RECORD)
+        device.set_cursor(5)
+        device.sync(driver)
+
+        # Cleared, then seven new measurements: cursor 5 -> 7 looks like an
+        # ordinary two-slot delta, but slot 4 now holds a post-clear record.
+        device.image[_slot(0):_slot(_SLOTS)] = b"\xff" * (_SLOTS * _RECORD)
+        device.image[_slot(0):_slot(7)] = b"\x33" * (7 * _RECORD)
+        device.set_cursor(7)
+
+        reads = device.sync(driver)
+        assert reads[-1] == (_BASE, _SLOTS * _RECORD)
+        assert driver.mirror.regions[0] == device.image[_BASE:_BASE + _SLOTS * _RECORD]
+
+    def test_mirror_of_other_model_is_replaced(self):
+        device = _Device()
+        driver = OmronDeviceDriver(_config())
+        stale = EepromMirror(model="HEM-7322T")
+        stale.store_user(0, 5, b"\x00" * (_SLOTS * _RECORD))
+        driver.mirror = stale
+        device.set_cursor(5)
+
+        assert device.sync(driver) == [(_BASE, _SLOTS * _RECORD)]
+        assert driver.mirror.model == "HEM-7131U"
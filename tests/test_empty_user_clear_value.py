@@ -39,7 +39,7 @@ class TestEmptyUserClearValue:
 
         read_calls = []
 
-        async def fake_read_memory_range(addr, size, block_size=0x10):
+        async def fake_read_memory_range(addr, size, block_size=0x10, checkpoint=None):
             read_calls.append((addr, size))
             if addr == 0x0260:
                 return index_bytes
@@ -92,7 +92,7 @@ class TestEmptyUserClearValue:
 
         read_calls = []
 
-        async def fake_read_memory_range(addr, size, block_size=0x10):
+        async def fake_read_memory_range(addr, size, block_size=0x10, checkpoint=None):
             read_calls.append((addr, size))
             if addr == 0x0260:
                 return index_bytes
@@ -138,7 +138,7 @@ class TestEmptyUserClearValue:
 
         read_calls = []
 
-        async def fake_read_memory_range(addr, size, block_size=0x10):
+        async def fake_read_memory_range(addr, size, block_size=0x10, checkpoint=None):
             read_calls.append((addr, size))
             if addr == 0x0010:
                 return index_bytes
@@ -0,0 +1,59 @@
+"""Memory-protocol frame codec against the byte-by-byte reference encoding."""
+import random
+
+from custom_components.omron.omron_ble.frame_codec import (
+    CLOSE_SESSION_FRAME,
+    FRAME_HEADER,
+    OPEN_SESSION_FRAME,
+    encode_read,
+    encode_write,
+    xor_checksum,
+)
+
+
+def _reference_xor(data: bytes) -> int:
+    crc = 0
+    for byte in data:
+        crc ^= byte
+    return crc
+
+
+def _reference_read(address: int, block_size: int) -> bytes:
+    cmd = bytearray.fromhex("080100") + address.to_bytes(2, "big") + bytes([block_size])
+    crc = _reference_xor(cmd)
+    return bytes(cmd + b"\x00" + bytes([crc]))
+
+
+def _reference_write(address: int, data: bytes) -> bytes:
+    cmd = bytearray([len(data) + 8]) + bytes.fromhex("01c0") + address.to_bytes(2, "big")
+    cmd += bytes([len(data)]) + data
+    crc = _reference_xor(cmd)
+    return bytes(cmd + b"\x00" + bytes([crc]))
+
+
+def test_xor_checksum_matches_the_byte_loop_for_every_length():
+    rng = random.Random(7)
+    for length in range(0, 130):
+        data = bytes(rng.randrange(256) for _ in range(length))
+        assert xor_checksum(data) == _reference_xor(data)
+        assert xor_checksum(memoryview(data)) == _reference_xor(data)
+
+
+def test_read_and_write_commands_match_the_reference_encoding():
+    rng = random.Random(11)
+    for _ in range(200):
+        address = rng.randrange(0x10000)
+        size = rng.randrange(1, 0x39)
+        assert encode_read(address, size) == _reference_read(address, size)
+        data = bytes(rng.randrange(256) for _ in range(rng.randrange(0, 17)))
+        assert encode_write(address, data) == _reference_write(address, data)
+
+
+def test_constant_frames_carry_a_valid_check_byte():
+    assert xor_checksum(OPEN_SESSION_FRAME) == 0
+    assert xor_checksum(CLOSE_SESSION_FRAME) == 0
+
+
+def test_reply_header_unpacks_type_address_and_length():
+    frame = _reference_write(0x02AC, b"\x01\x02")
+    assert FRAME_HEADER.unpack_from(memoryview(frame)) == (b"\x01\xc0", 0x02AC, 2)
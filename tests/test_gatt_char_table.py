@@ -0,0 +1,83 @@
+"""Resolved GATT characteristic table (OmronDeviceSession.gatt_char)."""
+import asyncio
+from unittest.mock import MagicMock
+
+from custom_components.omron.omron_ble.devices import DeviceConfig
+from custom_components.omron.omron_ble.omron_driver import OmronDeviceSession
+
+
+class _Services:
+    """Service collection resolving every UUID to a distinct fake characteristic."""
+
+    def __init__(self, missing=()):
+        self.lookups = 0
+        self._missing = set(missing)
+        self._chars = {}
+
+    def get_characteristic(self, uuid):
+        self.lookups += 1
+        if uuid in self._missing:
+            return None
+        char = self._chars.get(uuid)
+        if char is None:
+            char = self._chars[uuid] = MagicMock(handle=len(self._chars), uuid=uuid)
+        return char
+
+
+def _session():
+    ble_device = MagicMock()
+    ble_device.address = "AA:BB:CC:DD:EE:19"
+    session = OmronDeviceSession(ble_device, DeviceConfig(model="HEM-7322T"))
+    client = MagicMock()
+    client.services = _Services()
+    session._client = client
+    return session, client
+
+
+def test_characteristics_resolved_once_per_service_collection():
+    session, client = _session()
+    tx = session._config.tx_channel_uuids[0]
+
+    first = session.gatt_char(tx)
+    lookups = client.services.lookups
+    for uuid in (*session._config.tx_channel_uuids, session._config.unlock_uuid):
+        session.gatt_char(uuid)
+
+    assert first.uuid == tx
+    assert client.services.lookups == lookups
+
+
+def test_table_rebuilt_when_services_are_refreshed():
+    session, client = _session()
+    tx = session._config.tx_channel_uuids[0]
+    before = session.gatt_char(tx)
+
+    client.services = _Services()
+    after = session.gatt_char(tx)
+
+    assert after is not before
+    assert after is client.services.get_characteristic(tx)
+
+
+def test_unresolved_uuid_falls_back_to_the_uuid_string():
+    session, client = _session()
+    unlock = session._config.unlock_uuid
+    client.services = _Services(missing={unlock})
+
+    assert session.gatt_char(unlock) == unlock
+
+
+def test_transmit_writes_resolved_characteristics():
+    session, client = _session()
+    written = []
+
+    async def write_gatt_char(char, data, response=True):
+        written.append(char)
+
+    client.is_connected = True
+    client.write_gatt_char = write_gatt_char
+
+    asyncio.run(session._transmit_command(bytes(range(0x20))))
+
+    assert written
+    assert all(not isinstance(char, str) for char in written)
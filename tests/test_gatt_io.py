@@ -0,0 +1,102 @@
+"""Per-operation GATT deadlines (gatt_io)."""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.omron.omron_ble import gatt_io
+from custom_components.omron.omron_ble.gatt_io import (
+    GATT_OPERATION_LIMITS,
+    GattOperationTimeout,
+    gatt_read,
+    gatt_start_notify,
+    gatt_timeout,
+    gatt_write,
+)
+from custom_components.omron.omron_ble.link_tuning import (
+    RttEstimator,
+    link_tuning_for,
+    reset_link_tuning,
+)
+
+_ADDRESS = "AA:BB:CC:DD:EE:21"
+
+
+@pytest.fixture(autouse=True)
+def _clean_tuning():
+    reset_link_tuning()
+    yield
+    reset_link_tuning()
+
+
+def _rtt(sample: float) -> RttEstimator:
+    rtt = RttEstimator()
+    rtt.observe(sample)
+    return rtt
+
+
+class TestGattTimeout:
+    def test_ceiling_until_the_first_rtt_sample(self):
+        for operation, (_floor, _trips, ceiling) in GATT_OPERATION_LIMITS.items():
+            assert gatt_timeout(operation, RttEstimator()) == ceiling
+
+    def test_fast_link_uses_the_floor(self):
+        floor = GATT_OPERATION_LIMITS["write"][0]
+        assert gatt_timeout("write", _rtt(0.05)) == floor
+
+    def test_scales_with_rtt_up_to_the_ceiling(self):
+        _floor, trips, ceiling = GATT_OPERATION_LIMITS["write"]
+        slow = _rtt(1.0)
+        assert gatt_timeout("write", slow) == min(ceiling, trips * (slow.srtt + 4 * slow.rttvar))
+        assert gatt_timeout("write", _rtt(30.0)) == ceiling
+
+    def test_notify_setup_gets_more_time_than_a_write(self):
+        rtt = _rtt(0.5)
+        assert gatt_timeout("start_notify", rtt) > gatt_timeout("write", rtt)
+
+
+def _client():
+    client = MagicMock()
+    client.address = _ADDRESS
+    return client
+
+
+def test_wedged_write_raises_typed_timeout(monkeypatch):
+    monkeypatch.setitem(gatt_io.GATT_OPERATION_LIMITS, "write", (0.01, 1, 0.05))
+    client = _client()
+
+    async def write_gatt_char(_char, _data, response=None):
+        await asyncio.sleep(10)
+
+    client.write_gatt_char = write_gatt_char
+
+    with pytest.raises(GattOperationTimeout) as info:
+        asyncio.run(gatt_write(client, "uuid", b"\x00", response=True))
+    assert info.value.operation == "write"
+    assert isinstance(info.value, ConnectionError)
+
+
+def test_deadline_follows_the_device_rtt(monkeypatch):
+    monkeypatch.setitem(gatt_io.GATT_OPERATION_LIMITS, "start_notify", (0.01, 2, 5.0))
+    link_tuning_for(_ADDRESS).rtt.observe(0.01)
+    client = _client()
+
+    async def start_notify(_char, _callback):
+        await asyncio.sleep(10)
+
+    client.start_notify = start_notify
+
+    with pytest.raises(GattOperationTimeout) as info:
+        asyncio.run(gatt_start_notify(client, "uuid", lambda _h, _d: None))
+    assert info.value.timeout < 0.1
+
+
+def test_completed_operation_returns_its_result():
+    client = _client()
+
+    async def read_gatt_char(_char):
+        return bytearray(b"\x64")
+
+    client.read_gatt_char = read_gatt_char
+
+    assert asyncio.run(gatt_read(client, "uuid")) == bytearray(b"\x64")
@@ -0,0 +1,97 @@
+"""Index-block fast path: unchanged cursors/unread counters skip the slot probes."""
+import asyncio
+import datetime as dt
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.omron.omron_ble.devices import DeviceConfig, Endianness
+from custom_components.omron.omron_ble.omron_driver import OmronDeviceDriver, OmronDeviceSession
+
+_CONFIG = dict(
+    model="HEM-7320T",
+    endianness=Endianness.BIG,
+    user_start_addresses=[0x02AC, 0x05F4],
+    per_user_records_count=[60, 60],
+    record_byte_size=0x0E,
+    settings_read_address=0x0260,
+    index_pointer_layout={
+        "index_region_byte_size": 0x08,
+        "endianness": "big",
+        "users": [
+            {"write_cursor_offset": 0x00, "unread_counter_offset": 0x04, "write_cursor_mask": 0xFF, "slot_index_min": 0, "slot_index_max": 59, "slot_index_bias": -1},
+            {"write_cursor_offset": 0x02, "unread_counter_offset": 0x06, "write_cursor_mask": 0xFF, "slot_index_min": 0, "slot_index_max": 59, "slot_index_bias": -1},
+        ],
+    },
+)
+
+
+def _record(minute: int) -> bytearray:
+    """Classic 14-byte vital record, 2026-03-02 08:<minute>, 120/80 70 bpm."""
+    flags1 = 8 | (2 << 5) | (3 << 10)
+    flags2 = minute << 6
+    return bytearray(
+        bytes([120 - 25, 80, 70, 26])
+        + flags1.to_bytes(2, "little")
+        + flags2.to_bytes(2, "little")
+        + b"\x00" * 6
+    )
+
+
+class _Device:
+    def __init__(self):
+        self.index = bytearray.fromhex("0003000500010001")
+        self.minute = 10
+        self.reads: list[int] = []
+
+    def poll(self, driver: OmronDeviceDriver) -> dict:
+        transport = OmronDeviceSession(MagicMock(), driver._config)
+        transport.unlock = AsyncMock()
+
+        async def fake_read_memory_range(addr, size, block_size=None, checkpoint=None):
+            self.reads.append(addr)
+            if addr == 0x0260:
+                return bytearray(self.index)
+            return _record(self.minute)
+
+        transport.read_memory_range = AsyncMock(side_effect=fake_read_memory_range)
+        self.reads.clear()
+        return asyncio.run(driver.get_latest_records_per_user(transport))
+
+
+def _driver() -> OmronDeviceDriver:
+    driver = OmronDeviceDriver(DeviceConfig(**_CONFIG))
+    driver._now_func = lambda: dt.datetime(2026, 3, 3)
+    return driver
+
+
+def test_unchanged_index_block_skips_slot_probes():
+    device = _Device()
+    driver = _driver()
+    first = device.poll(driver)
+    assert set(first) == {1, 2}
+    assert len(device.reads) == 3
+
+    second = device.poll(driver)
+    assert device.reads == [0x0260]
+    assert second == first
+
+
+def test_moved_cursor_probes_again():
+    device = _Device()
+    driver = _driver()
+    device.poll(driver)
+
+    device.index[0:2] = b"\x00\x04"
+    device.minute = 20
+    result = device.poll(driver)
+    assert len(device.reads) == 3
+    assert result[1]["datetime"].minute == 20
+
+
+def test_changed_unread_counter_probes_again():
+    device = _Device()
+    driver = _driver()
+    device.poll(driver)
+
+    device.index[4:6] = b"\x00\x00"  # vendor app read user 1's records
+    device.poll(driver)
+    assert len(device.reads) == 3
@@ -0,0 +1,163 @@
+"""Pipelined EEPROM range reads (several 0x0801 reads in flight per range)."""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.omron.omron_ble import omron_driver
+from custom_components.omron.omron_ble.devices import (
+    DeviceConfig,
+    HostPairingMode,
+    UnlockMode,
+)
+from custom_components.omron.omron_ble.link_tuning import (
+    link_tuning_for,
+    reset_link_tuning,
+)
+from custom_components.omron.omron_ble.omron_driver import OmronDeviceSession
+
+_ADDRESS = "AA:BB:CC:DD:EE:FF"
+
+
+def _frame(packet_type: bytes, address: int, payload: bytes) -> bytearray:
+    frame = bytearray([len(payload) + 8])
+    frame += packet_type
+    frame += address.to_bytes(2, "big")
+    frame.append(len(payload))
+    frame += payload
+    frame.append(0x00)
+    crc = 0
+    for b in frame:
+        crc ^= b
+    frame.append(crc)
+    return frame
+
+
+def _eeprom_bytes(address: int, size: int) -> bytes:
+    return bytes((address + i) & 0xFF for i in range(size))
+
+
+class _FakeEeprom:
+    """Answers 0x0801 reads from a synthetic EEPROM via the session's RX handler."""
+
+    def __init__(self, session: OmronDeviceSession, drop_first: set[int] | None = None,
+                 error_at: int | None = None):
+        self.session = session
+        self.drop_first = set(drop_first or ())
+        self.error_at = error_at
+        self.requests: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def write_gatt_char(self, _uuid, data, response=True):
+        data = bytes(data)
+        if data[1:3] != b"\x01\x00":
+            return
+        address = int.from_bytes(data[3:5], "big")
+        size = data[5]
+        self.requests.append(address)
+        if address in self.drop_first:
+            self.drop_first.discard(address)
+            return
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        if address == self.error_at:
+            reply = _frame(b"\x8f\x00", 0x0000, b"\x05")
+            self.error_at = None
+        else:
+            reply = _frame(b"\x81\x00", address, _eeprom_bytes(address, size))
+        asyncio.get_running_loop().call_soon(self._deliver, reply)
+
+    def _deliver(self, reply: bytearray) -> None:
+        self.in_flight -= 1
+        self.session._on_notify_channel_data(0, reply)
+
+
+@pytest.fixture(autouse=True)
+def _fast_protocol(monkeypatch):
+    monkeypatch.setattr(omron_driver, "_MEMORY_PROTOCOL_REPLY_TIMEOUT_SEC", 0.05)
+    monkeypatch.setattr(omron_driver, "_MEMORY_PROTOCOL_RETRY_BACKOFF_SEC", 0.0)
+    reset_link_tuning()
+    yield
+    reset_link_tuning()
+
+
+def _session(**config_kwargs) -> tuple[OmronDeviceSession, MagicMock]:
+    ble_device = MagicMock()
+    ble_device.address = _ADDRESS
+    config = DeviceConfig(
+        model="HEM-7155T",
+        rx_channel_uuids=["49123040-aee8-11e1-a74d-0002a5d5c51b"],
+        tx_channel_uuids=["db5b55e0-aee7-11e1-965e-0002a5d5c51b"],
+        **config_kwargs,
+    )
+    session = OmronDeviceSession(ble_device, config)
+    client = MagicMock()
+    client.is_connected = True
+    session._client = client
+    return session, client
+
+
+def _attach(session: OmronDeviceSession, client: MagicMock, **kwargs) -> _FakeEeprom:
+    eeprom = _FakeEeprom(session, **kwargs)
+    client.write_gatt_char = eeprom.write_gatt_char
+    return eeprom
+
+
+def test_range_read_keeps_several_blocks_in_flight():
+    session, client = _session()
+    eeprom = _attach(session, client)
+
+    data = asyncio.run(session.read_memory_range(0x0098, 0x80, 0x10))
+
+    assert bytes(data) == _eeprom_bytes(0x0098, 0x80)
+    assert eeprom.requests == [0x0098 + i * 0x10 for i in range(8)]
+    assert eeprom.max_in_flight > 1
+    assert not session._pending_replies
+
+
+def test_lost_reply_retransmits_only_that_block():
+    session, client = _session()
+    eeprom = _attach(session, client, drop_first={0x00B8})
+
+    data = asyncio.run(session.read_memory_range(0x0098, 0x60, 0x10))
+
+    assert bytes(data) == _eeprom_bytes(0x0098, 0x60)
+    assert eeprom.requests.count(0x00B8) == 2
+    assert all(eeprom.requests.count(a) == 1 for a in eeprom.requests if a != 0x00B8)
+    assert not link_tuning_for(_ADDRESS).pipeline_demoted
+
+
+def test_error_frame_demotes_device_and_rereads_sequentially():
+    session, client = _session()
+    _attach(session, client, error_at=0x00A8)
+
+    data = asyncio.run(session.read_memory_range(0x0098, 0x40, 0x10))
+
+    assert bytes(data) == _eeprom_bytes(0x0098, 0x40)
+    assert link_tuning_for(_ADDRESS).pipeline_demoted
+    assert session.read_window == 1
+
+    # Later sessions for the same device stay at depth 1.
+    session2, client2 = _session()
+    eeprom2 = _attach(session2, client2)
+    asyncio.run(session2.read_memory_range(0x0098, 0x40, 0x10))
+    assert eeprom2.max_in_flight == 1
+
+
+def test_window_of_one_reads_sequentially():
+    session, client = _session(memory_read_window=1)
+    eeprom = _attach(session, client)
+
+    data = asyncio.run(session.read_memory_range(0x0098, 0x40, 0x10))
+
+    assert bytes(data) == _eeprom_bytes(0x0098, 0x40)
+    assert eeprom.max_in_flight == 1
+
+
+def test_secure_session_never_pipelines():
+    session, _client = _session(
+        unlock_mode=UnlockMode.SECURE_SESSION,
+        host_pairing_mode=HostPairingMode.OS_BONDING,
+    )
+    assert session.read_window == 1
@@ -0,0 +1,131 @@
+"""RX notify subscriptions held for the whole link, not per memory session,
+and the fused unlock + memory-session open that primes them only once."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.omron.omron_ble import omron_driver
+from custom_components.omron.omron_ble.devices import DeviceConfig
+from custom_components.omron.omron_ble.omron_driver import OmronDeviceSession
+
+
+@pytest.fixture
+def session(monkeypatch):
+    monkeypatch.setattr(omron_driver, "_NOTIFY_SUBSCRIBE_SETTLE_SEC", 0.0)
+    ble_device = MagicMock()
+    ble_device.address = "AA:BB:CC:DD:EE:24"
+    session = OmronDeviceSession(ble_device, DeviceConfig(model="HEM-7322T"))
+    client = MagicMock()
+    client.is_connected = True
+    session._client = client
+    session._ensure_services_cache = AsyncMock()
+    session._rebuild_notify_handle_index_map = MagicMock()
+    session._write_command_and_wait_reply = AsyncMock(
+        return_value=MagicMock(payload=b"\x00")
+    )
+    session.started = []
+    session.stopped = []
+    callbacks = {}
+
+    async def start_notify(uuid, callback):
+        session.started.append(uuid)
+        callbacks[uuid] = callback
+
+    async def write_char(uuid, data, response=None):
+        # Unlock characteristic: 0x01 unlock -> 0x81, 0x02 enter key
+        # programming -> 0x82, 0x00 new key -> 0x80.
+        callbacks[uuid](None, bytearray([data[0] | 0x80, 0x00]))
+
+    async def stop_notify(uuid):
+        session.stopped.append(uuid)
+
+    session._start_notify = start_notify
+    session._stop_notify = stop_notify
+    session._write_char = write_char
+    return session
+
+
+def test_second_memory_session_reuses_the_subscriptions(session):
+    rx = session.config.rx_channel_uuids
+
+    async def run():
+        for _ in range(2):
+            async with session.memory_session():
+                pass
+
+    asyncio.run(run())
+    assert session.started == list(rx)
+    assert session.stopped == []
+    assert session._notify_refs == 0
+
+
+def test_new_link_subscribes_again(session):
+    rx = session.config.rx_channel_uuids
+
+    async def run():
+        async with session.memory_session():
+            pass
+        session._link_epoch = next(omron_driver._LINK_EPOCHS)
+        async with session.memory_session():
+            pass
+
+    asyncio.run(run())
+    assert session.started == list(rx) * 2
+
+
+def test_aclose_tears_the_subscriptions_down(session):
+    rx = session.config.rx_channel_uuids
+
+    async def run():
+        async with session.memory_session():
+            pass
+        await session.aclose()
+
+    asyncio.run(run())
+    assert session.stopped == list(rx)
+    assert not session._notify_subscribed
+
+
+def test_pairing_keeps_channel_zero_of_held_subscriptions(session, monkeypatch):
+    monkeypatch.setattr(omron_driver, "_PAIRING_SETTLE_DEFAULT_SEC", 0.0)
+    rx = session.config.rx_channel_uuids
+    unlock = session.config.unlock_uuid
+
+    async def run():
+        await session._subscribe_notify_channels()
+        await session._pair_custom_key(bytearray(16))
+        async with session.memory_session():
+            pass
+
+    asyncio.run(run())
+    assert session.started == [*rx, unlock]
+    assert rx[0] not in session.stopped
+
+
+def test_fused_unlock_and_open_primes_rx_once(session, monkeypatch):
+    rx = session.config.rx_channel_uuids
+    unlock = session.config.unlock_uuid
+    settle = 0.001
+    monkeypatch.setattr(omron_driver, "_NOTIFY_SUBSCRIBE_SETTLE_SEC", settle)
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay, *args):
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+    async def run():
+        async with session.memory_session_after_unlock():
+            assert session.memory_session_active
+
+    asyncio.run(run())
+    assert session._unlocked
+    # RX channel 0 (standing in for the unlock's prime), then the unlock
+    # CCCD as in the official app, then the other RX channels; nothing on
+    # RX is stopped in between and only the unlock CCCD settles.
+    assert session.started == [rx[0], unlock, *rx[1:]]
+    assert session.stopped == [unlock]
+    assert sleeps.count(settle) == 1
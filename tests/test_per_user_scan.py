@@ -0,0 +1,94 @@
+"""Full-scan fallback of get_latest_records_per_user reads only the users it needs."""
+import asyncio
+import datetime as dt
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.omron.omron_ble.devices import DeviceConfig, Endianness
+from custom_components.omron.omron_ble.omron_driver import OmronDeviceDriver, OmronDeviceSession
+
+_BASES = (0x02AC, 0x05F4)
+_RECORD = 0x0E
+_REGION = 60 * _RECORD
+
+_CONFIG = dict(
+    model="HEM-7320T",
+    endianness=Endianness.BIG,
+    user_start_addresses=list(_BASES),
+    per_user_records_count=[60, 60],
+    record_byte_size=_RECORD,
+    settings_read_address=0x0260,
+    index_pointer_layout={
+        "index_region_byte_size": 0x08,
+        "endianness": "big",
+        "users": [
+            {"write_cursor_offset": 0x00, "write_cursor_mask": 0xFF, "slot_index_min": 0, "slot_index_max": 59, "slot_index_bias": -1},
+            {"write_cursor_offset": 0x02, "write_cursor_mask": 0xFF, "slot_index_min": 0, "slot_index_max": 59, "slot_index_bias": -1},
+        ],
+    },
+)
+
+
+def _record(minute: int) -> bytes:
+    """Classic 14-byte vital record, 2026-03-02 08:<minute>, 120/80 70 bpm."""
+    flags1 = 8 | (2 << 5) | (3 << 10)
+    flags2 = minute << 6
+    return (
+        bytes([120 - 25, 80, 70, 26])
+        + flags1.to_bytes(2, "little")
+        + flags2.to_bytes(2, "little")
+        + b"\x00" * 6
+    )
+
+
+def _run(image: bytearray, call):
+    driver = OmronDeviceDriver(DeviceConfig(**_CONFIG))
+    driver._now_func = lambda: dt.datetime(2026, 3, 3)
+    transport = OmronDeviceSession(MagicMock(), driver._config)
+    transport.unlock = AsyncMock()
+    reads: list[tuple[int, int]] = []
+
+    async def fake_read_memory_range(addr, size, block_size=None, checkpoint=None):
+        reads.append((addr, size))
+        return bytearray(image[addr:addr + size])
+
+    transport.read_memory_range = AsyncMock(side_effect=fake_read_memory_range)
+    return asyncio.run(call(driver, transport)), reads
+
+
+def _image() -> bytearray:
+    image = bytearray(b"\xff" * 0x1000)
+    image[0x0260:0x0264] = b"\x00\x01\x00\x02"  # user1 slot 0, user2 slot 1
+    image[_BASES[0]:_BASES[0] + _RECORD] = _record(10)
+    # User 2's cursor slot is garbage; an older record sits in slot 0.
+    image[_BASES[1]:_BASES[1] + _RECORD] = _record(5)
+    image[_BASES[1] + _RECORD:_BASES[1] + 2 * _RECORD] = b"\x01" * _RECORD
+    return image
+
+
+def test_fallback_scans_only_the_missing_user():
+    result, reads = _run(
+        _image(), lambda driver, transport: driver.get_latest_records_per_user(transport)
+    )
+
+    assert result[1]["datetime"].minute == 10
+    assert result[2]["datetime"].minute == 5
+    assert (_BASES[1], _REGION) in reads
+    assert (_BASES[0], _REGION) not in reads
+
+
+def test_fallback_user_marks_the_source_mixed():
+    async def call(driver, transport):
+        await driver.get_latest_records_per_user(transport)
+        return driver.last_record_source
+
+    source, _ = _run(_image(), call)
+    assert source == "mixed"
+
+
+def test_get_user_records_ignores_unknown_users():
+    result, reads = _run(
+        _image(), lambda driver, transport: driver.get_user_records(transport, [2, 7])
+    )
+    assert list(result) == [2]
+    # Index block (checkpoint validation) plus user 2's region only.
+    assert reads == [(0x0260, 0x08), (_BASES[1], _REGION)]
@@ -0,0 +1,116 @@
+"""Coalesced poll reads: range planning and the per-session prefetch buffer."""
+import asyncio
+import datetime as dt
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.omron.omron_ble.devices import DeviceConfig, Endianness
+from custom_components.omron.omron_ble.omron_driver import OmronDeviceDriver, OmronDeviceSession
+from custom_components.omron.omron_ble.read_plan import coalesce_ranges
+
+_INDEX = 0x0260
+
+_CONFIG = dict(
+    model="HEM-7320T",
+    endianness=Endianness.BIG,
+    user_start_addresses=[0x02AC],
+    per_user_records_count=[60],
+    record_byte_size=0x0E,
+    transmission_block_size=0x2C,
+    memory_read_window=1,
+    adaptive_block_size=False,
+    settings_read_address=_INDEX,
+    settings_write_address=0x0286,
+    settings_time_sync_bytes=[0x14, 0x1E],
+    index_pointer_layout={
+        "index_region_byte_size": 0x08,
+        "endianness": "big",
+        "users": [
+            {"write_cursor_offset": 0x00, "write_cursor_mask": 0xFF, "slot_index_min": 0, "slot_index_max": 59, "slot_index_bias": -1},
+        ],
+    },
+)
+
+
+class TestCoalesceRanges:
+    def test_nearby_ranges_within_one_block_merge(self):
+        assert coalesce_ranges([(0x0260, 8), (0x0274, 10)], 0x2C) == [(0x0260, 0x1E)]
+
+    def test_distant_ranges_stay_apart(self):
+        assert coalesce_ranges([(0x0260, 8), (0x0400, 14)], 0x2C) == [(0x0260, 8), (0x0400, 14)]
+
+    def test_overlapping_ranges_merge(self):
+        assert coalesce_ranges([(0x10, 0x10), (0x18, 0x10)], 0x08) == [(0x10, 0x18)]
+
+    def test_optional_range_kept_only_when_free(self):
+        assert coalesce_ranges([(0x0274, 10)], 0x2C, optional=[(0x0260, 8)]) == [(0x0260, 0x1E)]
+        assert coalesce_ranges([(0x0274, 10)], 0x2C, optional=[(0x0400, 8)]) == [(0x0274, 10)]
+
+
+def _session(image: bytearray):
+    config = DeviceConfig(**_CONFIG)
+    session = OmronDeviceSession(MagicMock(), config)
+    session.unlock = AsyncMock()
+    session._memory_session_active = True
+    blocks: list[tuple[int, int]] = []
+    writes: list[tuple[int, bytes]] = []
+
+    async def fake_read_block(address, size):
+        blocks.append((address, size))
+        return bytes(image[address:address + size])
+
+    async def fake_write_block(address, data):
+        writes.append((address, bytes(data)))
+        image[address:address + len(data)] = data
+
+    session.read_memory_block = AsyncMock(side_effect=fake_read_block)
+    session.write_memory_block = AsyncMock(side_effect=fake_write_block)
+    return config, session, blocks, writes
+
+
+def test_index_and_time_sync_window_cross_the_radio_once():
+    image = bytearray(b"\x00" * 0x1000)
+    image[_INDEX:_INDEX + 2] = b"\x80\x00"  # cleared cursor: no records
+    config, session, blocks, writes = _session(image)
+    driver = OmronDeviceDriver(config)
+    now = dt.datetime(2026, 3, 3, 8, 0).astimezone()
+    driver._now_func = lambda: now
+    image[0x0274:0x027E] = driver._build_eeprom_time_data(bytearray(10), now)
+
+    async def poll():
+        await driver.prefetch_poll_reads(session, time_sync=True)
+        assert await driver.sync_eeprom_time(session)
+        return await driver.get_latest_record(session)
+
+    assert asyncio.run(poll()) is None
+    assert writes == []
+    settings_reads = [block for block in blocks if block[0] < 0x02AC]
+    assert settings_reads == [(_INDEX, 0x1E)]
+
+
+def test_writes_keep_the_prefetched_bytes_current():
+    image = bytearray(b"\x00" * 0x1000)
+    _, session, blocks, _ = _session(image)
+
+    async def run():
+        await session.prefetch([(0x0260, 0x10)])
+        await session.write_memory_range(0x0264, bytearray(b"\xAA\xBB"))
+        return await session.read_memory_range(0x0260, 0x10)
+
+    data = asyncio.run(run())
+    assert bytes(data[4:6]) == b"\xAA\xBB"
+    assert blocks == [(0x0260, 0x10)]
+
+
+def test_closing_the_memory_session_drops_the_buffer():
+    image = bytearray(b"\x00" * 0x1000)
+    _, session, blocks, _ = _session(image)
+    session._write_command_and_wait_reply = AsyncMock(return_value=MagicMock(payload=b"\x00"))
+    session._unsubscribe_notify_channels = AsyncMock()
+
+    async def run():
+        await session.prefetch([(0x0260, 0x08)])
+        await session.close_memory_session()
+        await session.read_memory_range(0x0260, 0x08)
+
+    asyncio.run(run())
+    assert blocks == [(0x0260, 0x08), (0x0260, 0x08)]
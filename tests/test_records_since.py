@@ -0,0 +1,172 @@
+"""OmronDeviceDriver.get_records_since: new records between two write cursors."""
+import asyncio
+import datetime as dt
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.omron.omron_ble.devices import DeviceConfig, Endianness
+from custom_components.omron.omron_ble.omron_driver import (
+    OmronDeviceDriver,
+    OmronDeviceSession,
+)
+
+_BASE = 0x0300
+_RECORD = 0x0E
+_SLOTS = 10
+
+
+def _config(**overrides) -> DeviceConfig:
+    kwargs = dict(
+        model="HEM-7131U",
+        endianness=Endianness.BIG,
+        user_start_addresses=[_BASE],
+        per_user_records_count=[_SLOTS],
+        record_byte_size=_RECORD,
+        settings_read_address=0x0260,
+        index_pointer_layout={
+            "index_region_byte_size": 0x04,
+            "endianness": "big",
+            "users": [
+                {"write_cursor_offset": 0x00, "slot_index_min": 0, "slot_index_max": _SLOTS - 1},
+            ],
+        },
+    )
+    kwargs.update(overrides)
+    return DeviceConfig(**kwargs)
+
+
+def _record(minute: int) -> bytes:
+    """Classic 14-byte vital record, 2026-03-02 08:<minute>, 120/80 70 bpm."""
+    flags1 = 8 | (2 << 5) | (3 << 10)
+    flags2 = minute << 6
+    return bytes([120 - 25, 80, 70, 26]) + flags1.to_bytes(2, "little") + flags2.to_bytes(
+        2, "little"
+    ) + b"\x00" * (_RECORD - 8)
+
+
+class _Device:
+    def __init__(self):
+        self.image = bytearray(b"\xff" * 0x1000)
+        self.reads: list[tuple[int, int]] = []
+
+    def write(self, slot: int, minute: int, cursor: int) -> None:
+        self.image[_BASE + slot * _RECORD:_BASE + (slot + 1) * _RECORD] = _record(minute)
+        self.image[0x0260:0x0262] = cursor.to_bytes(2, "big")
+
+    def since(self, driver, state):
+        transport = OmronDeviceSession(MagicMock(), driver._config)
+        transport.unlock = AsyncMock()
+
+        async def fake_read_memory_range(addr, size, block_size=None, checkpoint=None):
+            self.reads.append((addr, size))
+            return bytearray(self.image[addr:addr + size])
+
+        transport.read_memory_range = AsyncMock(side_effect=fake_read_memory_range)
+        self.reads.clear()
+        return asyncio.run(driver.get_records_since(transport, state))
+
+
+def _driver() -> OmronDeviceDriver:
+    driver = OmronDeviceDriver(_config())
+    driver._now_func = lambda: dt.datetime(2026, 3, 3)
+    return driver
+
+
+def test_baseline_returns_no_records():
+    device = _Device()
+    device.write(0, 1, cursor=1)
+    records, state = device.since(_driver(), None)
+    assert records == []
+    assert state == ((1, _record(1).hex()),)
+
+
+def test_returns_every_record_since_last_cursor_oldest_first():
+    device = _Device()
+    driver = _driver()
+    device.write(0, 1, cursor=1)
+    _, state = device.since(driver, None)
+
+    for slot, minute in ((1, 10), (2, 20), (3, 30)):
+        device.write(slot, minute, cursor=slot + 1)
+    records, state = device.since(driver, state)
+
+    assert [r["datetime"].minute for r in records] == [10, 20, 30]
+    assert all(r["user"] == 1 for r in records)
+    assert state == ((4, _record(30).hex()),)
+    # The previously newest slot is read along with the new ones.
+    assert device.reads[1:] == [(_BASE, 4 * _RECORD)]
+
+
+def test_ring_wrap_reads_tail_then_head():
+    device = _Device()
+    driver = _driver()
+    device.write(8, 1, cursor=9)
+    _, state = device.since(driver, None)
+
+    device.write(9, 2, cursor=10)
+    device.write(0, 3, cursor=1)
+    records, state = device.since(driver, state)
+
+    assert [r["datetime"].minute for r in records] == [2, 3]
+    assert device.reads[1:] == [(_BASE + 8 * _RECORD, 2 * _RECORD), (_BASE, _RECORD)]
+
+
+def test_unchanged_cursor_reads_index_only():
+    device = _Device()
+    driver = _driver()
+    device.write(0, 1, cursor=1)
+    records, state = device.since(driver, ((1, _record(1).hex()),))
+    assert records == []
+    assert device.reads == [(0x0260, 0x04)]
+
+
+def test_memory_clear_since_last_poll_reads_whole_ring():
+    device = _Device()
+    driver = _driver()
+    device.image[_BASE:_BASE + _SLOTS * _RECORD] = b"\xff" * (_SLOTS * _RECORD)
+    device.write(0, 5, cursor=1)
+    records, _ = device.since(driver, ((0x8000, None),))
+    assert [r["datetime"].minute for r in records] == [5]
+    assert sum(size for addr, size in device.reads[1:]) == _SLOTS * _RECORD
+
+
+def test_clear_then_new_readings_reads_whole_ring():
+    device = _Device()
+    driver = _driver()
+    for slot, minute in ((0, 1), (1, 2), (2, 3)):
+        device.write(slot, minute, cursor=slot + 1)
+    _, state = device.since(driver, None)
+
+    # Cleared, then five readings: the cursor moves 3 -> 5 like an ordinary
+    # delta, but slots 0..4 now hold new records and slot 2 no longer
+    # matches the one synced last time.
+    device.image[_BASE:_BASE + _SLOTS * _RECORD] = b"\xff" * (_SLOTS * _RECORD)
+    for slot, minute in enumerate((40, 41, 42, 43, 44)):
+        device.write(slot, minute, cursor=slot + 1)
+    records, state = device.since(driver, state)
+
+    assert [r["datetime"].minute for r in records] == [40, 41, 42, 43, 44]
+    assert state == ((5, _record(44).hex()),)
+
+
+def test_ring_overrun_reads_whole_ring():
+    device = _Device()
+    driver = _driver()
+    device.write(0, 1, cursor=1)
+    _, state = device.since(driver, None)
+
+    # A lap and two more: looks like a two-slot delta.
+    for n in range(_SLOTS + 2):
+        slot = (n + 1) % _SLOTS
+        device.write(slot, 10 + n, cursor=slot + 1)
+    records, _ = device.since(driver, state)
+
+    assert len(records) == _SLOTS
+    assert sum(size for addr, size in device.reads[-2:]) == _SLOTS * _RECORD
+
+
+def test_profile_without_index_layout_is_rejected():
+    driver = OmronDeviceDriver(_config(index_pointer_layout=None))
+    with pytest.raises(ValueError):
+        _Device().since(driver, None)
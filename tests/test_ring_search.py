@@ -0,0 +1,90 @@
+"""Binary search for the newest slot when no index pointer layout is available."""
+import asyncio
+import datetime as dt
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.omron.omron_ble.devices import DeviceConfig, Endianness
+from custom_components.omron.omron_ble.omron_driver import OmronDeviceDriver, OmronDeviceSession
+
+_BASE = 0x0300
+_RECORD = 0x0E
+_SLOTS = 100
+
+
+def _record(minute: int) -> bytes:
+    """Classic 14-byte vital record on 2026-03-02, <minute> minutes after 08:00."""
+    hour, minute = 8 + minute // 60, minute % 60
+    flags1 = hour | (2 << 5) | (3 << 10)
+    flags2 = minute << 6
+    return (
+        bytes([120 - 25, 80, 70, 26])
+        + flags1.to_bytes(2, "little")
+        + flags2.to_bytes(2, "little")
+        + b"\x00" * 6
+    )
+
+
+class _Device:
+    def __init__(self, minutes_by_slot: dict[int, int]):
+        self.image = bytearray(b"\xff" * 0x1000)
+        for slot, minute in minutes_by_slot.items():
+            self.image[_BASE + slot * _RECORD:_BASE + (slot + 1) * _RECORD] = _record(minute)
+        self.reads: list[int] = []
+
+    def latest(self) -> dict | None:
+        config = DeviceConfig(
+            model="HEM-7131U",
+            endianness=Endianness.BIG,
+            user_start_addresses=[_BASE],
+            per_user_records_count=[_SLOTS],
+            record_byte_size=_RECORD,
+        )
+        driver = OmronDeviceDriver(config)
+        driver._now_func = lambda: dt.datetime(2026, 3, 3)
+        transport = OmronDeviceSession(MagicMock(), config)
+        transport.unlock = AsyncMock()
+
+        async def fake_read_memory_range(addr, size, block_size=None, checkpoint=None):
+            self.reads.append((addr, size))
+            return bytearray(self.image[addr:addr + size])
+
+        transport.read_memory_range = AsyncMock(side_effect=fake_read_memory_range)
+        return asyncio.run(driver.get_latest_record(transport))
+
+
+def test_wrapped_ring_finds_newest_in_log_reads():
+    # Slots 0..36 hold the newest records, 37..99 the older ones they wrapped over.
+    minutes = {slot: 200 + slot for slot in range(37)}
+    minutes.update({slot: slot for slot in range(37, _SLOTS)})
+    device = _Device(minutes)
+
+    record = device.latest()
+
+    assert record["datetime"] == dt.datetime(2026, 3, 2, 11, 56)
+    assert len(device.reads) <= 10
+    assert all(size == _RECORD for _, size in device.reads)
+
+
+def test_partially_filled_ring_stops_before_empty_slots():
+    device = _Device({slot: slot for slot in range(12)})
+    record = device.latest()
+    assert record["datetime"] == dt.datetime(2026, 3, 2, 8, 11)
+    assert len(device.reads) <= 10
+
+
+def test_empty_ring_returns_none_without_full_scan():
+    device = _Device({})
+    assert device.latest() is None
+    assert device.reads == [(_BASE, _RECORD)]
+
+
+def test_corrupt_slot_at_the_boundary_falls_back_to_full_scan():
+    minutes = {slot: slot for slot in range(_SLOTS)}
+    device = _Device(minutes)
+    # A non-empty slot that does not parse stops the search before slot 50.
+    device.image[_BASE + 50 * _RECORD:_BASE + 51 * _RECORD] = b"\x01" * _RECORD
+
+    record = device.latest()
+
+    assert (_BASE, _SLOTS * _RECORD) in device.reads
+    assert record["datetime"] == dt.datetime(2026, 3, 2, 9, 39)
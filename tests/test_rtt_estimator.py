@@ -0,0 +1,72 @@
+"""RttEstimator (SRTT/RTTVAR) retransmit timeout unit tests."""
+import asyncio
+from unittest.mock import MagicMock
+
+from custom_components.omron.omron_ble import omron_driver
+from custom_components.omron.omron_ble.devices import DeviceConfig
+from custom_components.omron.omron_ble.link_tuning import (
+    RttEstimator,
+    link_tuning_for,
+    reset_link_tuning,
+)
+from custom_components.omron.omron_ble.omron_driver import OmronDeviceSession
+
+
+class TestRttEstimator:
+    def test_initial_timeout_used_until_first_sample(self):
+        assert RttEstimator().timeout(5.0, 0.3, 5.0) == 5.0
+
+    def test_first_sample_sets_srtt_and_half_variance(self):
+        est = RttEstimator()
+        est.observe(0.1)
+        assert est.srtt == 0.1
+        assert est.rttvar == 0.05
+        # srtt + 4 * rttvar = 0.3
+        assert abs(est.timeout(5.0, 0.1, 5.0) - 0.3) < 1e-9
+
+    def test_stable_link_converges_to_floor(self):
+        est = RttEstimator()
+        for _ in range(50):
+            est.observe(0.06)
+        assert est.timeout(5.0, 0.3, 5.0) == 0.3
+
+    def test_retries_double_and_clamp_to_ceiling(self):
+        est = RttEstimator()
+        est.observe(0.2)
+        first = est.timeout(5.0, 0.3, 5.0)
+        assert est.timeout(5.0, 0.3, 5.0, attempt=1) == 2 * first
+        assert est.timeout(5.0, 0.3, 5.0, attempt=10) == 5.0
+
+
+def test_reply_samples_feed_device_estimate():
+    reset_link_tuning()
+    ble_device = MagicMock()
+    ble_device.address = "AA:BB:CC:DD:EE:02"
+    session = OmronDeviceSession(
+        ble_device,
+        DeviceConfig(
+            model="HEM-7155T",
+            rx_channel_uuids=["49123040-aee8-11e1-a74d-0002a5d5c51b"],
+            tx_channel_uuids=["db5b55e0-aee7-11e1-965e-0002a5d5c51b"],
+        ),
+    )
+
+    async def write_gatt_char(_uuid, data, response=True):
+        frame = bytearray([0x0C, 0x81, 0x00]) + bytes(data[3:5]) + bytes([4, 1, 2, 3, 4, 0])
+        crc = 0
+        for b in frame:
+            crc ^= b
+        frame.append(crc)
+        asyncio.get_running_loop().call_soon(session._on_notify_channel_data, 0, frame)
+
+    client = MagicMock()
+    client.is_connected = True
+    client.write_gatt_char = write_gatt_char
+    session._client = client
+
+    asyncio.run(session.read_memory_block(0x0098, 4))
+
+    rtt = link_tuning_for(ble_device.address).rtt
+    assert rtt.samples == 1
+    assert session._reply_timeout() < omron_driver._MEMORY_PROTOCOL_REPLY_TIMEOUT_SEC
+    reset_link_tuning()
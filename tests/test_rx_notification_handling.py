@@ -1,7 +1,9 @@
 """OmronDeviceSession notification reassembly and frame validation unit tests."""
+import asyncio
 from unittest.mock import MagicMock
 
 from custom_components.omron.omron_ble.devices import DeviceConfig
+from custom_components.omron.omron_ble.link_tuning import link_tuning_for, reset_link_tuning
 from custom_components.omron.omron_ble.omron_driver import OmronDeviceSession
 
 
@@ -27,6 +29,18 @@ def _build_valid_frame(
     return frame
 
 
+def _deliver(session, key, *notifications):
+    """Register a reply future for ``key``, feed ``(char, frame)`` notifications, return it."""
+
+    async def _run():
+        future = session._expect_reply(key)
+        for char, frame in notifications:
+            session._on_notify_channel_data(char, frame)
+        return future
+
+    return asyncio.run(_run())
+
+
 class TestRxNotificationHandling:
     def setup_method(self):
         self.config = DeviceConfig(
@@ -36,92 +50,119 @@ class TestRxNotificationHandling:
         )
         self.session = OmronDeviceSession(MagicMock(), self.config)
 
-    def test_valid_frame_sets_reply_ready_and_payload(self):
+    def test_valid_frame_completes_request_with_payload(self):
         valid_frame = _build_valid_frame(b"\x81\x00", 0x0098, b"\x01\x02\x03\x04")
-        self.session._expected_reply_packet_type = b"\x81\x00"
-        self.session._on_notify_channel_data(0, valid_frame)
+        future = _deliver(self.session, (b"\x81\x00", 0x0098), (0, valid_frame))
 
-        assert self.session._reply_ready.is_set()
-        assert self.session._last_reply_packet_type == b"\x81\x00"
-        assert self.session._last_reply_payload == b"\x01\x02\x03\x04"
+        assert future.done()
+        assert future.result().packet_type == b"\x81\x00"
+        assert future.result().address == 0x0098
+        assert future.result().payload == b"\x01\x02\x03\x04"
 
     def test_session_open_8000_frame_accepted(self):
         # Real-device open_memory_session response: 0880000000100098 (8 bytes, byte[5]=0x10)
         # Must not be rejected as a truncated frame.
         raw = bytearray.fromhex("0880000000100098")
-        self.session._expected_reply_packet_type = b"\x80\x00"
-        self.session._on_notify_channel_data(0, raw)
+        future = _deliver(self.session, (b"\x80\x00", None), (0, raw))
 
-        assert self.session._reply_ready.is_set()
-        assert self.session._last_reply_packet_type == b"\x80\x00"
-        assert self.session._last_reply_payload == b"\x00"
+        assert future.done()
+        assert future.result().packet_type == b"\x80\x00"
+        assert future.result().payload == b"\x00"
 
     def test_session_close_8f00_frame_accepted_with_nonzero_byte5(self):
         # Control frame 8f00 with non-zero byte[5] and response code 0
         raw = bytearray([0x08, 0x8F, 0x00, 0x00, 0x00, 0x10, 0x00])
         raw.append(_calc_crc(raw))
-        self.session._expected_reply_packet_type = b"\x8f\x00"
-        self.session._on_notify_channel_data(0, raw)
+        future = _deliver(self.session, (b"\x8f\x00", None), (0, raw))
 
-        assert self.session._reply_ready.is_set()
-        assert self.session._last_reply_packet_type == b"\x8f\x00"
-        assert self.session._last_reply_payload == b"\x00"
+        assert future.done()
+        assert future.result().packet_type == b"\x8f\x00"
+        assert future.result().payload == b"\x00"
 
     def test_memory_write_81c0_frame_accepted_with_nonzero_byte5(self):
         # Control frame 81c0 (write response) with non-zero byte[5] and response code 0
         raw = bytearray([0x08, 0x81, 0xC0, 0x00, 0x00, 0x0A, 0x00])
         raw.append(_calc_crc(raw))
-        self.session._expected_reply_packet_type = b"\x81\xC0"
-        self.session._on_notify_channel_data(0, raw)
+        future = _deliver(self.session, (b"\x81\xc0", 0x0000), (0, raw))
 
-        assert self.session._reply_ready.is_set()
-        assert self.session._last_reply_packet_type == b"\x81\xC0"
-        assert self.session._last_reply_payload == b"\x00"
+        assert future.done()
+        assert future.result().packet_type == b"\x81\xc0"
+        assert future.result().payload == b"\x00"
 
     def test_single_channel_declared_length_truncation_is_ignored(self):
         # Single channel frame declares 16 bytes, but only 8 bytes received
         short_frame = bytearray([16, 0x81, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00])
-        self.session._on_notify_channel_data(0, short_frame)
+        future = _deliver(self.session, (b"\x81\x00", 0x0000), (0, short_frame))
 
-        assert not self.session._reply_ready.is_set()
-        assert self.session._last_reply_payload is None
+        assert not future.done()
 
     def test_undersized_frame_is_ignored(self):
         short_frame = bytearray([0x04, 0x81, 0x00, 0x05])
-        self.session._on_notify_channel_data(0, short_frame)
+        future = _deliver(self.session, (b"\x81\x00", 0x0000), (0, short_frame))
 
-        assert not self.session._reply_ready.is_set()
-        assert self.session._last_reply_payload is None
+        assert not future.done()
 
     def test_truncated_frame_is_ignored_without_synthetic_ff(self):
         # Frame claims 16 bytes payload, but only 4 bytes are actually present
         frame = bytearray([24, 0x81, 0x00, 0x00, 0x98, 16, 0xAA, 0xBB, 0xCC, 0xDD, 0x00])
         frame.append(_calc_crc(frame))
-        self.session._expected_reply_packet_type = b"\x81\x00"
-        self.session._on_notify_channel_data(0, frame)
+        future = _deliver(self.session, (b"\x81\x00", 0x0098), (0, frame))
 
-        # Must not set reply_ready and must not produce fake 0xFF bytes
-        assert not self.session._reply_ready.is_set()
-        assert self.session._last_reply_payload is None
+        # Must not complete the request and must not produce fake 0xFF bytes
+        assert not future.done()
 
     def test_unexpected_reply_packet_type_is_ignored(self):
         valid_frame = _build_valid_frame(b"\x80\x00", 0x0000, b"\x00" * 4)
         # Expected is read reply 8100, but incoming is late session open reply 8000
-        self.session._expected_reply_packet_type = b"\x81\x00"
-        self.session._on_notify_channel_data(0, valid_frame)
+        future = _deliver(self.session, (b"\x81\x00", 0x0098), (0, valid_frame))
+
+        assert not future.done()
+
+    def test_late_reply_for_other_address_is_ignored(self):
+        # Late 8100 for a read that already gave up must not complete the current one
+        late_frame = _build_valid_frame(b"\x81\x00", 0x0088, b"\xaa" * 4)
+        future = _deliver(self.session, (b"\x81\x00", 0x0098), (0, late_frame))
+
+        assert not future.done()
+
+    def test_replies_are_routed_by_address(self):
+        first = _build_valid_frame(b"\x81\x00", 0x0098, b"\x01" * 4)
+        second = _build_valid_frame(b"\x81\x00", 0x00A8, b"\x02" * 4)
+
+        async def _run():
+            f1 = self.session._expect_reply((b"\x81\x00", 0x0098))
+            f2 = self.session._expect_reply((b"\x81\x00", 0x00A8))
+            # Replies arrive in reverse order of the requests
+            self.session._on_notify_channel_data(0, second)
+            self.session._on_notify_channel_data(0, first)
+            return f1, f2
 
-        assert not self.session._reply_ready.is_set()
+        f1, f2 = asyncio.run(_run())
+        assert f1.result().payload == b"\x01" * 4
+        assert f2.result().payload == b"\x02" * 4
 
     def test_error_frame_8f00_is_always_accepted(self):
         # Device reports error frame 8f00 with error code 3 in payload/byte 6
         error_frame = _build_valid_frame(b"\x8f\x00", 0x0000, b"\x03")
         # Even when waiting for 8100, 8f00 error frame must be accepted so caller gets error code
-        self.session._expected_reply_packet_type = b"\x81\x00"
-        self.session._on_notify_channel_data(0, error_frame)
+        future = _deliver(self.session, (b"\x81\x00", 0x0098), (0, error_frame))
 
-        assert self.session._reply_ready.is_set()
-        assert self.session._last_reply_packet_type == b"\x8f\x00"
-        assert self.session._last_reply_payload == b"\x03"
+        assert future.done()
+        assert future.result().packet_type == b"\x8f\x00"
+        assert future.result().payload == b"\x03"
+
+    def test_error_frame_8f00_fails_only_oldest_request(self):
+        error_frame = _build_valid_frame(b"\x8f\x00", 0x0000, b"\x03")
+
+        async def _run():
+            oldest = self.session._expect_reply((b"\x81\x00", 0x0098))
+            newer = self.session._expect_reply((b"\x81\x00", 0x00A8))
+            self.session._on_notify_channel_data(0, error_frame)
+            return oldest, newer
+
+        oldest, newer = asyncio.run(_run())
+        assert oldest.result().packet_type == b"\x8f\x00"
+        assert not newer.done()
 
     def test_oversized_packet_size_is_rejected(self):
         multi_config = DeviceConfig(
@@ -132,15 +173,16 @@ class TestRxNotificationHandling:
                 "51220004-0000-1000-8000-00805f9b34fb",
                 "51220005-0000-1000-8000-00805f9b34fb",
             ],
-            tx_channel_uuids=["51220001-0000-1000-8000-00805f9b34fb"],
         )
         session = OmronDeviceSession(MagicMock(), multi_config)
         session._notify_handle_to_channel = {10: 0}
 
         # packet_size = 70 (exceeds 64 byte 4-channel max)
-        session._on_notify_channel_data(10, bytearray([70] + [0] * 15))
-        assert not session._reply_ready.is_set()
-        assert session._channel_fragments[0] is None
+        future = _deliver(
+            session, (b"\x81\x00", 0x0000), (10, bytearray([70] + [0] * 15))
+        )
+        assert not future.done()
+        assert session._rx_channel_lengths[0] == 0
 
     def test_channel_zero_clears_stale_fragments_on_multi_channel(self):
         multi_config = DeviceConfig(
@@ -151,20 +193,118 @@ class TestRxNotificationHandling:
                 "51220004-0000-1000-8000-00805f9b34fb",
                 "51220005-0000-1000-8000-00805f9b34fb",
             ],
-            tx_channel_uuids=["51220001-0000-1000-8000-00805f9b34fb"],
         )
         session = OmronDeviceSession(MagicMock(), multi_config)
         session._notify_handle_to_channel = {10: 0, 11: 1, 12: 2, 13: 3}
 
         # Put a stale fragment on channel 1
-        session._channel_fragments[1] = bytearray(b"\xde\xad\xbe\xef" * 4)
+        session._rx_channel_lengths[1] = 16
+        session._rx_buffer[16:32] = b"\xde\xad\xbe\xef" * 4
 
         # Receiving new start on channel 0 resets fragments
-        session._on_notify_channel_data(10, bytearray([24, 0x81, 0x00, 0x00, 0x98, 16, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]))
+        future = _deliver(
+            session,
+            (b"\x81\x00", 0x0098),
+            (10, bytearray([24, 0x81, 0x00, 0x00, 0x98, 16, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])),
+        )
 
         # Channel 1 should have been cleared when channel 0 arrived
-        assert session._channel_fragments[1] is None
-        assert not session._reply_ready.is_set()
+        assert session._rx_channel_lengths[1] == 0
+        assert not future.done()
+
+    def test_multi_channel_frame_is_reassembled_in_the_session_buffer(self):
+        session = OmronDeviceSession(MagicMock(), DeviceConfig(model="HEM-7322T"))
+        session._notify_handle_to_channel = {10: 0, 11: 1, 12: 2, 13: 3}
+        rx_buffer = session._rx_buffer
+        payload = bytes(range(1, 21))
+        frame = _build_valid_frame(b"\x81\x00", 0x02AC, payload)
+
+        future = _deliver(
+            session,
+            (b"\x81\x00", 0x02AC),
+            (10, frame[:16]),
+            (11, frame[16:]),
+        )
+
+        assert future.result().payload == payload
+        assert session._rx_buffer is rx_buffer
+        assert session._rx_channel_lengths == [0, 0, 0, 0]
+
+    def test_fragment_ahead_of_channel_zero_is_kept_and_counted(self):
+        session = OmronDeviceSession(MagicMock(), DeviceConfig(model="HEM-7322T"))
+        session._ble_device = MagicMock(address="AA:BB:CC:DD:EE:18", details={"source": "proxy-a"})
+        session._notify_handle_to_channel = {10: 0, 11: 1, 12: 2, 13: 3}
+        payload = bytes(range(1, 21))
+        frame = _build_valid_frame(b"\x81\x00", 0x02AC, payload)
+
+        future = _deliver(
+            session,
+            (b"\x81\x00", 0x02AC),
+            (11, frame[16:]),
+            (10, frame[:16]),
+        )
+
+        assert future.result().payload == payload
+        tuning = link_tuning_for("AA:BB:CC:DD:EE:18")
+        assert tuning.rx_reordered_frames == {"proxy-a": 1}
+        reset_link_tuning("AA:BB:CC:DD:EE:18")
+
+    def test_fragment_older_than_the_reorder_window_is_discarded(self):
+        session = OmronDeviceSession(MagicMock(), DeviceConfig(model="HEM-7322T"))
+        session._notify_handle_to_channel = {10: 0, 11: 1, 12: 2, 13: 3}
+        frame = _build_valid_frame(b"\x81\x00", 0x02AC, bytes(range(1, 21)))
+
+        async def _run():
+            future = session._expect_reply((b"\x81\x00", 0x02AC))
+            session._on_notify_channel_data(11, frame[16:])
+            session._rx_early_at[1] -= 1.0
+            session._on_notify_channel_data(10, frame[:16])
+            return future
+
+        future = asyncio.run(_run())
+        assert not future.done()
+        assert session._rx_channel_lengths[1] == 0
+
+    def test_stale_early_fragment_does_not_cost_the_next_frame(self):
+        session = OmronDeviceSession(MagicMock(), DeviceConfig(model="HEM-7322T"))
+        session._notify_handle_to_channel = {10: 0, 11: 1, 12: 2, 13: 3}
+        lost = _build_valid_frame(b"\x81\x00", 0x02AC, bytes(range(1, 21)))
+        frame = _build_valid_frame(b"\x81\x00", 0x02C0, bytes(range(40, 60)))
+
+        async def _run():
+            stale = session._expect_reply((b"\x81\x00", 0x02AC))
+            future = session._expect_reply((b"\x81\x00", 0x02C0))
+            # The lost frame's channel 0 never arrives; its channel 1 is
+            # adopted by the next frame's channel 0, fails the check and is
+            # dropped so the frame's own channel 1 completes it.
+            session._on_notify_channel_data(11, lost[16:])
+            session._on_notify_channel_data(10, frame[:16])
+            assert not future.done()
+            session._on_notify_channel_data(11, frame[16:])
+            return stale, future
+
+        stale, future = asyncio.run(_run())
+        assert future.result().payload == bytes(range(40, 60))
+        assert not stale.done()
+        assert session._rx_channel_lengths == [0, 0, 0, 0]
+
+    def test_fragment_overtaking_channel_zero_of_the_next_frame_is_kept(self):
+        session = OmronDeviceSession(MagicMock(), DeviceConfig(model="HEM-7322T"))
+        session._notify_handle_to_channel = {10: 0, 11: 1, 12: 2, 13: 3}
+        incomplete = _build_valid_frame(b"\x81\x00", 0x02AC, bytes(range(1, 21)))
+        frame = _build_valid_frame(b"\x81\x00", 0x02C0, bytes(range(40, 60)))
+
+        # The open frame's channel 1 is lost; the next frame's channel 1
+        # overtakes its channel 0 and still completes it.
+        future = _deliver(
+            session,
+            (b"\x81\x00", 0x02C0),
+            (10, incomplete[:16]),
+            (11, frame[16:]),
+            (10, frame[:16]),
+        )
+
+        assert future.result().payload == bytes(range(40, 60))
 
     def test_write_command_raises_connection_error_on_8f00_device_rejection(self):
         import asyncio
@@ -0,0 +1,120 @@
+"""Targeted slot reads from advertised per-user sequence numbers."""
+import asyncio
+import datetime as dt
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.omron.omron_ble.devices import DeviceConfig, Endianness
+from custom_components.omron.omron_ble.omron_driver import OmronDeviceDriver, OmronDeviceSession
+
+_BASES = (0x02AC, 0x05F4)
+_RECORD = 0x0E
+_INDEX = 0x0260
+
+_CONFIG = dict(
+    model="HEM-7320T",
+    endianness=Endianness.BIG,
+    user_start_addresses=list(_BASES),
+    per_user_records_count=[60, 60],
+    record_byte_size=_RECORD,
+    settings_read_address=_INDEX,
+    index_pointer_layout={
+        "index_region_byte_size": 0x08,
+        "endianness": "big",
+        "users": [
+            {"write_cursor_offset": 0x00, "write_cursor_mask": 0xFF, "slot_index_min": 0, "slot_index_max": 59, "slot_index_bias": -1},
+            {"write_cursor_offset": 0x02, "write_cursor_mask": 0xFF, "slot_index_min": 0, "slot_index_max": 59, "slot_index_bias": -1},
+        ],
+    },
+)
+
+
+def _record(minute: int) -> bytes:
+    """Classic 14-byte vital record, 2026-03-02 08:<minute>, 120/80 70 bpm."""
+    flags1 = 8 | (2 << 5) | (3 << 10)
+    flags2 = minute << 6
+    return (
+        bytes([120 - 25, 80, 70, 26])
+        + flags1.to_bytes(2, "little")
+        + flags2.to_bytes(2, "little")
+        + b"\x00" * 6
+    )
+
+
+class _Device:
+    def __init__(self):
+        self.image = bytearray(b"\xff" * 0x1000)
+        self.image[_INDEX:_INDEX + 8] = b"\x00" * 8
+        self.reads: list[int] = []
+
+    def measure(self, user_idx: int, slot: int, minute: int) -> None:
+        addr = _BASES[user_idx] + slot * _RECORD
+        self.image[addr:addr + _RECORD] = _record(minute)
+        offset = _INDEX + user_idx * 2
+        self.image[offset:offset + 2] = (slot + 1).to_bytes(2, "big")
+
+    def poll(self, driver: OmronDeviceDriver, sequence_numbers) -> dict:
+        transport = OmronDeviceSession(MagicMock(), driver._config)
+        transport.unlock = AsyncMock()
+
+        async def fake_read_memory_range(addr, size, block_size=None, checkpoint=None):
+            self.reads.append(addr)
+            return bytearray(self.image[addr:addr + size])
+
+        transport.read_memory_range = AsyncMock(side_effect=fake_read_memory_range)
+        self.reads.clear()
+        return asyncio.run(
+            driver.get_latest_records_per_user(transport, sequence_numbers=sequence_numbers)
+        )
+
+
+def _setup():
+    device = _Device()
+    device.measure(0, 4, minute=10)
+    device.measure(1, 2, minute=11)
+    driver = OmronDeviceDriver(DeviceConfig(**_CONFIG))
+    driver._now_func = lambda: dt.datetime(2026, 3, 3)
+    first = device.poll(driver, (5, 3))
+    assert _INDEX in device.reads
+    assert {user: r["datetime"].minute for user, r in first.items()} == {1: 10, 2: 11}
+    return device, driver
+
+
+def test_advertised_delta_reads_only_the_new_slot():
+    device, driver = _setup()
+    device.measure(0, 5, minute=20)
+
+    result = device.poll(driver, (6, 3))
+
+    assert device.reads == [_BASES[0] + 5 * _RECORD]
+    assert result[1]["datetime"].minute == 20
+    assert result[2]["datetime"].minute == 11
+
+
+def test_consecutive_deltas_follow_the_anchor():
+    device, driver = _setup()
+    device.measure(0, 5, minute=20)
+    device.poll(driver, (6, 3))
+    device.measure(1, 3, minute=30)
+    device.measure(1, 4, minute=31)
+
+    result = device.poll(driver, (6, 5))
+
+    assert device.reads == [_BASES[1] + 3 * _RECORD, _BASES[1] + 4 * _RECORD]
+    assert result[2]["datetime"].minute == 31
+
+
+def test_mismatching_slot_falls_back_to_the_index_block():
+    device, driver = _setup()
+    # Advert claims a new record but the expected slot is still empty.
+    result = device.poll(driver, (6, 3))
+
+    assert _INDEX in device.reads
+    assert result[1]["datetime"].minute == 10
+
+
+def test_without_sequence_numbers_the_index_path_is_used():
+    device, driver = _setup()
+    device.measure(0, 5, minute=20)
+    result = device.poll(driver, None)
+    assert device.reads[0] == _INDEX
+    assert result[1]["datetime"].minute == 20
@@ -0,0 +1,144 @@
+"""Resumable EEPROM transfers (TransferCheckpoint + OmronDeviceDriver.get_all_records)."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.omron.omron_ble import omron_driver
+from custom_components.omron.omron_ble.devices import DeviceConfig, Endianness
+from custom_components.omron.omron_ble.link_tuning import reset_link_tuning
+from custom_components.omron.omron_ble.omron_driver import (
+    OmronDeviceDriver,
+    OmronDeviceSession,
+)
+from custom_components.omron.omron_ble.transfer_checkpoint import TransferCheckpoint
+
+
+class TestTransferCheckpoint:
+    def test_missing_reports_gaps_between_spans(self):
+        cp = TransferCheckpoint()
+        cp.add(0x10, b"\x00" * 0x10)
+        cp.add(0x30, b"\x00" * 0x08)
+        assert cp.missing(0x00, 0x40) == [(0x00, 0x10), (0x20, 0x10), (0x38, 0x08)]
+        assert cp.missing(0x10, 0x10) == []
+
+    def test_assemble_stitches_spans_at_any_alignment(self):
+        cp = TransferCheckpoint()
+        cp.add(0x00, bytes(range(0x00, 0x0C)))
+        cp.add(0x0C, bytes(range(0x0C, 0x20)))
+        assert cp.assemble(0x04, 0x10) == bytearray(range(0x04, 0x14))
+
+    def test_validate_drops_spans_when_cursors_move(self):
+        cp = TransferCheckpoint()
+        cp.validate((3, 7), 1)
+        cp.add(0x00, b"\x01")
+        assert cp.validate((3, 7), 2) is True
+        assert cp.spans
+        assert cp.validate((4, 7), 3) is False
+        assert not cp.spans
+
+
+_CONFIG = dict(
+    model="HEM-7320T",
+    endianness=Endianness.BIG,
+    user_start_addresses=[0x02AC, 0x05F4],
+    per_user_records_count=[60, 60],
+    record_byte_size=0x0E,
+    transmission_block_size=0x38,
+    memory_read_window=1,
+    adaptive_block_size=False,
+    settings_read_address=0x0260,
+    index_pointer_layout={
+        "index_region_byte_size": 0x08,
+        "endianness": "big",
+        "users": [
+            {"write_cursor_offset": 0x00, "slot_index_min": 0, "slot_index_max": 59},
+            {"write_cursor_offset": 0x02, "slot_index_min": 0, "slot_index_max": 59},
+        ],
+    },
+)
+
+
+class _FakeDevice:
+    """EEPROM image answering 0x0801 reads; can drop the link after N reads."""
+
+    def __init__(self, index: bytes):
+        self.image = bytearray(b"\xff" * 0x1000)
+        self.image[0x0260:0x0268] = index
+        self.reads: list[int] = []
+        self.drop_after: int | None = None
+
+    def session(self) -> OmronDeviceSession:
+        ble_device = MagicMock()
+        ble_device.address = "AA:BB:CC:DD:EE:05"
+        session = OmronDeviceSession(ble_device, DeviceConfig(**_CONFIG))
+        session.unlock = AsyncMock()
+        client = MagicMock()
+        client.is_connected = True
+
+        async def write_gatt_char(_uuid, data, response=True):
+            data = bytes(data)
+            if self.drop_after is not None and len(self.reads) >= self.drop_after:
+                client.is_connected = False
+                return
+            address, size = int.from_bytes(data[3:5], "big"), data[5]
+            self.reads.append(address)
+            payload = bytes(self.image[address:address + size])
+            frame = bytearray([len(payload) + 8, 0x81, 0x00]) + data[3:5]
+            frame += bytes([size]) + payload + b"\x00"
+            crc = 0
+            for b in frame:
+                crc ^= b
+            frame.append(crc)
+
+            def _deliver():
+                for ch in range(0, len(frame), 16):
+                    session._on_notify_channel_data(ch // 16, frame[ch:ch + 16])
+
+            asyncio.get_running_loop().call_soon(_deliver)
+
+        client.write_gatt_char = write_gatt_char
+        session._client = client
+        session._notify_handle_to_channel = {0: 0, 1: 1, 2: 2, 3: 3}
+        return session
+
+
+@pytest.fixture(autouse=True)
+def _fast_protocol(monkeypatch):
+    monkeypatch.setattr(omron_driver, "_MEMORY_PROTOCOL_REPLY_TIMEOUT_SEC", 0.02)
+    monkeypatch.setattr(omron_driver, "_MEMORY_PROTOCOL_RETRY_BACKOFF_SEC", 0.0)
+    reset_link_tuning()
+    yield
+    reset_link_tuning()
+
+
+def test_interrupted_scan_resumes_with_missing_ranges_only():
+    device = _FakeDevice(index=bytes.fromhex("0005000300000000"))
+    driver = OmronDeviceDriver(DeviceConfig(**_CONFIG))
+
+    device.drop_after = 10
+    with pytest.raises(ConnectionError):
+        asyncio.run(driver.get_all_records(device.session()))
+    first_pass = list(device.reads)
+
+    device.reads.clear()
+    device.drop_after = None
+    asyncio.run(driver.get_all_records(device.session()))
+
+    # Index block is re-read to validate, then only blocks not read before.
+    assert device.reads[0] == 0x0260
+    assert not set(device.reads[1:]) & set(first_pass[1:])
+    assert len(first_pass) - 1 + len(device.reads) - 1 == 2 * ((60 * 0x0E + 0x37) // 0x38)
+
+
+def test_new_measurement_invalidates_checkpoint():
+    device = _FakeDevice(index=bytes.fromhex("0005000300000000"))
+    driver = OmronDeviceDriver(DeviceConfig(**_CONFIG))
+    asyncio.run(driver.get_all_records(device.session()))
+    full_scan = len(device.reads)
+
+    # User 1 took a measurement: write cursor advanced.
+    device.image[0x0260:0x0262] = b"\x00\x06"
+    device.reads.clear()
+    asyncio.run(driver.get_all_records(device.session()))
+    assert len(device.reads) == full_scan